@@ -25,11 +25,12 @@ import sys
 import os
 import secrets
 import string
-from motor.motor_asyncio import AsyncIOMotorClient
 from passlib.context import CryptContext
-import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
+from database import get_client
+from ids import new_id
+from auth_tokens import revoke_user_tokens
 
 # Charger les variables d'environnement
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
@@ -38,6 +39,8 @@ load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 DB_NAME = os.environ.get('DB_NAME', 'delices_algerie')
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Durée de vie des jetons d'accès (comme dans core.py)
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=int(os.environ.get('ACCESS_TOKEN_EXPIRE_MINUTES', 15)))
 
 
 def generate_password(length=16):
@@ -47,11 +50,18 @@ def generate_password(length=16):
 
 
 async def get_db():
-    """Obtient la connexion à la base de données"""
-    client = AsyncIOMotorClient(MONGO_URL)
+    """Obtient la connexion à la base de données (client partagé configuré dans database.py)"""
+    client = get_client(MONGO_URL)
     return client, client[DB_NAME]
 
 
+async def sign_out_everywhere(db, email: str):
+    """Déconnecte toutes les sessions de l'utilisateur (ses jetons portent son rôle)"""
+    user = await db.users.find_one({"email": email}, {"_id": 0, "id": 1})
+    if user:
+        await revoke_user_tokens(db, user["id"], ACCESS_TOKEN_LIFETIME)
+
+
 async def list_users():
     """Affiche tous les utilisateurs"""
     client, db = await get_db()
@@ -112,7 +122,7 @@ async def create_admin(email: str, full_name: str, password: str = None):
     hashed_password = pwd_context.hash(password)
     
     new_user = {
-        "id": str(uuid.uuid4()),
+        "id": new_id(),
         "email": email,
         "full_name": full_name,
         "role": "admin",
@@ -145,6 +155,7 @@ async def promote_to_admin(email: str):
     )
     
     if result.modified_count > 0:
+        await sign_out_everywhere(db, email)
         print(f"✅ {email} est maintenant administrateur!")
     else:
         print(f"❌ Utilisateur non trouvé ou déjà admin: {email}")
@@ -162,6 +173,7 @@ async def demote_to_user(email: str):
     )
     
     if result.modified_count > 0:
+        await sign_out_everywhere(db, email)
         print(f"✅ {email} est maintenant un utilisateur simple.")
     else:
         print(f"❌ Utilisateur non trouvé ou déjà utilisateur: {email}")
@@ -190,6 +202,7 @@ async def change_password(email: str, new_password: str = None):
         {"email": email},
         {"$set": {"hashed_password": hashed_password}}
     )
+    await sign_out_everywhere(db, email)
     
     print(f"\n✅ MOT DE PASSE MODIFIÉ!")
     print("=" * 70)
@@ -205,6 +218,7 @@ async def delete_user(email: str):
     """Supprime un utilisateur"""
     client, db = await get_db()
     
+    await sign_out_everywhere(db, email)
     result = await db.users.delete_one({"email": email})
     
     if result.deleted_count > 0:
@@ -231,6 +245,8 @@ async def toggle_active(email: str):
         {"email": email},
         {"$set": {"is_active": new_status}}
     )
+    if not new_status:
+        await sign_out_everywhere(db, email)
     
     status_text = "activé" if new_status else "désactivé"
     print(f"✅ Utilisateur {email} {status_text}.")
@@ -0,0 +1,247 @@
+"""
+Refresh tokens and access token revocation
+
+Access tokens are short-lived JWTs carrying the user id, email, name and
+role, so most requests are authenticated without reading ``users``. Two
+things can cut one short before it expires:
+
+- its ``jti`` in ``revoked_tokens`` (logout), checked against a per-worker
+  bloom filter: a miss, the usual case, needs no database read; a hit is
+  confirmed with a lookup since it may be a false positive
+- a per-user cutoff, also in ``revoked_tokens`` (``_id`` "user:<id>"):
+  tokens of that user issued before it are refused (password or role
+  change, deactivation, deletion). Cutoffs are few and held exactly.
+
+Each worker pulls new revocations every ``sync_seconds`` and rebuilds its
+filter every ``rebuild_seconds`` to drop the expired ones; the worker that
+revokes applies it at once. Entries expire with the tokens they cover
+(TTL index on expires_at).
+
+Refresh tokens are random strings stored as SHA-256 hashes in
+``refresh_tokens``. Each one is good for a single use and is swapped for a
+new one of the same family; presenting a used one again means it leaked,
+and the whole family is revoked.
+"""
+import math
+import time
+import uuid
+import asyncio
+import hashlib
+import logging
+import secrets
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Optional
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+USER_CUTOFF_PREFIX = "user:"
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Re-read a few seconds before the last sync so writes in flight at that moment are not missed
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class BloomFilter:
+    """Set membership with no false negatives and about ``error_rate`` false positives at ``capacity``"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationList:
+    """This worker's view of ``revoked_tokens``"""
+
+    def __init__(
+        self,
+        db,
+        sync_seconds: float = 10,
+        rebuild_seconds: float = 3600,
+        capacity: int = 100000,
+        error_rate: float = 0.01
+    ):
+        self.db = db
+        self.collection = db.revoked_tokens
+        self.sync_seconds = sync_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._cutoffs: Dict[str, datetime] = {}
+        self._synced_at: Optional[datetime] = None
+        self._next_sync = 0.0
+        self._next_rebuild = 0.0
+        self._lock = asyncio.Lock()
+
+    async def sync(self, force: bool = False) -> None:
+        """Pull revocations made since the last sync (every revocation on a rebuild)"""
+        if not force and time.monotonic() < self._next_sync:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if not force and now < self._next_sync:
+                return
+            rebuild = now >= self._next_rebuild
+            query = {} if rebuild or self._synced_at is None else {"revoked_at": {"$gt": self._synced_at - SYNC_OVERLAP}}
+            started = datetime.now(timezone.utc)
+            try:
+                entries = await self.collection.find(
+                    query, {"_id": 1, "revoked_at": 1, "expires_at": 1}
+                ).to_list(None)
+            except Exception as e:
+                # Keep the current view; retry on the next sync
+                logger.error(f"Error syncing revoked tokens: {str(e)}")
+                self._next_sync = now + self.sync_seconds
+                return
+
+            if rebuild:
+                jtis = [entry["_id"] for entry in entries if not entry["_id"].startswith(USER_CUTOFF_PREFIX)]
+                self._filter = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+                self._cutoffs = {}
+                self._next_rebuild = now + self.rebuild_seconds
+            for entry in entries:
+                self._apply(entry["_id"], entry["revoked_at"])
+            self._synced_at = started
+            self._next_sync = now + self.sync_seconds
+
+    def _apply(self, key: str, revoked_at: datetime) -> None:
+        if key.startswith(USER_CUTOFF_PREFIX):
+            user_id = key[len(USER_CUTOFF_PREFIX):]
+            if revoked_at.tzinfo is None:
+                revoked_at = revoked_at.replace(tzinfo=timezone.utc)
+            self._cutoffs[user_id] = max(revoked_at, self._cutoffs.get(user_id, revoked_at))
+        else:
+            self._filter.add(key)
+
+    async def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        await self.sync()
+        cutoff = self._cutoffs.get(claims.get("uid"))
+        # Compared in milliseconds, the precision of both iat (token_iat) and the stored cutoff;
+        # a token from the cutoff's own millisecond is refused, as it may predate the revocation
+        if cutoff is not None and round(claims.get("iat", 0) * 1000) <= timestamp_ms(cutoff):
+            return True
+        jti = claims.get("jti")
+        if jti is None or jti not in self._filter:
+            return False
+        return await self.collection.find_one({"_id": jti}, {"_id": 1}) is not None
+
+    async def revoke_token(self, jti: str, expires_at: datetime) -> None:
+        """Refuse this access token from now on"""
+        now = datetime.now(timezone.utc)
+        await self.collection.update_one(
+            {"_id": jti},
+            {"$set": {"revoked_at": now, "expires_at": expires_at}},
+            upsert=True
+        )
+        self._apply(jti, now)
+
+    async def revoke_user(self, user_id: str, access_token_lifetime: timedelta) -> None:
+        """Refuse every access token issued to this user so far"""
+        revoked_at = await revoke_user_tokens(self.db, user_id, access_token_lifetime)
+        self._apply(f"{USER_CUTOFF_PREFIX}{user_id}", revoked_at)
+
+
+async def revoke_user_tokens(db, user_id: str, access_token_lifetime: timedelta) -> datetime:
+    """
+    Sign a user out everywhere: delete their refresh tokens and set a cutoff
+    for the access tokens already out (usable without the API, e.g. by admin_tools)
+    """
+    now = datetime.now(timezone.utc)
+    # MongoDB keeps milliseconds: drop the rest so this worker holds the same cutoff as the others
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    await db.refresh_tokens.delete_many({"user_id": user_id})
+    await db.revoked_tokens.update_one(
+        {"_id": f"{USER_CUTOFF_PREFIX}{user_id}"},
+        {"$set": {"revoked_at": now, "expires_at": now + access_token_lifetime}},
+        upsert=True
+    )
+    # Tokens from the cutoff's millisecond are refused: make sure the caller's next ones are later
+    remaining = timestamp_ms(now) + 1 - timestamp_ms(datetime.now(timezone.utc))
+    if remaining > 0:
+        await asyncio.sleep(remaining / 1000)
+    return now
+
+
+def timestamp_ms(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // timedelta(milliseconds=1)
+
+
+def token_iat(now: datetime) -> float:
+    """iat claim in seconds with millisecond precision, so a cutoff can be told apart from a token of the same second"""
+    return timestamp_ms(now) / 1000
+
+
+def new_token_id() -> str:
+    return uuid.uuid4().hex
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def issue_refresh_token(collection, user_id: str, lifetime: timedelta, family_id: Optional[str] = None) -> str:
+    """A new refresh token for ``user_id``; only its hash is stored"""
+    token = secrets.token_urlsafe(32)
+    now = datetime.now(timezone.utc)
+    await collection.insert_one({
+        "_id": hash_refresh_token(token),
+        "user_id": user_id,
+        "family_id": family_id or new_token_id(),
+        "created_at": now,
+        "expires_at": now + lifetime,
+        "used_at": None,
+    })
+    return token
+
+
+async def use_refresh_token(collection, token: str) -> Optional[Dict[str, Any]]:
+    """
+    Spend a refresh token
+
+    Returns:
+        dict: The stored token (user_id, family_id), or None when it is
+        unknown, expired or already used; reuse revokes its whole family
+    """
+    token_hash = hash_refresh_token(token)
+    now = datetime.now(timezone.utc)
+    record = await collection.find_one_and_update(
+        {"_id": token_hash, "used_at": None, "expires_at": {"$gt": now}},
+        {"$set": {"used_at": now}},
+        return_document=ReturnDocument.AFTER
+    )
+    if record is not None:
+        return record
+
+    spent = await collection.find_one({"_id": token_hash}, {"family_id": 1, "user_id": 1, "used_at": 1})
+    if spent is not None and spent.get("used_at") is not None:
+        logger.warning(f"Refresh token reused for user {spent['user_id']}; revoking its family")
+        await collection.delete_many({"family_id": spent["family_id"]})
+    return None
+
+
+async def revoke_refresh_token(collection, token: str) -> None:
+    """Log one session out: drop the token's whole family"""
+    record = await collection.find_one({"_id": hash_refresh_token(token)}, {"family_id": 1})
+    if record is not None:
+        await collection.delete_many({"family_id": record["family_id"]})
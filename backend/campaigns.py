@@ -0,0 +1,289 @@
+"""
+Newsletter campaign delivery
+
+A queued campaign is processed by whichever process holds its lease (the
+scheduler leader, or newsletter_worker.py when NEWSLETTER_SEND_IN_API is
+false), so sending never runs inside a request:
+
+1. Recipients are materialised into ``campaign_deliveries`` (one document
+   per subscriber, status pending) from an indexed cursor over active
+   subscribers ordered by id, checkpointing the last id enqueued.
+2. The subject and body are rendered once per language from the
+   newsletter email template; only the unsubscribe link differs between
+   recipients.
+3. Pending deliveries are sent in batches over one reused SMTP connection,
+   throttled to NEWSLETTER_RATE_PER_MINUTE, and marked sent/failed with
+   one bulk write per batch.
+
+After a crash the lease expires and the next run resumes from the pending
+deliveries; only the batch that was in flight can be sent twice.
+"""
+import os
+import re
+import html
+import time
+import socket
+import asyncio
+import logging
+import secrets
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional
+
+from pymongo import UpdateOne, ReturnDocument
+
+from core import db
+from email_service import email_service, SMTPSession
+from email_templates import render_email, localized, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+
+logger = logging.getLogger(__name__)
+
+UNSUBSCRIBE_PLACEHOLDER = "{{unsubscribe_url}}"
+
+BATCH_SIZE = int(os.environ.get('NEWSLETTER_BATCH_SIZE', 50))
+RATE_PER_MINUTE = float(os.environ.get('NEWSLETTER_RATE_PER_MINUTE', 600))
+LEASE_SECONDS = 300
+ENQUEUE_BATCH_SIZE = 1000
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def unsubscribe_url(token: str) -> str:
+    base_url = os.environ.get('PUBLIC_BASE_URL', 'http://localhost:8000').rstrip('/')
+    return f"{base_url}/api/newsletter/unsubscribe?token={token}"
+
+
+def _html_to_text(body_html: str) -> str:
+    text = re.sub(r"<(br|/p|/div|/h[1-6]|/li)\s*/?>", "\n", body_html, flags=re.IGNORECASE)
+    text = re.sub(r"<[^>]+>", "", text)
+    return re.sub(r"\n{3,}", "\n\n", html.unescape(text)).strip()
+
+
+def render_campaign(campaign: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Subject, HTML and text per language, with the unsubscribe link left as a placeholder"""
+    rendered = {}
+    for language in SUPPORTED_LANGUAGES:
+        body_html = localized(campaign["body_html"], language)
+        email = render_email("newsletter", language, {
+            "subject": localized(campaign["subject"], language),
+            "body_html": body_html,
+            "body_text": localized(campaign.get("body_text"), language) or _html_to_text(body_html),
+            "unsubscribe_url": UNSUBSCRIBE_PLACEHOLDER,
+        })
+        rendered[language] = {"subject": email.subject, "html": email.html, "text": email.text}
+    return rendered
+
+
+async def enqueue_recipients(campaign: Dict[str, Any]) -> int:
+    """Create the pending deliveries, resuming after the last subscriber already enqueued"""
+    query = {"is_active": True}
+    if campaign.get("enqueued_through"):
+        query["id"] = {"$gt": campaign["enqueued_through"]}
+    cursor = db.newsletter_subscribers.find(
+        query,
+        {"_id": 0, "id": 1, "email": 1, "language": 1, "unsubscribe_token": 1},
+        batch_size=ENQUEUE_BATCH_SIZE
+    ).sort("id", 1)
+
+    enqueued = 0
+    deliveries: List[UpdateOne] = []
+    token_updates: List[UpdateOne] = []
+    last_id = None
+
+    async def flush():
+        nonlocal enqueued, deliveries, token_updates
+        if token_updates:
+            await db.newsletter_subscribers.bulk_write(token_updates, ordered=False)
+        result = await db.campaign_deliveries.bulk_write(deliveries, ordered=False)
+        enqueued += result.upserted_count
+        await db.newsletter_campaigns.update_one(
+            {"id": campaign["id"]},
+            {"$set": {"enqueued_through": last_id}, "$inc": {"total_recipients": result.upserted_count}}
+        )
+        deliveries, token_updates = [], []
+
+    async for subscriber in cursor:
+        token = subscriber.get("unsubscribe_token")
+        if not token:
+            # Subscribed before tokens existed
+            token = secrets.token_urlsafe(24)
+            token_updates.append(UpdateOne({"id": subscriber["id"]}, {"$set": {"unsubscribe_token": token}}))
+        language = subscriber.get("language") if subscriber.get("language") in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
+        deliveries.append(UpdateOne(
+            {"_id": f"{campaign['id']}:{subscriber['id']}"},
+            {"$setOnInsert": {
+                "campaign_id": campaign["id"],
+                "subscriber_id": subscriber["id"],
+                "email": subscriber["email"],
+                "language": language,
+                "unsubscribe_token": token,
+                "status": "pending",
+            }},
+            upsert=True
+        ))
+        last_id = subscriber["id"]
+        if len(deliveries) >= ENQUEUE_BATCH_SIZE:
+            await flush()
+    if deliveries:
+        await flush()
+
+    await db.newsletter_campaigns.update_one({"id": campaign["id"]}, {"$set": {"recipients_ready": True}})
+    return enqueued
+
+
+def _send_batch(session: SMTPSession, rendered: Dict[str, Dict[str, str]], batch: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """Runs in a worker thread; one error (or None) per delivery"""
+    results = []
+    for delivery in batch:
+        content = rendered[delivery["language"]]
+        link = unsubscribe_url(delivery["unsubscribe_token"])
+        msg = email_service.build_message(
+            delivery["email"],
+            content["subject"],
+            content["text"].replace(UNSUBSCRIBE_PLACEHOLDER, link),
+            content["html"].replace(UNSUBSCRIBE_PLACEHOLDER, html.escape(link)),
+            headers={"List-Unsubscribe": f"<{link}>", "List-Unsubscribe-Post": "List-Unsubscribe=One-Click"}
+        )
+        results.append(session.send(delivery["email"], msg))
+    return results
+
+
+async def _renew_lease(campaign_id: str, owner: str) -> Optional[Dict[str, Any]]:
+    """Extend our lease; None when the campaign was paused/cancelled or taken over"""
+    return await db.newsletter_campaigns.find_one_and_update(
+        {"id": campaign_id, "lease_owner": owner, "status": "sending"},
+        {"$set": {"lease_expires_at": datetime.now(timezone.utc) + timedelta(seconds=LEASE_SECONDS)}},
+        return_document=ReturnDocument.AFTER
+    )
+
+
+async def send_campaign(campaign: Dict[str, Any], owner: str = WORKER_ID) -> Dict[str, int]:
+    """Deliver a claimed campaign until it is done, paused or the lease is lost"""
+    campaign_id = campaign["id"]
+    if not campaign.get("recipients_ready"):
+        await enqueue_recipients(campaign)
+    rendered = await asyncio.to_thread(render_campaign, campaign)
+
+    # Deliveries claimed by a run that died mid-batch go back to pending
+    await db.campaign_deliveries.update_many(
+        {"campaign_id": campaign_id, "status": "sending"},
+        {"$set": {"status": "pending"}}
+    )
+
+    session = SMTPSession(email_service)
+    sent = failed = 0
+    min_seconds_per_message = 60.0 / RATE_PER_MINUTE if RATE_PER_MINUTE > 0 else 0
+    try:
+        while await _renew_lease(campaign_id, owner):
+            batch = await db.campaign_deliveries.find(
+                {"campaign_id": campaign_id, "status": "pending"}
+            ).sort("_id", 1).limit(BATCH_SIZE).to_list(BATCH_SIZE)
+            if not batch:
+                now = datetime.now(timezone.utc)
+                await db.newsletter_campaigns.update_one(
+                    {"id": campaign_id, "lease_owner": owner},
+                    {"$set": {"status": "completed", "completed_at": now, "lease_expires_at": None}}
+                )
+                logger.info(f"Campaign {campaign_id} completed: {sent} sent, {failed} failed in this run")
+                break
+
+            started = time.monotonic()
+            await db.campaign_deliveries.update_many(
+                {"_id": {"$in": [delivery["_id"] for delivery in batch]}},
+                {"$set": {"status": "sending"}}
+            )
+            errors = await asyncio.to_thread(_send_batch, session, rendered, batch)
+
+            now = datetime.now(timezone.utc)
+            updates = []
+            batch_sent = batch_failed = 0
+            for delivery, error in zip(batch, errors):
+                if error is None:
+                    batch_sent += 1
+                    updates.append(UpdateOne({"_id": delivery["_id"]}, {"$set": {"status": "sent", "sent_at": now}}))
+                else:
+                    batch_failed += 1
+                    updates.append(UpdateOne({"_id": delivery["_id"]}, {"$set": {"status": "failed", "error": error, "failed_at": now}}))
+            await db.campaign_deliveries.bulk_write(updates, ordered=False)
+            await db.newsletter_campaigns.update_one(
+                {"id": campaign_id},
+                {"$inc": {"sent_count": batch_sent, "failed_count": batch_failed}, "$set": {"updated_at": now}}
+            )
+            sent += batch_sent
+            failed += batch_failed
+
+            # Throttle to the configured rate
+            remaining = len(batch) * min_seconds_per_message - (time.monotonic() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+    except Exception as e:
+        logger.error(f"Error sending campaign {campaign_id}: {str(e)}")
+        # Keep the lease until it expires so the retry does not hammer a failing SMTP server
+        await db.newsletter_campaigns.update_one({"id": campaign_id}, {"$set": {"last_error": str(e)}})
+    finally:
+        await asyncio.to_thread(session.close)
+    return {"sent": sent, "failed": failed}
+
+
+async def claim_campaign(owner: str = WORKER_ID) -> Optional[Dict[str, Any]]:
+    """Take the lease on the oldest queued (or abandoned) campaign"""
+    now = datetime.now(timezone.utc)
+    campaign = await db.newsletter_campaigns.find_one_and_update(
+        {
+            "status": {"$in": ["queued", "sending"]},
+            "$or": [{"lease_expires_at": None}, {"lease_expires_at": {"$lt": now}}],
+        },
+        {"$set": {
+            "status": "sending",
+            "lease_owner": owner,
+            "lease_expires_at": now + timedelta(seconds=LEASE_SECONDS),
+            "last_error": None,
+        }},
+        sort=[("queued_at", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+    if campaign and campaign.get("started_at") is None:
+        await db.newsletter_campaigns.update_one({"id": campaign["id"]}, {"$set": {"started_at": now}})
+        campaign["started_at"] = now
+    return campaign
+
+
+async def process_campaigns(owner: str = WORKER_ID) -> Dict[str, int]:
+    """Send every campaign waiting for delivery; the scheduler job and newsletter_worker.py call this"""
+    totals = {"campaigns": 0, "sent": 0, "failed": 0}
+    while True:
+        campaign = await claim_campaign(owner)
+        if campaign is None:
+            return totals
+        result = await send_campaign(campaign, owner)
+        totals["campaigns"] += 1
+        totals["sent"] += result["sent"]
+        totals["failed"] += result["failed"]
+        refreshed = await db.newsletter_campaigns.find_one({"id": campaign["id"]}, {"_id": 0, "status": 1, "lease_owner": 1})
+        if refreshed and refreshed.get("status") == "sending" and refreshed.get("lease_owner") == owner:
+            # Stopped on an error: leave it for the next run
+            return totals
+
+
+def campaign_progress(campaign: Dict[str, Any]) -> Dict[str, Any]:
+    """Counters plus throughput and an ETA for the admin UI"""
+    total = campaign.get("total_recipients", 0)
+    done = campaign.get("sent_count", 0) + campaign.get("failed_count", 0) + campaign.get("skipped_count", 0)
+    progress = {
+        "total": total,
+        "sent": campaign.get("sent_count", 0),
+        "failed": campaign.get("failed_count", 0),
+        "skipped": campaign.get("skipped_count", 0),
+        "pending": max(total - done, 0),
+        "percent": round(done * 100 / total, 1) if total else 0.0,
+        "recipients_ready": campaign.get("recipients_ready", False),
+        "per_minute": None,
+        "eta_seconds": None,
+    }
+    started_at = campaign.get("started_at")
+    if started_at and done and campaign.get("status") == "sending":
+        started_at = started_at.replace(tzinfo=timezone.utc) if started_at.tzinfo is None else started_at
+        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+        if elapsed > 0:
+            progress["per_minute"] = round(done * 60 / elapsed, 1)
+            progress["eta_seconds"] = round(progress["pending"] * elapsed / done)
+    return progress
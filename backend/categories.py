@@ -0,0 +1,128 @@
+"""
+Category tree, product counts and slug resolution
+
+Products reference their category by slug. Categories nest through
+``parent_id``; the tree is assembled in memory from the flat list, which
+is small and cached in menu_cache.
+
+``product_count`` on each category is the number of products filed
+directly under it. Product writes keep it up to date with $inc
+(adjust_product_count) and recount_product_counts() corrects any drift
+once a day; tree nodes add up their subtree, so the shop sidebar gets
+every count from the one cached read.
+
+The slug -> category map used to validate product categories is cached
+the same way and dropped with invalidate_categories() on category writes.
+"""
+import logging
+from typing import Dict, Any, List, Optional
+
+from fastapi import HTTPException
+from pymongo import UpdateOne
+
+from core import db, menu_cache
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_categories() -> None:
+    menu_cache.invalidate("categories")
+    menu_cache.invalidate("category_slugs")
+
+
+async def get_category_slugs() -> Dict[str, Dict[str, Any]]:
+    """Every category (active or not) by slug: id, slug, parent_id, is_active"""
+    slugs = menu_cache.get("category_slugs")
+    if slugs is None:
+        # Primary reads: this validates writes
+        categories = await db.categories.find(
+            {}, {"_id": 0, "id": 1, "slug": 1, "parent_id": 1, "is_active": 1}
+        ).to_list(None)
+        slugs = {category["slug"]: category for category in categories}
+        menu_cache.set("category_slugs", slugs)
+    return slugs
+
+
+async def resolve_category(slug: str) -> Dict[str, Any]:
+    """The category with this slug; 400 when there is none"""
+    category = (await get_category_slugs()).get(slug)
+    if category is None:
+        # Created moments ago on another worker?
+        invalidate_categories()
+        category = (await get_category_slugs()).get(slug)
+    if category is None:
+        raise HTTPException(status_code=400, detail=f"Catégorie inconnue: {slug}")
+    return category
+
+
+async def validate_parent(category_id: Optional[str], parent_id: Optional[str]) -> None:
+    """400 unless parent_id is an existing category outside category_id's own subtree"""
+    if parent_id is None:
+        return
+    parents = {category["id"]: category.get("parent_id") for category in (await get_category_slugs()).values()}
+    if parent_id not in parents:
+        raise HTTPException(status_code=400, detail="Catégorie parente introuvable")
+    ancestor = parent_id
+    while ancestor is not None:
+        if ancestor == category_id:
+            raise HTTPException(status_code=400, detail="Une catégorie ne peut pas être placée sous elle-même")
+        ancestor = parents.get(ancestor)
+
+
+async def adjust_product_count(slug: Optional[str], delta: int) -> None:
+    if not slug or not delta:
+        return
+    await db.categories.update_one({"slug": slug}, {"$inc": {"product_count": delta}})
+    menu_cache.invalidate("categories")
+
+
+def build_category_tree(categories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Nest a flat, ordered category list under parent_id
+
+    Each node gets ``children`` and ``total_product_count`` (its own
+    products plus its subtree's). Categories whose parent is missing from
+    the list (e.g. inactive) become roots.
+    """
+    nodes = {category["id"]: {**category, "children": []} for category in categories}
+    roots = []
+    for node in nodes.values():
+        parent = nodes.get(node.get("parent_id"))
+        if parent is not None and parent is not node:
+            parent["children"].append(node)
+        else:
+            roots.append(node)
+
+    def total(node: Dict[str, Any], path: frozenset) -> int:
+        # path guards against a parent cycle written outside the API
+        node["children"] = [child for child in node["children"] if child["id"] not in path]
+        node["total_product_count"] = node.get("product_count", 0) + sum(
+            total(child, path | {child["id"]}) for child in node["children"]
+        )
+        return node["total_product_count"]
+
+    for root in roots:
+        total(root, frozenset({root["id"]}))
+    return roots
+
+
+async def recount_product_counts() -> int:
+    """Recompute product_count for every category from the products; returns the number corrected"""
+    counts = {
+        row["_id"]: row["count"]
+        async for row in db.products.aggregate([{"$group": {"_id": "$category", "count": {"$sum": 1}}}])
+    }
+    categories = await db.categories.find({}, {"_id": 0, "slug": 1, "product_count": 1}).to_list(None)
+    operations = [
+        UpdateOne({"slug": category["slug"]}, {"$set": {"product_count": counts.get(category["slug"], 0)}})
+        for category in categories
+        if category.get("product_count") != counts.get(category["slug"], 0)
+    ]
+    if operations:
+        await db.categories.bulk_write(operations, ordered=False)
+        logger.info(f"Corrected product_count on {len(operations)} categor(y/ies)")
+        invalidate_categories()
+    unknown = set(counts) - {category["slug"] for category in categories}
+    if unknown:
+        logger.warning(f"Products filed under unknown categories: {', '.join(sorted(map(str, unknown)))}")
+    return len(operations)
@@ -0,0 +1,197 @@
+"""
+Shared state for the API routers: database handles, caches, rate limiter,
+authentication dependencies and small helpers used across domains.
+"""
+from fastapi import HTTPException, Depends, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+from datetime import datetime, timezone, timedelta
+import jwt
+from passlib.context import CryptContext
+from database import get_database
+from cache import TTLCache
+from ids import OrderNumberAllocator
+from rate_limit import RateLimiter, load_policies
+from storage import create_storage
+from auth_tokens import RevocationList, new_token_id, token_iat
+from models import User, ReorderItem
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# MongoDB connection (pool options and per-operation-class settings live in database.py)
+db = get_database(name=os.environ['DB_NAME'])
+catalog_db = get_database("catalog", name=os.environ['DB_NAME'])  # public catalogue reads
+orders_db = get_database("orders", name=os.environ['DB_NAME'])  # order and stock writes
+
+# Per-day order numbers; each worker reserves ORDER_NUMBER_BLOCK_SIZE numbers per round trip
+order_numbers = OrderNumberAllocator(
+    orders_db.counters,
+    block_size=int(os.environ.get('ORDER_NUMBER_BLOCK_SIZE', 10))
+)
+
+# Per-worker cache for public menus (navigation, banners, categories)
+menu_cache = TTLCache(ttl_seconds=float(os.environ.get('MENU_CACHE_TTL_SECONDS', 30)))
+
+# Security
+SECRET_KEY = os.environ.get('JWT_SECRET_KEY')
+if not SECRET_KEY:
+    raise ValueError("JWT_SECRET_KEY environment variable is required for production")
+ALGORITHM = "HS256"
+# Access tokens are checked without a database read, so keep them short; refresh tokens renew them
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get('ACCESS_TOKEN_EXPIRE_MINUTES', 15))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get('REFRESH_TOKEN_EXPIRE_DAYS', 30))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+security = HTTPBearer()
+# Routes open to guests that still want to know who is signed in (checkout)
+optional_security = HTTPBearer(auto_error=False)
+
+# Logged-out tokens and per-user cutoffs, synced from revoked_tokens by each worker
+revocation_list = RevocationList(
+    db,
+    sync_seconds=float(os.environ.get('TOKEN_REVOCATION_SYNC_SECONDS', 10)),
+    capacity=int(os.environ.get('TOKEN_REVOCATION_CAPACITY', 100000))
+)
+# Claims of recently verified access tokens, so repeat requests skip the signature check
+verified_tokens = TTLCache(ttl_seconds=60, maxsize=10000)
+
+# Rate limiting for public write endpoints (RATE_LIMIT_BACKEND=mongo shares counters across workers)
+rate_limiter = RateLimiter(
+    load_policies(),
+    collection=db.rate_limits if os.environ.get('RATE_LIMIT_BACKEND', 'memory') == 'mongo' else None,
+    enabled=os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+)
+
+# Setup upload directory
+UPLOAD_DIR = Path(__file__).parent / "uploads"
+UPLOAD_DIR.mkdir(exist_ok=True)
+# In-progress uploads; must be on the same filesystem as UPLOAD_DIR for atomic renames (local storage)
+UPLOAD_TMP_DIR = Path(os.environ.get('UPLOAD_TMP_DIR', Path(__file__).parent / "uploads_tmp"))
+UPLOAD_TMP_DIR.mkdir(exist_ok=True)
+# Where finished uploads are stored (STORAGE_BACKEND=local keeps them in UPLOAD_DIR)
+storage = create_storage(UPLOAD_DIR)
+
+# --- Authentication Functions ---
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    now = datetime.now(timezone.utc)
+    if expires_delta:
+        expire = now + expires_delta
+    else:
+        expire = now + timedelta(minutes=15)
+    to_encode.update({"exp": expire, "iat": token_iat(now), "jti": new_token_id(), "type": "access"})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+def create_user_access_token(user: dict, expires_delta: Optional[timedelta] = None):
+    """Access token carrying what get_current_user and get_admin_user need"""
+    return create_access_token(
+        {"sub": user["email"], "uid": user["id"], "name": user.get("full_name", ""), "role": user.get("role", "user")},
+        expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+async def get_token_claims(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """Claims of a valid, unrevoked access token"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    token = credentials.credentials
+    payload = verified_tokens.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except jwt.PyJWTError:
+            raise credentials_exception
+        if payload.get("sub") is None or payload.get("type", "access") != "access":
+            raise credentials_exception
+        verified_tokens.set(token, payload)
+    elif payload["exp"] < time.time():
+        raise credentials_exception
+    if await revocation_list.is_revoked(payload):
+        raise credentials_exception
+    return payload
+
+async def get_current_user(claims: dict = Depends(get_token_claims)):
+    if "uid" in claims and "role" in claims:
+        return User(id=claims["uid"], email=claims["sub"], full_name=claims.get("name", ""), role=claims["role"])
+
+    # Tokens issued before they carried the user's claims
+    user = await db.users.find_one({"email": claims["sub"]})
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return User(**user)
+
+async def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)) -> Optional[User]:
+    """The signed-in user, or None for guests; a bad or expired token is treated as a guest"""
+    if credentials is None:
+        return None
+    try:
+        return await get_current_user(await get_token_claims(credentials))
+    except HTTPException:
+        return None
+
+async def get_admin_user(current_user: User = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
+
+async def revoke_user_sessions(user_id: str):
+    """Sign a user out of every session (password, role or status change, deletion)"""
+    await revocation_list.revoke_user(user_id, timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+
+# --- Reorder Helper ---
+async def apply_reorder(collection, items_order: List[ReorderItem], touch_updated_at: bool = True) -> int:
+    """
+    Apply a new ordering in a single unordered bulk write
+
+    Args:
+        collection: Collection holding documents with "id" and "order" fields
+        items_order: New positions, e.g. [{"id": "...", "order": 0}, ...]
+        touch_updated_at: Also stamp "updated_at" (one timestamp for the whole batch)
+
+    Returns:
+        int: Number of documents whose order changed
+    """
+    if not items_order:
+        return 0
+    
+    ids = [item.id for item in items_order]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Duplicate ids in reorder payload")
+    
+    existing = await collection.find({"id": {"$in": ids}}, {"_id": 0, "id": 1}).to_list(len(ids))
+    unknown_ids = set(ids) - {doc["id"] for doc in existing}
+    if unknown_ids:
+        raise HTTPException(status_code=400, detail=f"Unknown ids: {', '.join(sorted(unknown_ids))}")
+    
+    now = datetime.now(timezone.utc)
+    operations = []
+    for item in items_order:
+        update = {"order": item.order}
+        if touch_updated_at:
+            update["updated_at"] = now
+        operations.append(UpdateOne({"id": item.id}, {"$set": update}))
+    
+    result = await collection.bulk_write(operations, ordered=False)
+    return result.modified_count
@@ -0,0 +1,202 @@
+"""
+MongoDB client factory.
+
+Every process (API workers, admin_tools.py, seeding scripts) gets its
+connection from here so pool sizing, timeouts and per-operation-class
+read/write options are configured in one place.
+"""
+import os
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReadPreference, WriteConcern
+from pymongo.monitoring import ConnectionPoolListener, ConnectionCheckOutFailedReason
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_NAME = os.environ.get('DB_NAME', 'delices_algerie')
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+# Pool configuration (overridable per deployment)
+POOL_OPTIONS = {
+    "maxPoolSize": _env_int('MONGO_MAX_POOL_SIZE', 100),
+    "minPoolSize": _env_int('MONGO_MIN_POOL_SIZE', 5),
+    "maxIdleTimeMS": _env_int('MONGO_MAX_IDLE_TIME_MS', 300000),
+    # Fail fast with WaitQueueTimeoutError instead of hanging when the pool is exhausted
+    "waitQueueTimeoutMS": _env_int('MONGO_WAIT_QUEUE_TIMEOUT_MS', 2000),
+    "serverSelectionTimeoutMS": _env_int('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000),
+    "connectTimeoutMS": _env_int('MONGO_CONNECT_TIMEOUT_MS', 5000),
+    "heartbeatFrequencyMS": _env_int('MONGO_HEARTBEAT_FREQUENCY_MS', 10000),
+}
+
+_READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+# Read preference / write concern per operation class:
+#   default - primary reads, acknowledged writes
+#   catalog - public catalogue reads (products, categories, banners...), may be served by secondaries
+#   orders  - orders and stock writes, must survive a primary failover
+OPERATION_CLASSES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "catalog": {
+        "read_preference": _READ_PREFERENCES[os.environ.get('MONGO_CATALOG_READ_PREFERENCE', 'secondaryPreferred')],
+    },
+    "orders": {
+        "read_preference": ReadPreference.PRIMARY,
+        "write_concern": WriteConcern(w=os.environ.get('MONGO_ORDERS_WRITE_CONCERN', 'majority'), wtimeout=5000),
+    },
+}
+
+
+class PoolMetrics(ConnectionPoolListener):
+    """Connection pool utilisation counters, fed by pymongo's pool events.
+
+    Callbacks run on pymongo's background threads, hence the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[str, Dict[str, int]] = defaultdict(self._empty)
+
+    @staticmethod
+    def _empty() -> Dict[str, int]:
+        return {
+            "open": 0,
+            "in_use": 0,
+            "max_in_use": 0,
+            "waiting": 0,
+            "max_waiting": 0,
+            "checkouts": 0,
+            "checkout_timeouts": 0,
+            "checkout_errors": 0,
+            "cleared": 0,
+        }
+
+    def _update(self, address, **deltas):
+        key = "%s:%s" % address
+        with self._lock:
+            pool = self._pools[key]
+            for field, delta in deltas.items():
+                pool[field] = max(0, pool[field] + delta)
+            pool["max_in_use"] = max(pool["max_in_use"], pool["in_use"])
+            pool["max_waiting"] = max(pool["max_waiting"], pool["waiting"])
+
+    def pool_created(self, event):
+        self._update(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._update(event.address, cleared=1)
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._pools.pop("%s:%s" % event.address, None)
+
+    def connection_created(self, event):
+        self._update(event.address, open=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._update(event.address, open=-1)
+
+    def connection_check_out_started(self, event):
+        self._update(event.address, waiting=1)
+
+    def connection_check_out_failed(self, event):
+        if event.reason == ConnectionCheckOutFailedReason.TIMEOUT:
+            self._update(event.address, waiting=-1, checkout_timeouts=1)
+            logger.warning(f"MongoDB pool exhausted for {event.address}: {self.snapshot()}")
+        else:
+            self._update(event.address, waiting=-1, checkout_errors=1)
+
+    def connection_checked_out(self, event):
+        self._update(event.address, waiting=-1, in_use=1, checkouts=1)
+
+    def connection_checked_in(self, event):
+        self._update(event.address, in_use=-1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            pools = {address: dict(pool) for address, pool in self._pools.items()}
+        for pool in pools.values():
+            pool["max_pool_size"] = POOL_OPTIONS["maxPoolSize"]
+            pool["utilisation"] = round(pool["in_use"] / POOL_OPTIONS["maxPoolSize"], 3)
+        return {"options": dict(POOL_OPTIONS), "pools": pools}
+
+
+pool_metrics = PoolMetrics()
+
+_clients: Dict[str, AsyncIOMotorClient] = {}
+_extra_listeners: List[Any] = []
+
+
+def register_listener(listener) -> None:
+    """Attach an extra pymongo event listener to clients created afterwards."""
+    _extra_listeners.append(listener)
+
+
+def get_client(mongo_url: Optional[str] = None) -> AsyncIOMotorClient:
+    """Return the shared client for ``mongo_url`` (defaults to MONGO_URL)."""
+    url = mongo_url or os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+    client = _clients.get(url)
+    if client is None:
+        client = AsyncIOMotorClient(
+            url,
+            event_listeners=[pool_metrics, *_extra_listeners],
+            **POOL_OPTIONS
+        )
+        _clients[url] = client
+    return client
+
+
+def get_database(operation_class: str = "default", name: Optional[str] = None, mongo_url: Optional[str] = None):
+    """
+    Get a database handle configured for an operation class
+
+    Args:
+        operation_class: One of OPERATION_CLASSES ("default", "catalog", "orders")
+        name: Database name (defaults to DB_NAME)
+        mongo_url: Connection string (defaults to MONGO_URL)
+    """
+    if operation_class not in OPERATION_CLASSES:
+        raise ValueError(f"Unknown operation class: {operation_class}")
+    client = get_client(mongo_url)
+    return client.get_database(name or DEFAULT_DB_NAME, **OPERATION_CLASSES[operation_class])
+
+
+async def ping(mongo_url: Optional[str] = None) -> bool:
+    """Check that the deployment is reachable"""
+    try:
+        await get_client(mongo_url).admin.command("ping")
+        return True
+    except Exception as e:
+        logger.error(f"MongoDB ping failed: {str(e)}")
+        return False
+
+
+def close_clients() -> None:
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
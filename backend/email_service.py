@@ -2,7 +2,7 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
-from typing import Optional
+from typing import Optional, List, Dict, Any
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
@@ -11,6 +11,8 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+from email_templates import render_email, DEFAULT_LANGUAGE
+
 logger = logging.getLogger(__name__)
 
 class EmailService:
@@ -19,6 +21,36 @@ class EmailService:
         self.smtp_port = 465
         self.email_address = os.getenv("GMAIL_USER")
         self.email_password = os.getenv("GMAIL_APP_PASSWORD")
+    
+    def build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        body_html: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> MIMEMultipart:
+        """Plain text + optional HTML alternative, with extra headers (e.g. List-Unsubscribe)"""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.email_address
+        msg['To'] = to_email
+        for name, value in (headers or {}).items():
+            msg[name] = value
+        
+        # Add plain text version
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        
+        # Add HTML version if provided
+        if body_html:
+            msg.attach(MIMEText(body_html, 'html', 'utf-8'))
+        return msg
+    
+    def connect(self) -> smtplib.SMTP_SSL:
+        """Authenticated SMTP connection, for sending many messages over one login"""
+        smtp = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=30)
+        smtp.login(self.email_address, self.email_password)
+        return smtp
         
     def send_email(self, to_email: str, subject: str, body: str, body_html: Optional[str] = None) -> bool:
         """
@@ -34,20 +66,7 @@ class EmailService:
             bool: True if email sent successfully, False otherwise
         """
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.email_address
-            msg['To'] = to_email
-            
-            # Add plain text version
-            text_part = MIMEText(body, 'plain')
-            msg.attach(text_part)
-            
-            # Add HTML version if provided
-            if body_html:
-                html_part = MIMEText(body_html, 'html')
-                msg.attach(html_part)
+            msg = self.build_message(to_email, subject, body, body_html)
             
             # Connect to Gmail SMTP server and send email
             with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as smtp:
@@ -61,6 +80,34 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {str(e)}")
             return False
     
+    def send_template_email(
+        self,
+        to_email: str,
+        template: str,
+        language: str,
+        context: Dict[str, Any]
+    ) -> bool:
+        """
+        Render an email template (see email_templates.py) and send it
+        
+        Blocking: call it from a worker thread or a sync background task.
+        
+        Args:
+            to_email: Recipient email address
+            template: Template name, e.g. "order_confirmation"
+            language: fr, en or ar
+            context: Template variables
+            
+        Returns:
+            bool: True if email sent successfully
+        """
+        try:
+            email = render_email(template, language, context)
+        except Exception as e:
+            logger.error(f"Failed to render email template {template} ({language}): {str(e)}")
+            return False
+        return self.send_email(to_email, email.subject, email.text, email.html)
+    
     def send_contact_notification(self, contact_data: dict) -> bool:
         """
         Send notification email when a contact form is submitted
@@ -71,52 +118,67 @@ class EmailService:
         Returns:
             bool: True if email sent successfully
         """
-        subject = f"Nouvelle demande de contact: {contact_data['subject']}"
-        
-        # Plain text version
-        body = f"""
-Nouvelle demande de contact reçue:
-
-Nom: {contact_data['name']}
-Email: {contact_data['email']}
-Sujet: {contact_data['subject']}
-
-Message:
-{contact_data['message']}
+        # Send to the admin email (same as the sender in this case)
+        return self.send_template_email(self.email_address, "contact_notification", DEFAULT_LANGUAGE, {"contact": contact_data})
 
----
-Ce message a été envoyé depuis le formulaire de contact de Délices et Trésors d'Algérie.
+    def send_low_stock_digest(self, products: List[dict], to_email: Optional[str] = None) -> bool:
         """
+        Send one alert listing the products that just fell to or below their low-stock threshold
         
-        # HTML version
-        body_html = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 8px;">
-                    <h2 style="color: #6B8E23; border-bottom: 2px solid #6B8E23; padding-bottom: 10px;">Nouvelle demande de contact</h2>
-                    
-                    <div style="margin: 20px 0;">
-                        <p><strong>Nom:</strong> {contact_data['name']}</p>
-                        <p><strong>Email:</strong> <a href="mailto:{contact_data['email']}">{contact_data['email']}</a></p>
-                        <p><strong>Sujet:</strong> {contact_data['subject']}</p>
-                    </div>
-                    
-                    <div style="background-color: #f9f9f9; padding: 15px; border-left: 4px solid #6B8E23; margin: 20px 0;">
-                        <h3 style="margin-top: 0;">Message:</h3>
-                        <p style="white-space: pre-wrap;">{contact_data['message']}</p>
-                    </div>
-                    
-                    <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
-                    <p style="color: #666; font-size: 12px; text-align: center;">
-                        Ce message a été envoyé depuis le formulaire de contact de Délices et Trésors d'Algérie.
-                    </p>
-                </div>
-            </body>
-        </html>
+        Args:
+            products: Product dicts with id, name, stock_quantity and low_stock_threshold
+            to_email: Recipient (defaults to the admin / sender address)
+            
+        Returns:
+            bool: True if email sent successfully
         """
-        
-        # Send to the admin email (same as the sender in this case)
-        return self.send_email(self.email_address, subject, body, body_html)
+        return self.send_template_email(to_email or self.email_address, "low_stock_digest", DEFAULT_LANGUAGE, {"products": products})
+
+class SMTPSession:
+    """
+    One SMTP connection reused for a run of messages (newsletter batches)
+    
+    The connection is opened lazily, recycled every max_messages messages
+    and re-opened once if the server drops it mid-run. Not thread-safe:
+    use it from one thread at a time.
+    """
+    
+    def __init__(self, service: EmailService, max_messages: int = 200):
+        self.service = service
+        self.max_messages = max_messages
+        self._smtp: Optional[smtplib.SMTP_SSL] = None
+        self._sent = 0
+    
+    def send(self, to_email: str, msg: MIMEMultipart) -> Optional[str]:
+        """Send one message; returns None on success, the error otherwise"""
+        error = None
+        for _ in range(2):
+            if self._smtp is None:
+                # Connection/login failures propagate: the whole run stops instead of failing every recipient
+                self._smtp = self.service.connect()
+                self._sent = 0
+            try:
+                self._smtp.sendmail(self.service.email_address, to_email, msg.as_string())
+                self._sent += 1
+                if self._sent >= self.max_messages:
+                    self.close()
+                return None
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as e:
+                # Dropped connection: retry once on a fresh one
+                error = str(e) or type(e).__name__
+                self.close()
+            except smtplib.SMTPException as e:
+                # Refused recipient or message: not worth retrying
+                return str(e)
+        return error
+    
+    def close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
 
 # Create a singleton instance
 email_service = EmailService()
@@ -0,0 +1,115 @@
+"""
+Email templates
+
+Templates live in templates/emails/<language>/<name>.txt and
+<name>.html. The .txt template defines two blocks, ``subject`` and
+``body`` (the plain-text part); the .html one extends base.html and is
+autoescaped, so customer input can be passed in as-is. A language
+without its own version of a template falls back to French.
+
+Every template is compiled once by precompile_templates() at startup and
+kept in the environment's cache. EMAIL_TEMPLATES_RELOAD=true re-checks
+the files on each render so they can be edited without a restart (dev
+only: it costs a stat() per render).
+
+Rendering is CPU work and render_email() is blocking: async code reaches
+it through worker threads (email_service's senders run in background
+tasks or asyncio.to_thread, campaigns render in asyncio.to_thread).
+"""
+import os
+import logging
+from pathlib import Path
+from typing import Dict, Any, NamedTuple
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound, select_autoescape
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_LANGUAGES = ("fr", "en", "ar")
+DEFAULT_LANGUAGE = "fr"
+RTL_LANGUAGES = ("ar",)
+SHOP_NAME = "Délices et Trésors d'Algérie"
+
+TEMPLATE_DIR = Path(os.environ.get('EMAIL_TEMPLATE_DIR', Path(__file__).parent / "templates" / "emails"))
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    text: str
+    html: str
+
+
+def _format_money(value: float) -> str:
+    return f"{value:.2f} EUR"
+
+
+def localized(texts: Any, language: str) -> str:
+    """Pick a language from a {fr, en, ar} dict; plain strings pass through"""
+    if not isinstance(texts, dict):
+        return "" if texts is None else str(texts)
+    return texts.get(language) or texts.get(DEFAULT_LANGUAGE) or next(iter(texts.values()), "")
+
+
+environment = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=select_autoescape(enabled_extensions=("html",), default_for_string=False, default=False),
+    auto_reload=os.environ.get('EMAIL_TEMPLATES_RELOAD', 'false').lower() == 'true',
+    cache_size=-1,  # never evict: the template set is small and fixed
+    undefined=StrictUndefined,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+environment.filters["money"] = _format_money
+environment.filters["localized"] = localized
+environment.globals["shop_name"] = SHOP_NAME
+
+
+def normalize_language(language: Any) -> str:
+    return language if language in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
+
+
+def precompile_templates() -> int:
+    """Compile every template into the cache; raises on a syntax error so a broken deploy fails at startup"""
+    names = environment.list_templates(extensions=("html", "txt"))
+    for name in names:
+        environment.get_template(name)
+    logger.info(f"Compiled {len(names)} email template(s) from {TEMPLATE_DIR}")
+    return len(names)
+
+
+def _get_template(name: str, language: str, extension: str):
+    try:
+        return environment.get_template(f"{language}/{name}.{extension}")
+    except TemplateNotFound:
+        if language == DEFAULT_LANGUAGE:
+            raise
+        return environment.get_template(f"{DEFAULT_LANGUAGE}/{name}.{extension}")
+
+
+def render_email(name: str, language: str, context: Dict[str, Any]) -> RenderedEmail:
+    """
+    Render one email in the given language
+
+    Args:
+        name: Template name, e.g. "order_confirmation"
+        language: fr, en or ar (anything else falls back to fr)
+        context: Template variables
+
+    Returns:
+        RenderedEmail: subject, plain text body and HTML body
+    """
+    language = normalize_language(language)
+    values = {
+        **context,
+        "language": language,
+        "direction": "rtl" if language in RTL_LANGUAGES else "ltr",
+    }
+
+    text_template = _get_template(name, language, "txt")
+    text_context = text_template.new_context(values)
+    subject = "".join(text_template.blocks["subject"](text_context)).strip()
+    text = "".join(text_template.blocks["body"](text_context)).strip() + "\n"
+    html = _get_template(name, language, "html").render(values)
+    return RenderedEmail(subject=subject, text=text, html=html)
+
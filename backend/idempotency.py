@@ -0,0 +1,215 @@
+"""
+Idempotency keys for the public write endpoints
+
+A client that sends ``Idempotency-Key: <unique value>`` with a guarded
+POST can retry it safely: the first request to arrive claims the key in
+``idempotency_keys`` and runs; its response is stored with the key, and a
+retry with the same key and the same request gets that response back
+(with ``Idempotent-Replayed: true``) without running again.
+
+- Same key, different request (body, path, query or Authorization): 422
+- Same key while the first request is still running: 409 + Retry-After
+- 5xx and 429 responses are not stored, so the retry actually runs
+- A claim left by a crashed worker is taken over after ``lock_seconds``
+
+Keys expire after IDEMPOTENCY_TTL_HOURS through a TTL index on expires_at.
+Requests without the header are not affected.
+"""
+import hashlib
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from starlette.responses import JSONResponse, Response
+
+logger = logging.getLogger(__name__)
+
+HEADER = "idempotency-key"
+MAX_KEY_LENGTH = 255
+# Only these response headers are replayed
+STORED_HEADERS = {b"content-type", b"location"}
+
+
+def _fingerprint(scope, body: bytes) -> str:
+    headers = dict(scope["headers"])
+    digest = hashlib.sha256()
+    for part in (
+        scope["method"].encode(),
+        scope["path"].encode(),
+        scope.get("query_string", b""),
+        headers.get(b"authorization", b""),
+        body,
+    ):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class IdempotencyMiddleware:
+    """Replays the stored response of a request already made with the same Idempotency-Key"""
+
+    def __init__(
+        self,
+        app,
+        collection,
+        paths: Iterable[str],
+        methods: Iterable[str] = ("POST",),
+        ttl_seconds: float = 24 * 3600,
+        lock_seconds: float = 60,
+        retry_after: int = 1
+    ):
+        self.app = app
+        self.collection = collection
+        self.paths = set(paths)
+        self.methods = set(methods)
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.methods or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        key = dict(scope["headers"]).get(HEADER.encode())
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = key.decode("latin-1").strip()
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await JSONResponse(
+                status_code=400,
+                content={"detail": f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters"}
+            )(scope, receive, send)
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        record_id = f"{scope['path']}:{key}"
+        fingerprint = _fingerprint(scope, body)
+        existing = await self._claim(record_id, fingerprint)
+        if existing is not None:
+            await self._answer_existing(existing, fingerprint, scope, receive, send)
+            return
+
+        await self._run(record_id, body, scope, receive, send)
+
+    async def _claim(self, record_id: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """None once this request owns the key, otherwise the record holding it"""
+        now = datetime.now(timezone.utc)
+        lock = {
+            "fingerprint": fingerprint,
+            "state": "processing",
+            "locked_until": now + timedelta(seconds=self.lock_seconds),
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        try:
+            await self.collection.insert_one({"_id": record_id, **lock})
+            return None
+        except DuplicateKeyError:
+            pass
+
+        # Take over a claim whose owner died before storing a response
+        taken = await self.collection.find_one_and_update(
+            {"_id": record_id, "fingerprint": fingerprint, "state": "processing", "locked_until": {"$lt": now}},
+            {"$set": lock},
+            return_document=ReturnDocument.AFTER
+        )
+        if taken is not None:
+            return None
+        existing = await self.collection.find_one({"_id": record_id})
+        if existing is None:
+            # Expired between the insert and the read: claim it afresh
+            return await self._claim(record_id, fingerprint)
+        return existing
+
+    async def _answer_existing(self, existing: Dict[str, Any], fingerprint: str, scope, receive, send):
+        if existing["fingerprint"] != fingerprint:
+            response = JSONResponse(
+                status_code=422,
+                content={"detail": "Idempotency-Key was already used for a different request"}
+            )
+        elif existing["state"] != "completed":
+            response = JSONResponse(
+                status_code=409,
+                content={"detail": "A request with this Idempotency-Key is still being processed"},
+                headers={"Retry-After": str(self.retry_after)}
+            )
+        else:
+            stored = existing["response"]
+            response = Response(content=bytes(stored["body"]), status_code=stored["status"])
+            response.raw_headers = [
+                (name.encode("latin-1"), value.encode("latin-1")) for name, value in stored["headers"]
+            ] + [(b"content-length", str(len(stored["body"])).encode()), (b"idempotent-replayed", b"true")]
+        await response(scope, receive, send)
+
+    async def _run(self, record_id: str, body: bytes, scope, receive, send):
+        body_sent = False
+
+        async def replay_receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status = 500
+        headers: List[List[str]] = []
+        chunks: List[bytes] = []
+        finished = False
+
+        async def capture_send(message):
+            nonlocal status, finished
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers.extend(
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                    if name.lower() in STORED_HEADERS
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    finished = True
+                    # Stored before the client sees the response, so its retry finds it
+                    await self._finish(record_id, status, headers, b"".join(chunks))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        finally:
+            if not finished:
+                await self._release(record_id)
+
+    async def _finish(self, record_id: str, status: int, headers: List[List[str]], body: bytes):
+        if status >= 500 or status == 429:
+            # Worth retrying: let the next attempt run for real
+            await self._release(record_id)
+            return
+        try:
+            await self.collection.update_one(
+                {"_id": record_id},
+                {"$set": {
+                    "state": "completed",
+                    "completed_at": datetime.now(timezone.utc),
+                    "response": {"status": status, "headers": headers, "body": body},
+                }}
+            )
+        except Exception as e:
+            logger.error(f"Error storing idempotent response for {record_id}: {str(e)}")
+
+    async def _release(self, record_id: str):
+        try:
+            await self.collection.delete_one({"_id": record_id, "state": "processing"})
+        except Exception as e:
+            logger.error(f"Error releasing idempotency key {record_id}: {str(e)}")
@@ -0,0 +1,98 @@
+"""
+Identifier generation
+
+- new_id(): ULID strings (26 chars, Crockford base32). The first 48 bits
+  are a millisecond timestamp, so ids sort by creation time and inserts
+  append to the right-hand side of the ``id`` index instead of landing on
+  random B-tree pages. Ids generated in the same millisecond by this
+  process are strictly increasing.
+- OrderNumberAllocator: per-day order numbers (ORD-20250101-000042) drawn
+  from the ``counters`` collection. Each worker reserves a block of numbers
+  with a single $inc and hands them out from memory.
+"""
+import os
+import time
+import asyncio
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+from pymongo import ReturnDocument
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RANDOM_BITS = 80
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(26):
+        chars.append(_CROCKFORD[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def new_id() -> str:
+    """Time-ordered, monotonic ULID"""
+    global _last_ms, _last_random
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms <= _last_ms:
+            # Same millisecond (or the clock stepped back): keep ordering by incrementing
+            now_ms = _last_ms
+            _last_random += 1
+            if _last_random >= 1 << _RANDOM_BITS:
+                now_ms += 1
+                _last_random = int.from_bytes(os.urandom(10), "big") >> 1
+        else:
+            # Leave headroom so increments within one millisecond cannot overflow
+            _last_random = int.from_bytes(os.urandom(10), "big") >> 1
+        _last_ms = now_ms
+        return _encode((now_ms << _RANDOM_BITS) | _last_random)
+
+
+class OrderNumberAllocator:
+    """
+    Collision-free per-day order numbers
+
+    Numbers are unique across workers. With block_size > 1 each worker
+    consumes its own block, so numbers are increasing per worker but
+    interleave between workers, and a restart leaves the unused rest of a
+    block as a gap. block_size=1 gives one round trip per order and strictly
+    increasing numbers.
+    """
+
+    def __init__(self, collection, block_size: int = 10, prefix: str = "ORD"):
+        self.collection = collection
+        self.block_size = max(1, block_size)
+        self.prefix = prefix
+        self._lock: Optional[asyncio.Lock] = None
+        self._day: Optional[str] = None
+        self._next = 0
+        self._end = 0  # exclusive
+
+    async def _reserve_block(self, day: str):
+        counter = await self.collection.find_one_and_update(
+            {"_id": f"order_number:{day}"},
+            {"$inc": {"value": self.block_size}, "$setOnInsert": {"created_at": datetime.now(timezone.utc)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self._day = day
+        self._end = counter["value"] + 1
+        self._next = self._end - self.block_size
+
+    async def next(self) -> str:
+        """Allocate the next order number for today (UTC)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        day = datetime.now(timezone.utc).strftime('%Y%m%d')
+        async with self._lock:
+            if day != self._day or self._next >= self._end:
+                await self._reserve_block(day)
+            sequence = self._next
+            self._next += 1
+        return f"{self.prefix}-{day}-{sequence:06d}"
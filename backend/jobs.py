@@ -0,0 +1,118 @@
+"""
+Maintenance jobs registered with the scheduler
+
+Schedules are configurable through the environment; cron expressions are
+evaluated in UTC. Anything periodic or heavy belongs here rather than in a
+request handler or BackgroundTasks.
+"""
+import os
+import logging
+from datetime import datetime, timezone
+
+from core import db
+from scheduler import Scheduler
+from ratings import reconcile_rating_stats
+from stock_ledger import take_stock_snapshots, compact_stock_adjustments
+from upload_gc import sweep_orphaned_uploads
+from campaigns import process_campaigns
+from order_search import backfill_order_search_terms, link_orders_to_users
+from categories import recount_product_counts
+from sitemap import build_sitemaps
+from order_lifecycle import restock_cancelled_orders
+
+logger = logging.getLogger(__name__)
+
+scheduler = Scheduler(
+    db,
+    lease_seconds=float(os.environ.get('SCHEDULER_LEASE_SECONDS', 30)),
+    tick_seconds=float(os.environ.get('SCHEDULER_TICK_SECONDS', 5))
+)
+
+
+async def expire_promo_codes() -> int:
+    """Deactivate promo codes past their valid_until date"""
+    now = datetime.now(timezone.utc)
+    result = await db.promo_codes.update_many(
+        {"is_active": True, "valid_until": {"$lt": now}},
+        {"$set": {"is_active": False, "updated_at": now}}
+    )
+    return result.modified_count
+
+
+scheduler.add_job(
+    "rating_reconcile",
+    reconcile_rating_stats,
+    interval=float(os.environ.get('RATING_RECONCILE_INTERVAL_SECONDS', 6 * 3600)),
+    description="Correct drift in the denormalised product rating stats"
+)
+scheduler.add_job(
+    "stock_snapshots",
+    take_stock_snapshots,
+    cron=os.environ.get('STOCK_SNAPSHOT_CRON', '5 0 * * *'),
+    run_on_start=True,
+    description="Daily stock level snapshot of every product"
+)
+scheduler.add_job(
+    "stock_compaction",
+    compact_stock_adjustments,
+    cron=os.environ.get('STOCK_COMPACTION_CRON', '30 3 * * *'),
+    description="Roll stock adjustments past the retention window into monthly summaries"
+)
+scheduler.add_job(
+    "upload_gc",
+    sweep_orphaned_uploads,
+    interval=float(os.environ.get('UPLOAD_GC_INTERVAL_SECONDS', 6 * 3600)),
+    run_on_start=True,
+    description="Delete unreferenced uploads past the grace period and stale partial uploads"
+)
+scheduler.add_job(
+    "promo_expiry",
+    expire_promo_codes,
+    cron=os.environ.get('PROMO_EXPIRY_CRON', '*/15 * * * *'),
+    run_on_start=True,
+    description="Deactivate promo codes past their end date"
+)
+scheduler.add_job(
+    "order_search_backfill",
+    backfill_order_search_terms,
+    interval=float(os.environ.get('ORDER_SEARCH_BACKFILL_INTERVAL_SECONDS', 24 * 3600)),
+    run_on_start=True,
+    description="Index customer name and city words of orders written without them"
+)
+scheduler.add_job(
+    "order_user_link",
+    link_orders_to_users,
+    interval=float(os.environ.get('ORDER_USER_LINK_INTERVAL_SECONDS', 24 * 3600)),
+    run_on_start=True,
+    description="Link orders placed with a registered email to that account"
+)
+scheduler.add_job(
+    "order_restock",
+    restock_cancelled_orders,
+    interval=float(os.environ.get('ORDER_RESTOCK_INTERVAL_SECONDS', 300)),
+    run_on_start=True,
+    description="Put back in stock the items of cancelled orders whose restock was interrupted"
+)
+scheduler.add_job(
+    "sitemap",
+    build_sitemaps,
+    interval=float(os.environ.get('SITEMAP_INTERVAL_SECONDS', 3600)),
+    run_on_start=True,
+    description="Rebuild the sitemap shards whose products, articles or pages changed"
+)
+scheduler.add_job(
+    "category_product_counts",
+    recount_product_counts,
+    interval=float(os.environ.get('CATEGORY_RECOUNT_INTERVAL_SECONDS', 24 * 3600)),
+    run_on_start=True,
+    description="Recount products per category to correct drift in the maintained counts"
+)
+if os.environ.get('NEWSLETTER_SEND_IN_API', 'true').lower() == 'true':
+    # Otherwise newsletter_worker.py sends from its own process
+    scheduler.add_job(
+        "newsletter_campaigns",
+        process_campaigns,
+        interval=float(os.environ.get('NEWSLETTER_POLL_SECONDS', 60)),
+        run_on_start=True,
+        description="Deliver queued newsletter campaigns"
+    )
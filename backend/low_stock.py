@@ -0,0 +1,121 @@
+"""
+Low-stock flag and alerts
+
+Every stock-writing path stores ``is_low_stock`` on the product (see
+stock_flags), so the admin widget reads a partial index instead of
+evaluating stock_quantity <= low_stock_threshold over the whole catalogue.
+
+low_stock_watcher() follows products through a change stream (polling
+when the deployment has no replica set or the stream keeps failing) and
+emails one digest per batch of products that crossed their threshold.
+``low_stock_notified`` is claimed per product before sending, so each
+crossing is reported once across all workers; it is cleared when the
+product is restocked.
+"""
+import os
+import time
+import asyncio
+import logging
+from typing import Dict, Any, List
+
+from pymongo.errors import OperationFailure
+
+from core import db
+from email_service import email_service
+from stock_flags import LOW_STOCK_EXPR
+
+logger = logging.getLogger(__name__)
+
+WATCH_ATTEMPTS = 3  # Change stream failures in a row before falling back to polling
+
+
+async def backfill_low_stock_flags() -> int:
+    """Compute is_low_stock for products written before the flag existed"""
+    result = await db.products.update_many(
+        {"is_low_stock": {"$exists": False}},
+        [{"$set": {"is_low_stock": LOW_STOCK_EXPR}}]
+    )
+    return result.modified_count
+
+
+async def claim_unnotified() -> List[Dict[str, Any]]:
+    """Atomically claim low-stock products nobody has been alerted about yet"""
+    candidates = await db.products.find(
+        {"is_low_stock": True, "low_stock_notified": {"$ne": True}},
+        {"_id": 0, "id": 1}
+    ).to_list(None)
+    claimed = []
+    for candidate in candidates:
+        product = await db.products.find_one_and_update(
+            {"id": candidate["id"], "is_low_stock": True, "low_stock_notified": {"$ne": True}},
+            {"$set": {"low_stock_notified": True}},
+            projection={"_id": 0, "id": 1, "name": 1, "stock_quantity": 1, "low_stock_threshold": 1}
+        )
+        if product:
+            claimed.append(product)
+    return claimed
+
+
+async def send_low_stock_digest() -> int:
+    products = await claim_unnotified()
+    if not products:
+        return 0
+    recipient = os.environ.get('LOW_STOCK_ALERT_EMAIL') or email_service.email_address
+    sent = await asyncio.to_thread(email_service.send_low_stock_digest, products, recipient)
+    if not sent:
+        # Release the claim so the next pass retries
+        await db.products.update_many(
+            {"id": {"$in": [p["id"] for p in products]}},
+            {"$set": {"low_stock_notified": False}}
+        )
+        return 0
+    return len(products)
+
+
+async def _watch_changes(debounce: float):
+    pipeline = [{"$match": {"$or": [
+        {"operationType": "insert", "fullDocument.is_low_stock": True},
+        {"operationType": "replace", "fullDocument.is_low_stock": True},
+        {"updateDescription.updatedFields.is_low_stock": True},
+    ]}}]
+    async with db.products.watch(pipeline) as stream:
+        logger.info("Low-stock watcher following the products change stream")
+        async for _ in stream:
+            # Let a burst of orders settle into a single digest
+            await asyncio.sleep(debounce)
+            await send_low_stock_digest()
+
+
+async def low_stock_watcher():
+    debounce = float(os.environ.get('LOW_STOCK_DIGEST_DELAY_SECONDS', 30))
+    poll_interval = float(os.environ.get('LOW_STOCK_POLL_SECONDS', 300))
+    try:
+        await backfill_low_stock_flags()
+        await send_low_stock_digest()
+    except Exception as e:
+        logger.error(f"Error preparing low-stock alerts: {str(e)}")
+
+    use_change_stream = True
+    stream_failures = 0
+    while True:
+        started = time.monotonic()
+        try:
+            if use_change_stream:
+                await _watch_changes(debounce)
+            else:
+                await asyncio.sleep(poll_interval)
+                await send_low_stock_digest()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if use_change_stream:
+                # A stream that ran for a while before dropping is worth reopening
+                stream_failures = 1 if time.monotonic() - started > poll_interval else stream_failures + 1
+                if isinstance(e, OperationFailure) or stream_failures >= WATCH_ATTEMPTS:
+                    # Standalone mongod (change streams need a replica set), a driver without
+                    # watch() or a stream that keeps failing: polling still sends the alerts
+                    logger.info(f"Change stream unavailable ({str(e)}), polling low stock every {poll_interval:.0f}s")
+                    use_change_stream = False
+                    continue
+            logger.error(f"Low-stock watcher error: {str(e)}")
+            await asyncio.sleep(poll_interval)
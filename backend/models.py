@@ -0,0 +1,699 @@
+"""
+Pydantic models shared by the API routers
+"""
+from pydantic import BaseModel, Field, EmailStr
+from typing import List, Optional, Dict, Any
+from ids import new_id
+from datetime import datetime, timezone
+import secrets
+
+# User Models
+class User(BaseModel):
+    id: str = Field(default_factory=new_id)
+    email: EmailStr
+    full_name: str
+    role: str = "user"  # "user" or "admin"
+    is_active: bool = True
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class UserCreate(BaseModel):
+    email: EmailStr
+    password: str
+    full_name: str
+    role: str = "user"
+
+class UserUpdate(BaseModel):
+    full_name: Optional[str] = None
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
+
+class UserLogin(BaseModel):
+    email: EmailStr
+    password: str
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # seconds
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+# Category Models
+class Category(BaseModel):
+    id: str = Field(default_factory=new_id)
+    name: Dict[str, str]  # {"fr": "Dattes", "en": "Dates", "ar": "تمور"}
+    slug: str  # URL-friendly name
+    description: Optional[Dict[str, str]] = None
+    icon: Optional[str] = "🛍️"  # Emoji or icon name
+    image_url: Optional[str] = None
+    order: int = 0  # For sorting
+    is_active: bool = True
+    parent_id: Optional[str] = None  # None for top-level categories
+    product_count: int = 0  # Products filed directly under this category (maintained on product writes)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class CategoryNode(Category):
+    children: List["CategoryNode"] = []
+    total_product_count: int = 0  # Including subcategories
+
+class CategoryCreate(BaseModel):
+    name: Dict[str, str]
+    slug: str
+    description: Optional[Dict[str, str]] = None
+    icon: Optional[str] = "🛍️"
+    image_url: Optional[str] = None
+    order: Optional[int] = 0
+    is_active: Optional[bool] = True
+    parent_id: Optional[str] = None
+
+class CategoryUpdate(BaseModel):
+    name: Optional[Dict[str, str]] = None
+    slug: Optional[str] = None
+    description: Optional[Dict[str, str]] = None
+    icon: Optional[str] = None
+    image_url: Optional[str] = None
+    order: Optional[int] = None
+    is_active: Optional[bool] = None
+    parent_id: Optional[str] = None  # "" moves the category to the top level
+
+# Product Models
+class Product(BaseModel):
+    id: str = Field(default_factory=new_id)
+    name: Dict[str, str]
+    description: Dict[str, str]
+    category: str  # "epices", "thes", "robes-kabyles", "bijoux-kabyles"
+    price: float
+    currency: str = "EUR"
+    image_urls: List[str]
+    in_stock: bool = True
+    # Inventory Management
+    track_inventory: bool = True  # Whether to track inventory for this product
+    stock_quantity: int = 0  # Current quantity in stock
+    low_stock_threshold: int = 5  # Alert when stock is below this
+    allow_backorder: bool = False  # Allow orders when out of stock
+    is_low_stock: bool = False  # Maintained on every stock write (low_stock.py)
+    origin: Dict[str, str]
+    # Rating stats from approved testimonials (maintained incrementally)
+    rating_count: int = 0
+    rating_sum: int = 0
+    rating_avg: float = 0.0
+    rating_histogram: Dict[str, int] = Field(default_factory=dict)  # {"1": 0, ..., "5": 12}
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = None  # Last edit through the product form
+    created_by: Optional[str] = None
+
+class ProductCreate(BaseModel):
+    name: Dict[str, str]
+    description: Dict[str, str]
+    category: str
+    price: float
+    image_urls: List[str]
+    origin: Dict[str, str]
+    in_stock: bool = True
+    track_inventory: bool = True
+    stock_quantity: int = 0
+    low_stock_threshold: int = 5
+    allow_backorder: bool = False
+
+class ProductUpdate(BaseModel):
+    name: Optional[Dict[str, str]] = None
+    description: Optional[Dict[str, str]] = None
+    category: Optional[str] = None
+    price: Optional[float] = None
+    image_urls: Optional[List[str]] = None
+    origin: Optional[Dict[str, str]] = None
+    in_stock: Optional[bool] = None
+    track_inventory: Optional[bool] = None
+    stock_quantity: Optional[int] = None
+    low_stock_threshold: Optional[int] = None
+    allow_backorder: Optional[bool] = None
+
+# Stock Adjustment Models
+class StockAdjustment(BaseModel):
+    id: str = Field(default_factory=new_id)
+    product_id: str
+    adjustment_type: str  # "increase", "decrease", "set", "order"
+    quantity: int
+    stock_after: Optional[int] = None  # Resulting stock level (absent on legacy rows)
+    reason: Optional[str] = None
+    notes: Optional[str] = None
+    performed_by: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class StockAdjustmentRequest(BaseModel):
+    adjustment_type: str  # "increase", "decrease", "set"
+    quantity: int
+    reason: Optional[str] = None
+    notes: Optional[str] = None
+
+# Historical Content Models
+class HistoricalContent(BaseModel):
+    id: str = Field(default_factory=new_id)
+    title: Dict[str, str]
+    content: Dict[str, str]
+    region: str  # "algerie", "kabylie", "vallee-soumam"
+    image_urls: List[str]
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = None
+    created_by: Optional[str] = None
+
+class HistoricalContentCreate(BaseModel):
+    title: Dict[str, str]
+    content: Dict[str, str]
+    region: str
+    image_urls: List[str]
+
+class HistoricalContentUpdate(BaseModel):
+    title: Optional[Dict[str, str]] = None
+    content: Optional[Dict[str, str]] = None
+    region: Optional[str] = None
+    image_urls: Optional[List[str]] = None
+
+# Admin Statistics Model
+class AdminStats(BaseModel):
+    total_users: int
+    total_products: int
+    total_historical_content: int
+    total_contact_messages: int
+    recent_users: int
+    recent_products: int
+    recent_contact_messages: int
+
+# Settings Model
+class Settings(BaseModel):
+    id: str = Field(default="site_settings")
+    general: Optional[Dict[str, Any]] = None
+    configuration: Optional[Dict[str, Any]] = None
+    appearance: Optional[Dict[str, Any]] = None
+    seo: Optional[Dict[str, Any]] = None
+    notifications: Optional[Dict[str, Any]] = None
+    security: Optional[Dict[str, Any]] = None
+    media: Optional[Dict[str, Any]] = None
+    backup: Optional[Dict[str, Any]] = None
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+# Customization Model
+class SiteCustomization(BaseModel):
+    id: str = Field(default="site_customization")
+    # Brand Identity
+    site_name: str = "Délices et Trésors d'Algérie"
+    site_slogan: Dict[str, str] = {
+        "fr": "Découvrez nos trésors : dattes Deglet Nour et huile d'olive kabyle authentique",
+        "en": "Discover our treasures: Deglet Nour dates and authentic Kabyle olive oil",
+        "ar": "اكتشف كنوزنا: تمور دقلة نور وزيت الزيتون القبائلي الأصيل"
+    }
+    tagline: Dict[str, str] = {
+        "fr": "Saveurs authentiques d'Algérie",
+        "en": "Authentic flavors of Algeria",
+        "ar": "نكهات الجزائر الأصيلة"
+    }
+    logo_url: Optional[str] = None
+    favicon_url: Optional[str] = None
+    
+    # Colors
+    primary_color: str = "#6B8E23"  # Olive green
+    secondary_color: str = "#8B7355"  # Golden brown
+    accent_color: str = "#F59E0B"  # Amber
+    
+    # Typography
+    font_heading: str = "Playfair Display"
+    font_body: str = "Montserrat"
+    
+    # Contact Info
+    contact_email: str = "contact@delices-algerie.com"
+    contact_phone: Optional[str] = None
+    contact_address: Dict[str, str] = {
+        "fr": "Algérie",
+        "en": "Algeria",
+        "ar": "الجزائر"
+    }
+    
+    # Page Texts
+    home_title: Dict[str, str] = {
+        "fr": "Délices et Trésors d'Algérie",
+        "en": "Delights and Treasures of Algeria",
+        "ar": "لذائذ وكنوز الجزائر"
+    }
+    home_subtitle: Dict[str, str] = {
+        "fr": "Découvrez l'authenticité du terroir algérien",
+        "en": "Discover the authenticity of Algerian terroir",
+        "ar": "اكتشف أصالة التراب الجزائري"
+    }
+    
+    shop_title: Dict[str, str] = {
+        "fr": "Boutique Délices et Trésors d'Algérie",
+        "en": "Délices et Trésors d'Algérie Shop",
+        "ar": "متجر لذائذ وكنوز الجزائر"
+    }
+    shop_description: Dict[str, str] = {
+        "fr": "Découvrez nos trésors : dattes Deglet Nour et huile d'olive kabyle authentique",
+        "en": "Discover our treasures: Deglet Nour dates and authentic Kabyle olive oil",
+        "ar": "اكتشف كنوزنا: تمور دقلة نور وزيت الزيتون القبائلي الأصيل"
+    }
+    
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class CustomizationUpdate(BaseModel):
+    site_name: Optional[str] = None
+    site_slogan: Optional[Dict[str, str]] = None
+    logo_url: Optional[str] = None
+    favicon_url: Optional[str] = None
+    primary_color: Optional[str] = None
+    secondary_color: Optional[str] = None
+    accent_color: Optional[str] = None
+    font_heading: Optional[str] = None
+    font_body: Optional[str] = None
+    contact_email: Optional[str] = None
+    contact_phone: Optional[str] = None
+    contact_address: Optional[Dict[str, str]] = None
+    home_title: Optional[Dict[str, str]] = None
+    home_subtitle: Optional[Dict[str, str]] = None
+    shop_title: Optional[Dict[str, str]] = None
+    shop_description: Optional[Dict[str, str]] = None
+    tagline: Optional[Dict[str, str]] = None
+
+# Custom Page Models
+class CustomPage(BaseModel):
+    id: str = Field(default_factory=new_id)
+    title: Dict[str, str]  # {"fr": "Mentions légales", "en": "Legal notice", "ar": "..."}
+    slug: str  # URL-friendly: "mentions-legales"
+    content: Dict[str, str]  # HTML content in 3 languages
+    meta_description: Optional[Dict[str, str]] = None
+    is_published: bool = True
+    show_in_menu: bool = False  # Display in navigation menu
+    menu_order: int = 0
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class CustomPageCreate(BaseModel):
+    title: Dict[str, str]
+    slug: str
+    content: Dict[str, str]
+    meta_description: Optional[Dict[str, str]] = None
+    is_published: Optional[bool] = True
+    show_in_menu: Optional[bool] = False
+    menu_order: Optional[int] = 0
+
+class CustomPageUpdate(BaseModel):
+    title: Optional[Dict[str, str]] = None
+    slug: Optional[str] = None
+    content: Optional[Dict[str, str]] = None
+    meta_description: Optional[Dict[str, str]] = None
+    is_published: Optional[bool] = None
+    show_in_menu: Optional[bool] = None
+    menu_order: Optional[int] = None
+
+# SEO Settings Model
+class SEOSettings(BaseModel):
+    id: str = "seo_settings"
+    site_title: Dict[str, str] = {"fr": "", "en": "", "ar": ""}
+    site_description: Dict[str, str] = {"fr": "", "en": "", "ar": ""}
+    site_keywords: Dict[str, str] = {"fr": "", "en": "", "ar": ""}
+    og_image: str = ""
+    twitter_handle: str = ""
+    google_analytics_id: str = ""
+    google_site_verification: str = ""
+    robots_txt: str = "User-agent: *\nAllow: /"
+    canonical_url: str = ""
+    structured_data_enabled: bool = True
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+# Order Models
+class OrderItem(BaseModel):
+    product_id: str
+    product_name: str
+    quantity: int
+    price: float
+    image_url: Optional[str] = None
+    stock_taken: Optional[int] = None  # Units checkout took from stock (less than quantity on backorder); set server-side
+
+class OrderStatusChange(BaseModel):
+    status: str
+    at: datetime
+    by: Optional[str] = None
+
+class Order(BaseModel):
+    id: str = Field(default_factory=new_id)
+    order_number: str  # ORD-YYYYMMDD-NNNNNN, allocated by core.order_numbers
+    user_id: Optional[str] = None
+    customer_name: str
+    customer_email: EmailStr
+    customer_phone: str
+    shipping_address: str
+    shipping_city: str
+    shipping_postal_code: Optional[str] = None
+    items: List[OrderItem]
+    subtotal: float
+    shipping_cost: float = 0.0
+    promo_code: Optional[str] = None
+    discount_amount: float = 0.0
+    total: float
+    payment_method: str = "cash"  # cash, bank_transfer, paypal
+    payment_status: str = "pending"  # pending, paid, failed, refunded
+    status: str = "pending"  # see order_lifecycle.ORDER_TRANSITIONS
+    status_history: List[OrderStatusChange] = []
+    stock_restore_pending: bool = False  # set with the cancellation, cleared once the items are back in stock
+    stock_restored_at: Optional[datetime] = None  # set when a cancellation put the items back in stock
+    notes: Optional[str] = None
+    language: str = "fr"  # fr, en or ar: customer emails are sent in this language
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class OrderCreate(BaseModel):
+    customer_name: str
+    customer_email: EmailStr
+    customer_phone: str
+    shipping_address: str
+    shipping_city: str
+    shipping_postal_code: Optional[str] = None
+    items: List[OrderItem]
+    promo_code: Optional[str] = None
+    payment_method: str = "cash"  # cash, bank_transfer, paypal
+    notes: Optional[str] = None
+    language: str = "fr"
+
+class OrderSearchPage(BaseModel):
+    items: List[Order]
+    next_cursor: Optional[str] = None  # pass back as cursor for the next page; None on the last one
+    total: int
+    total_exact: bool  # False when total is an estimate or capped
+
+class OrderSummary(BaseModel):
+    """What a customer sees of their own order (my-orders)"""
+    id: str
+    order_number: str
+    items: List[OrderItem]
+    subtotal: float
+    shipping_cost: float = 0.0
+    discount_amount: float = 0.0
+    total: float
+    shipping_address: str
+    shipping_city: str
+    shipping_postal_code: Optional[str] = None
+    payment_method: str = "cash"
+    payment_status: str = "pending"
+    status: str = "pending"
+    notes: Optional[str] = None
+    created_at: datetime
+
+class OrderSummaryPage(BaseModel):
+    items: List[OrderSummary]
+    next_cursor: Optional[str] = None
+
+class OrderUpdate(BaseModel):
+    status: Optional[str] = None
+    notes: Optional[str] = None
+
+# Contact Models
+class ContactMessage(BaseModel):
+    id: str = Field(default_factory=new_id)
+    name: str
+    email: EmailStr
+    subject: str
+    message: str
+    status: str = "new"  # "new", "read", "replied"
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ContactMessageCreate(BaseModel):
+    name: str
+    email: EmailStr
+    subject: str
+    message: str
+
+class ContactMessageUpdate(BaseModel):
+    status: Optional[str] = None
+
+# Testimonial Models
+class Testimonial(BaseModel):
+    id: str = Field(default_factory=new_id)
+    customer_name: str
+    customer_email: EmailStr
+    rating: int = Field(..., ge=1, le=5)  # Rating from 1 to 5
+    comment: str
+    product_id: Optional[str] = None  # Optional: testimonial for a specific product
+    is_approved: bool = False
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    approved_at: Optional[datetime] = None
+    approved_by: Optional[str] = None  # Admin user ID who approved
+
+class TestimonialCreate(BaseModel):
+    customer_name: str
+    customer_email: EmailStr
+    rating: int = Field(..., ge=1, le=5)
+    comment: str
+    product_id: Optional[str] = None
+
+class TestimonialUpdate(BaseModel):
+    is_approved: Optional[bool] = None
+    comment: Optional[str] = None
+
+class ProductReview(BaseModel):
+    """An approved testimonial as shown on the product page (without the email)"""
+    id: str
+    customer_name: str
+    rating: int
+    comment: str
+    approved_at: Optional[datetime] = None
+
+class ProductReviewSummary(BaseModel):
+    rating_count: int = 0
+    rating_avg: float = 0.0
+    rating_histogram: Dict[str, int] = Field(default_factory=dict)
+    recent: List[ProductReview] = []  # Latest approved first
+
+class ProductDetail(BaseModel):
+    product: Product
+    category: Optional[Category] = None  # None if the category is inactive
+    reviews: ProductReviewSummary
+    related: List[Product] = []  # In stock, same category then same origin, best rated first
+
+# Navigation Menu Models
+class NavigationItem(BaseModel):
+    id: str = Field(default_factory=new_id)
+    label: Dict[str, str]  # {"fr": "Accueil", "en": "Home", "ar": "الرئيسية"}
+    url: str  # "/", "/shop", "/about", "https://external.com"
+    is_external: bool = False  # True for external links
+    order: int = 0  # For sorting
+    is_active: bool = True
+    icon: Optional[str] = None  # Optional icon name
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class NavigationItemCreate(BaseModel):
+    label: Dict[str, str]
+    url: str
+    is_external: Optional[bool] = False
+    order: Optional[int] = 0
+    is_active: Optional[bool] = True
+    icon: Optional[str] = None
+
+class NavigationItemUpdate(BaseModel):
+    label: Optional[Dict[str, str]] = None
+    url: Optional[str] = None
+    is_external: Optional[bool] = None
+    order: Optional[int] = None
+    is_active: Optional[bool] = None
+    icon: Optional[str] = None
+
+# Reorder payload item, shared by navigation, banners and categories
+class ReorderItem(BaseModel):
+    id: str
+    order: int
+
+# Footer Models
+class FooterSettings(BaseModel):
+    id: str = Field(default="footer_config")
+    about_text: Dict[str, str] = Field(default_factory=dict)  # {"fr": "À propos...", "en": "About...", "ar": "..."}
+    social_links: List[Dict[str, str]] = Field(default_factory=list)  # [{"name": "Facebook", "url": "...", "icon": "..."}]
+    footer_links: List[Dict[str, Any]] = Field(default_factory=list)  # [{"title": {"fr": "...", "en": "...", "ar": "..."}, "links": [...]}]
+    copyright_text: Dict[str, str] = Field(default_factory=dict)
+    contact_info: Dict[str, Any] = Field(default_factory=dict)  # {"email": "...", "phone": "...", "address": {...}}
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class FooterSettingsUpdate(BaseModel):
+    about_text: Optional[Dict[str, str]] = None
+    social_links: Optional[List[Dict[str, str]]] = None
+    footer_links: Optional[List[Dict[str, Any]]] = None
+    copyright_text: Optional[Dict[str, str]] = None
+    contact_info: Optional[Dict[str, Any]] = None
+
+# Banner Models (Homepage Slider)
+class Banner(BaseModel):
+    id: str = Field(default_factory=new_id)
+    title: Dict[str, str]  # {"fr": "Titre", "en": "Title", "ar": "العنوان"}
+    subtitle: Dict[str, str] = Field(default_factory=dict)
+    description: Dict[str, str] = Field(default_factory=dict)
+    image_url: str
+    cta_text: Dict[str, str] = Field(default_factory=dict)  # Call-to-action button text
+    cta_link: Optional[str] = None  # Link for the CTA button
+    order: int = 0
+    is_active: bool = True
+    background_color: Optional[str] = None  # Optional custom background
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class BannerCreate(BaseModel):
+    title: Dict[str, str]
+    subtitle: Optional[Dict[str, str]] = None
+    description: Optional[Dict[str, str]] = None
+    image_url: str
+    cta_text: Optional[Dict[str, str]] = None
+    cta_link: Optional[str] = None
+    order: Optional[int] = 0
+    is_active: Optional[bool] = True
+    background_color: Optional[str] = None
+
+class BannerUpdate(BaseModel):
+    title: Optional[Dict[str, str]] = None
+    subtitle: Optional[Dict[str, str]] = None
+    description: Optional[Dict[str, str]] = None
+    image_url: Optional[str] = None
+    cta_text: Optional[Dict[str, str]] = None
+    cta_link: Optional[str] = None
+    order: Optional[int] = None
+    is_active: Optional[bool] = None
+    background_color: Optional[str] = None
+
+# Newsletter Models
+class NewsletterSubscriber(BaseModel):
+    id: str = Field(default_factory=new_id)
+    email: EmailStr
+    language: str = "fr"  # fr, en or ar
+    is_active: bool = True
+    unsubscribe_token: str = Field(default_factory=lambda: secrets.token_urlsafe(24))
+    subscribed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    unsubscribed_at: Optional[datetime] = None
+
+class NewsletterSubscribe(BaseModel):
+    email: EmailStr
+    language: str = "fr"
+
+class NewsletterSubscription(BaseModel):
+    """What the public subscribe endpoint returns (no unsubscribe token)"""
+    email: EmailStr
+    language: str = "fr"
+    is_active: bool = True
+    subscribed_at: datetime
+
+class NewsletterCampaignCreate(BaseModel):
+    subject: Dict[str, str]  # {"fr": "...", "en": "...", "ar": "..."}
+    body_html: Dict[str, str]
+    body_text: Optional[Dict[str, str]] = None  # Derived from body_html when missing
+
+class NewsletterCampaign(BaseModel):
+    id: str = Field(default_factory=new_id)
+    subject: Dict[str, str]
+    body_html: Dict[str, str]
+    body_text: Optional[Dict[str, str]] = None
+    status: str = "draft"  # draft, queued, sending, paused, completed, cancelled
+    total_recipients: int = 0
+    sent_count: int = 0
+    failed_count: int = 0
+    skipped_count: int = 0  # Unsubscribed before their turn, or cancelled
+    recipients_ready: bool = False
+    created_by: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    queued_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+# Upload Session Models (resumable uploads)
+class UploadSessionCreate(BaseModel):
+    total_size: int = Field(gt=0)
+    filename: Optional[str] = None  # Original name, informational only
+
+class UploadSession(BaseModel):
+    id: str = Field(default_factory=new_id)
+    total_size: int
+    received: int = 0
+    filename: Optional[str] = None
+    completed: bool = False
+    stored_filename: Optional[str] = None
+    url: Optional[str] = None
+    created_by: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: datetime
+
+class DirectUploadCreate(BaseModel):
+    content_type: str  # image/jpeg, image/png, image/webp or image/gif
+    size: int = Field(gt=0)
+
+# Promo Code Models
+class PromoCode(BaseModel):
+    id: str = Field(default_factory=new_id)
+    code: str  # The actual promo code (e.g., "SUMMER2025")
+    description: Optional[Dict[str, str]] = None  # {"fr": "...", "en": "...", "ar": "..."}
+    discount_type: str  # "percentage" or "fixed"
+    discount_value: float  # Percentage (e.g., 20 for 20%) or fixed amount (e.g., 10.00)
+    min_order_amount: Optional[float] = None  # Minimum order amount to use this code
+    max_discount_amount: Optional[float] = None  # Maximum discount for percentage codes
+    usage_limit: Optional[int] = None  # Total number of times this code can be used (None = unlimited)
+    usage_count: int = 0  # How many times it has been used
+    user_usage_limit: Optional[int] = None  # Max uses per user (None = unlimited)
+    valid_from: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    valid_until: Optional[datetime] = None
+    is_active: bool = True
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class PromoCodeCreate(BaseModel):
+    code: str
+    description: Optional[Dict[str, str]] = None
+    discount_type: str
+    discount_value: float
+    min_order_amount: Optional[float] = None
+    max_discount_amount: Optional[float] = None
+    usage_limit: Optional[int] = None
+    user_usage_limit: Optional[int] = None
+    valid_from: Optional[datetime] = None
+    valid_until: Optional[datetime] = None
+    is_active: Optional[bool] = True
+
+class PromoCodeUpdate(BaseModel):
+    description: Optional[Dict[str, str]] = None
+    discount_type: Optional[str] = None
+    discount_value: Optional[float] = None
+    min_order_amount: Optional[float] = None
+    max_discount_amount: Optional[float] = None
+    usage_limit: Optional[int] = None
+    user_usage_limit: Optional[int] = None
+    valid_from: Optional[datetime] = None
+    valid_until: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+class PromoCodeValidation(BaseModel):
+    code: str
+    order_amount: float
+
+# General Settings Models
+class GeneralSettings(BaseModel):
+    id: str = "general_settings"
+    site_title: Dict[str, str] = {"fr": "", "ar": "", "en": ""}
+    site_description: Dict[str, str] = {"fr": "", "ar": "", "en": ""}
+    contact_email: str = ""
+    support_email: str = ""
+    contact_email_2: str = ""
+    contact_email_3: str = ""
+    phone: str = ""
+    phone_2: str = ""
+    phone_3: str = ""
+    address: Dict[str, str] = {"fr": "", "ar": "", "en": ""}
+    address_2: Dict[str, str] = {"fr": "", "ar": "", "en": ""}
+    address_3: Dict[str, str] = {"fr": "", "ar": "", "en": ""}
+    show_phone_2: bool = False
+    show_phone_3: bool = False
+    show_email_2: bool = False
+    show_email_3: bool = False
+    show_address_2: bool = False
+    show_address_3: bool = False
+    timezone: str = "Europe/Paris"
+    currency: str = "EUR"
+    currency_symbol: str = "€"
+    date_format: str = "DD/MM/YYYY"
+    facebook_url: str = ""
+    instagram_url: str = ""
+    twitter_url: str = ""
+    linkedin_url: str = ""
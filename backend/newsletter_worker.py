@@ -0,0 +1,42 @@
+"""
+Dedicated newsletter sender
+
+Run next to the API with NEWSLETTER_SEND_IN_API=false so campaign delivery
+never shares a process with request handling:
+
+    cd backend && python newsletter_worker.py
+
+Several instances may run; each campaign is leased to one of them at a time.
+"""
+import os
+import asyncio
+import logging
+
+from campaigns import process_campaigns
+from database import close_clients
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    poll_interval = float(os.environ.get('NEWSLETTER_POLL_SECONDS', 60))
+    logger.info("Newsletter worker started")
+    try:
+        while True:
+            try:
+                result = await process_campaigns()
+                if result["campaigns"]:
+                    logger.info(f"Processed {result['campaigns']} campaign(s): {result['sent']} sent, {result['failed']} failed")
+            except Exception as e:
+                logger.error(f"Newsletter worker error: {str(e)}")
+            await asyncio.sleep(poll_interval)
+    finally:
+        close_clients()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
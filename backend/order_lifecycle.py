@@ -0,0 +1,238 @@
+"""
+Order status state machine
+
+    pending -> confirmed -> processing -> shipped -> delivered -> refunded
+
+plus cancelled from pending, confirmed or processing: an order can be
+cancelled until it ships, and refunded once delivered.
+
+Each transition is one conditional update matched on the statuses it may
+come from, so two admins changing the same order cannot both win and no
+read is needed beforehand. Each status an order enters is appended to
+``status_history`` with when and by whom (the creation entry included),
+so the previous entry gives the status it came from.
+
+Cancelling puts back what checkout took from stock (``stock_taken`` on
+each item: less than the quantity for backorders), logged in the stock
+ledger. The cancellation sets ``stock_restore_pending`` in the same
+write; the restock claims the order for RESTOCK_LEASE, then restocks one
+product at a time: the increment pushes the order id onto the product's
+``restocked_orders`` in the same write, so it cannot be applied twice,
+and the product is then added to the order's ``stock_restored_products``
+so a retry skips it. A restock cut short by a crash is picked up by the
+"order_restock" job; the pending flag is only cleared by the worker
+still holding the claim. A refund does not restock: returned goods are
+checked and re-entered by hand.
+"""
+import os
+import logging
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional, Set
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+from core import orders_db
+from stock_flags import LOW_STOCK_EXPR
+from models import StockAdjustment
+from product_detail import invalidate_product_detail
+
+logger = logging.getLogger(__name__)
+
+ORDER_TRANSITIONS: Dict[str, Set[str]] = {
+    "pending": {"confirmed", "cancelled"},
+    "confirmed": {"processing", "cancelled"},
+    "processing": {"shipped", "cancelled"},
+    "shipped": {"delivered"},
+    "delivered": {"refunded"},
+    "cancelled": set(),
+    "refunded": set(),
+}
+ORDER_STATUSES = list(ORDER_TRANSITIONS)
+# A restock claimed longer ago than this was interrupted and is retried
+RESTOCK_LEASE = timedelta(seconds=float(os.environ.get('ORDER_RESTOCK_LEASE_SECONDS', 300)))
+# Latest restocked order ids kept on a product; they only need to outlive a retry
+RESTOCK_MARKERS = 50
+
+
+def allowed_sources(status: str) -> List[str]:
+    """Statuses an order can move to ``status`` from"""
+    return sorted(source for source, targets in ORDER_TRANSITIONS.items() if status in targets)
+
+
+async def transition_order(
+    order_id: str,
+    status: str,
+    performed_by: Optional[str] = None,
+    extra_fields: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Move an order to ``status``
+
+    Args:
+        order_id: Order id
+        status: Target status
+        performed_by: Email of the admin making the change
+        extra_fields: Other fields to $set in the same write (e.g. notes)
+
+    Returns:
+        dict: The order after the update, with ``changed`` False when it
+        already had this status (repeating a request is harmless)
+
+    Raises:
+        HTTPException: 400 unknown status, 404 unknown order, 409 transition not allowed
+    """
+    if status not in ORDER_TRANSITIONS:
+        raise HTTPException(status_code=400, detail=f"Statut inconnu: {status}")
+
+    now = datetime.now(timezone.utc)
+    sources = allowed_sources(status)
+    updates = {**(extra_fields or {}), "status": status, "updated_at": now}
+    if status == "refunded":
+        updates["payment_status"] = "refunded"
+    if status == "cancelled":
+        updates["stock_restore_pending"] = True
+    order = None
+    if sources:
+        order = await orders_db.orders.find_one_and_update(
+            {"id": order_id, "status": {"$in": sources}},
+            {
+                "$set": updates,
+                "$push": {"status_history": {"status": status, "at": now, "by": performed_by}},
+            },
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    if order is not None:
+        if status == "cancelled":
+            await restore_order_stock(order, performed_by)
+        order["changed"] = True
+        return order
+
+    # Nothing matched: find out why (only on this path)
+    current = await orders_db.orders.find_one({"id": order_id}, {"_id": 0})
+    if not current:
+        raise HTTPException(status_code=404, detail="Order not found")
+    if current["status"] == status:
+        if extra_fields:
+            await orders_db.orders.update_one({"id": order_id}, {"$set": {**extra_fields, "updated_at": now}})
+            current.update(extra_fields, updated_at=now)
+        current["changed"] = False
+        return current
+    raise HTTPException(
+        status_code=409,
+        detail=f"Transition impossible: {current['status']} -> {status}"
+    )
+
+
+def _item_stock_taken(item: Dict[str, Any]) -> int:
+    # Orders placed before stock_taken was recorded took their full quantity
+    taken = item.get("stock_taken")
+    return item["quantity"] if taken is None else taken
+
+
+async def restore_order_stock(order: Dict[str, Any], performed_by: Optional[str] = None) -> int:
+    """Put a cancelled order's items back in stock; returns the number of products restocked"""
+    # Claimed first, so the request and the order_restock job do not both work on an order
+    now = datetime.now(timezone.utc)
+    claimed = await orders_db.orders.find_one_and_update(
+        {
+            "id": order["id"],
+            "stock_restore_pending": True,
+            "$or": [{"restock_claimed_at": None}, {"restock_claimed_at": {"$lt": now - RESTOCK_LEASE}}],
+        },
+        {"$set": {"restock_claimed_at": now}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if claimed is None:
+        return 0
+
+    quantities = Counter()
+    for item in claimed.get("items", []):
+        quantities[item["product_id"]] += _item_stock_taken(item)
+    quantities = +quantities  # drops products nothing was taken from
+    done = set(claimed.get("stock_restored_products") or [])
+
+    restocked = 0
+    for product_id, quantity in quantities.items():
+        if product_id in done:
+            continue
+        if await _restock_product(claimed, product_id, quantity, performed_by):
+            restocked += 1
+        await orders_db.orders.update_one({"id": order["id"]}, {"$addToSet": {"stock_restored_products": product_id}})
+        invalidate_product_detail(product_id)
+
+    restored_at = datetime.now(timezone.utc)
+    # Only while the claim is still ours: past the lease another worker has taken over and finishes
+    result = await orders_db.orders.update_one(
+        {"id": order["id"], "restock_claimed_at": now},
+        {"$set": {"stock_restored_at": restored_at, "stock_restore_pending": False}}
+    )
+    if result.matched_count:
+        order["stock_restored_at"] = restored_at
+        order["stock_restore_pending"] = False
+    return restocked
+
+
+async def _restock_product(order: Dict[str, Any], product_id: str, quantity: int, performed_by: Optional[str]) -> bool:
+    """Add one product's quantity back, at most once per order; False if it was already added or is not tracked"""
+    reason = f"Annulation commande #{order['order_number']}"
+    # The order id is pushed in the same write as the increment, so a retry cannot add the stock twice
+    product = await orders_db.products.find_one_and_update(
+        {"id": product_id, "track_inventory": {"$ne": False}, "restocked_orders": {"$ne": order["id"]}},
+        {
+            "$inc": {"stock_quantity": quantity},
+            "$push": {"restocked_orders": {"$each": [order["id"]], "$slice": -RESTOCK_MARKERS}},
+        },
+        projection={"_id": 0, "stock_quantity": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    applied = product is not None
+    if not applied:
+        product = await orders_db.products.find_one(
+            {"id": product_id, "track_inventory": {"$ne": False}, "restocked_orders": order["id"]},
+            {"_id": 0, "stock_quantity": 1}
+        )
+        if product is None:
+            return False
+    # Pipeline update so in_stock and the low-stock flags follow the new level; safe to repeat
+    await orders_db.products.update_one({"id": product_id}, [{"$set": {
+        "in_stock": {"$or": [{"$gt": ["$stock_quantity", 0]}, {"$ifNull": ["$allow_backorder", False]}]},
+        "is_low_stock": LOW_STOCK_EXPR,
+        # Re-arm the alert when the restock lifts the product above its threshold
+        "low_stock_notified": {"$cond": [LOW_STOCK_EXPR, {"$ifNull": ["$low_stock_notified", False]}, False]},
+    }}])
+    # A retry after a crash right after the increment still logs it, once: (product_id, created_at) index
+    if applied or not await orders_db.stock_adjustments.find_one({"product_id": product_id, "reason": reason}, {"_id": 1}):
+        await orders_db.stock_adjustments.insert_one(StockAdjustment(
+            product_id=product_id,
+            adjustment_type="order",
+            quantity=quantity,
+            stock_after=product.get("stock_quantity", 0),
+            reason=reason,
+            notes="Réintégré après annulation",
+            performed_by=performed_by
+        ).model_dump())
+    return applied
+
+
+async def restock_cancelled_orders() -> int:
+    """Finish restocks a crash interrupted; returns the number of orders restocked"""
+    cutoff = datetime.now(timezone.utc) - RESTOCK_LEASE
+    restocked = 0
+    # Partial index on stock_restore_pending; orders cancelled moments ago are still being restocked by their request
+    async for order in orders_db.orders.find(
+        {"stock_restore_pending": True, "updated_at": {"$lt": cutoff}},
+        {"_id": 0, "id": 1}
+    ):
+        try:
+            await restore_order_stock(order, "system")
+            if order.get("stock_restored_at"):
+                restocked += 1
+        except Exception as e:
+            logger.error(f"Error restocking cancelled order {order['id']}: {str(e)}")
+    if restocked:
+        logger.warning(f"Restocked {restocked} cancelled order(s) left pending")
+    return restocked
@@ -0,0 +1,213 @@
+"""
+Admin order search
+
+Every filter is served by an index (see create_indexes in server.py):
+
+- status, payment_status, promo_code, customer_email: equality, each with
+  a compound (field, created_at) index
+- order_number: prefix match, an anchored regex on its unique index
+- created_from / created_to: range on created_at
+- q: words matched as prefixes against ``search_terms``, a multikey array
+  of normalised (lowercase, accents stripped) words from customer_name
+  and shipping_city, written with the order and backfilled for older ones
+
+Results are sorted on created_at or total with id as a tie-breaker and
+paginated by keyset: the opaque cursor carries the last (value, id), so
+page 1000 costs the same as page 1. Totals come from
+estimated_document_count() without filters and from a count capped at
+COUNT_LIMIT with them.
+"""
+import re
+import json
+import base64
+import logging
+import unicodedata
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pymongo import UpdateOne, UpdateMany
+
+from core import db
+
+logger = logging.getLogger(__name__)
+
+SORT_FIELDS = {"created_at", "total"}
+# Fields of models.OrderSummary
+ORDER_SUMMARY_PROJECTION = {
+    "_id": 0, "id": 1, "order_number": 1, "items": 1, "subtotal": 1, "shipping_cost": 1,
+    "discount_amount": 1, "total": 1, "shipping_address": 1, "shipping_city": 1,
+    "shipping_postal_code": 1, "payment_method": 1, "payment_status": 1, "status": 1,
+    "notes": 1, "created_at": 1,
+}
+COUNT_LIMIT = 10000
+BATCH_SIZE = 1000
+_WORD = re.compile(r"[a-z0-9؀-ۿ]+")
+
+
+def normalize_words(text: Optional[str]) -> List[str]:
+    """Lowercase words without accents: "Béjaïa" -> ["bejaia"]"""
+    if not text:
+        return []
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WORD.findall(stripped)
+
+
+def order_search_terms(order: Dict[str, Any]) -> List[str]:
+    words = normalize_words(order.get("customer_name")) + normalize_words(order.get("shipping_city"))
+    return sorted(set(words))
+
+
+async def backfill_order_search_terms() -> int:
+    """Write search_terms on orders created before the field existed"""
+    updated = 0
+    operations = []
+    async for order in db.orders.find(
+        {"search_terms": {"$exists": False}},
+        {"_id": 0, "id": 1, "customer_name": 1, "shipping_city": 1}
+    ):
+        operations.append(UpdateOne({"id": order["id"]}, {"$set": {"search_terms": order_search_terms(order)}}))
+        if len(operations) >= BATCH_SIZE:
+            await db.orders.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+    if operations:
+        await db.orders.bulk_write(operations, ordered=False)
+        updated += len(operations)
+    return updated
+
+
+async def link_orders_to_users(batch_size: int = 500) -> int:
+    """Stamp user_id on orders placed before checkout linked them, matching on the account email"""
+    linked = 0
+    users = []
+    async for user in db.users.find({}, {"_id": 0, "id": 1, "email": 1}, batch_size=batch_size):
+        users.append(user)
+        if len(users) >= batch_size:
+            linked += await _link_batch(users)
+            users = []
+    if users:
+        linked += await _link_batch(users)
+    return linked
+
+
+async def _link_batch(users: List[Dict[str, Any]]) -> int:
+    # (customer_email, created_at, id) index; user_id None also matches orders without the field
+    result = await db.orders.bulk_write(
+        [UpdateMany({"customer_email": user["email"], "user_id": None}, {"$set": {"user_id": user["id"]}}) for user in users],
+        ordered=False
+    )
+    return result.modified_count
+
+
+def encode_cursor(value: Any, order_id: str) -> str:
+    payload = {"v": value.isoformat() if isinstance(value, datetime) else value, "id": order_id, "d": isinstance(value, datetime)}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        value = datetime.fromisoformat(payload["v"]) if payload["d"] else payload["v"]
+        return value, payload["id"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def build_order_filter(
+    status: Optional[str] = None,
+    payment_status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    promo_code: Optional[str] = None,
+    customer_email: Optional[str] = None,
+    order_number: Optional[str] = None,
+    q: Optional[str] = None
+) -> Dict[str, Any]:
+    query: Dict[str, Any] = {}
+    if status:
+        query["status"] = status
+    if payment_status:
+        query["payment_status"] = payment_status
+    if created_from or created_to:
+        query["created_at"] = {}
+        if created_from:
+            query["created_at"]["$gte"] = created_from
+        if created_to:
+            query["created_at"]["$lt"] = created_to
+    if promo_code:
+        query["promo_code"] = promo_code.strip().upper()
+    if customer_email:
+        query["customer_email"] = customer_email.strip()
+    if order_number:
+        # Anchored and case-sensitive, so the order_number index serves it as a range
+        query["order_number"] = {"$regex": f"^{re.escape(order_number.strip().upper())}"}
+    words = normalize_words(q)
+    if words:
+        query["$and"] = [{"search_terms": {"$regex": f"^{re.escape(word)}"}} for word in words]
+    return query
+
+
+async def search_orders(
+    query: Dict[str, Any],
+    sort: str = "-created_at",
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, int]] = None,
+    count: bool = True
+) -> Dict[str, Any]:
+    """
+    One page of orders matching ``query``
+
+    Args:
+        query: Filter from build_order_filter()
+        sort: created_at or total, prefixed with - for descending
+        limit: Page size
+        cursor: next_cursor of the previous page
+        projection: Fields to return (default: all but search_terms); must include the sort field and id
+        count: Also return total and total_exact
+
+    Returns:
+        dict: items, next_cursor (None on the last page), total and total_exact
+    """
+    descending = sort.startswith("-")
+    field = sort.lstrip("-")
+    if field not in SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Sort must be one of: {', '.join(sorted(SORT_FIELDS))}")
+    direction = -1 if descending else 1
+
+    page_query = query
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        beyond = "$lt" if descending else "$gt"
+        page_query = {"$and": [query, {"$or": [
+            {field: {beyond: value}},
+            {field: value, "id": {beyond: last_id}},
+        ]}]}
+
+    items = await db.orders.find(page_query, projection or {"_id": 0, "search_terms": 0}).sort(
+        [(field, direction), ("id", direction)]
+    ).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1][field], items[-1]["id"])
+
+    if not count:
+        return {"items": items, "next_cursor": next_cursor}
+    if query:
+        total = await db.orders.count_documents(query, limit=COUNT_LIMIT)
+        total_exact = total < COUNT_LIMIT
+    else:
+        total = await db.orders.estimated_document_count()
+        total_exact = False
+    return {"items": items, "next_cursor": next_cursor, "total": total, "total_exact": total_exact}
+
+
+async def count_orders_by_status(statuses: List[str]) -> Dict[str, int]:
+    """Per-status counts, each one a count over the (status, created_at) index"""
+    counts = {}
+    for status in statuses:
+        counts[status] = await db.orders.count_documents({"status": status})
+    return counts
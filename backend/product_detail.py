@@ -0,0 +1,93 @@
+"""
+Product page data in one request
+
+get_product_detail() returns the product with its category, its review
+summary (the rating stats kept on the product plus the latest approved
+testimonials) and a few related products: in stock, from the same
+category first, then from the same origin. After the product read, the
+other lookups run concurrently, each on an index.
+
+Results are cached per product for PRODUCT_DETAIL_CACHE_TTL_SECONDS.
+Product writes clear the whole cache, since a product can appear among
+any other product's related items; testimonial writes and the stock
+changes of orders and cancellations drop only their products' entries
+(related lists elsewhere catch up within the TTL). The cache is per
+worker, so other workers catch up within the TTL too, like menu_cache.
+Entries are filled from the primary: right after an invalidation a
+lagging secondary would put the pre-write data back for a whole TTL.
+"""
+import os
+import asyncio
+from typing import Dict, Any, List, Optional
+
+from cache import TTLCache
+from core import db
+
+RELATED_LIMIT = 12  # Most related products a request can ask for; the cached entry holds this many
+RECENT_REVIEWS = 5
+
+product_detail_cache = TTLCache(
+    ttl_seconds=float(os.environ.get('PRODUCT_DETAIL_CACHE_TTL_SECONDS', 60)),
+    maxsize=int(os.environ.get('PRODUCT_DETAIL_CACHE_SIZE', 2048))
+)
+
+_REVIEW_PROJECTION = {"_id": 0, "id": 1, "customer_name": 1, "rating": 1, "comment": 1, "approved_at": 1}
+
+
+def invalidate_product_detail(product_id: Optional[str] = None) -> None:
+    """Drop one product's entry, or every entry when product_id is None"""
+    product_detail_cache.invalidate(product_id)
+
+
+async def _related_products(product: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # (category, rating_avg) index
+    related = await db.products.find(
+        {"category": product["category"], "in_stock": True, "id": {"$ne": product["id"]}},
+        {"_id": 0}
+    ).sort("rating_avg", -1).limit(RELATED_LIMIT).to_list(RELATED_LIMIT)
+    origin = (product.get("origin") or {}).get("fr")
+    if origin and len(related) < RELATED_LIMIT:
+        # ("origin.fr", rating_avg) index; the French name is always set
+        missing = RELATED_LIMIT - len(related)
+        related += await db.products.find(
+            {
+                "origin.fr": origin,
+                "in_stock": True,
+                "category": {"$ne": product["category"]},
+                "id": {"$ne": product["id"]},
+            },
+            {"_id": 0}
+        ).sort("rating_avg", -1).limit(missing).to_list(missing)
+    return related
+
+
+async def get_product_detail(product_id: str) -> Optional[Dict[str, Any]]:
+    """Product, category, reviews and up to RELATED_LIMIT related products; None if the product does not exist"""
+    detail = product_detail_cache.get(product_id)
+    if detail is not None:
+        return detail
+
+    product = await db.products.find_one({"id": product_id}, {"_id": 0})
+    if product is None:
+        return None
+    category, recent, related = await asyncio.gather(
+        db.categories.find_one({"slug": product["category"], "is_active": True}, {"_id": 0}),
+        # (product_id, is_approved, approved_at) index
+        db.testimonials.find(
+            {"product_id": product_id, "is_approved": True}, _REVIEW_PROJECTION
+        ).sort("approved_at", -1).limit(RECENT_REVIEWS).to_list(RECENT_REVIEWS),
+        _related_products(product),
+    )
+    detail = {
+        "product": product,
+        "category": category,
+        "reviews": {
+            "rating_count": product.get("rating_count", 0),
+            "rating_avg": product.get("rating_avg", 0.0),
+            "rating_histogram": product.get("rating_histogram") or {},
+            "recent": recent,
+        },
+        "related": related,
+    }
+    product_detail_cache.set(product_id, detail)
+    return detail
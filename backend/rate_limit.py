@@ -0,0 +1,233 @@
+"""
+Rate limiting and load shedding for the public write endpoints.
+
+- RateLimiter: token buckets keyed by client IP or email. Buckets live in
+  memory (per worker) or, with RATE_LIMIT_BACKEND=mongo, in the
+  ``rate_limits`` collection so all workers share one budget.
+- LoadSheddingMiddleware: caps concurrent requests on guarded routes and
+  answers 503 + Retry-After once the wait queue is full.
+"""
+import os
+import math
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Optional, Tuple, Iterable
+
+from fastapi import HTTPException, Request
+from pymongo import ReturnDocument
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    capacity: int  # burst size
+    refill_per_second: float  # sustained rate
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimitPolicy":
+        """Parse "<capacity>/<seconds>", e.g. "5/60" = burst of 5, 5 tokens per minute"""
+        capacity, seconds = spec.split("/")
+        return cls(capacity=int(capacity), refill_per_second=int(capacity) / float(seconds))
+
+
+# Defaults, overridable with RATE_LIMIT_<NAME>="<capacity>/<seconds>"
+DEFAULT_POLICIES = {
+    "login": "10/60",
+    "login_email": "5/300",
+    "refresh": "30/60",
+    "orders": "5/60",
+    "contact": "3/300",
+    "testimonials": "3/300",
+    "newsletter": "3/300",
+    "promo_validate": "10/60",
+}
+
+
+def load_policies() -> Dict[str, RateLimitPolicy]:
+    return {
+        name: RateLimitPolicy.parse(os.environ.get(f"RATE_LIMIT_{name.upper()}", spec))
+        for name, spec in DEFAULT_POLICIES.items()
+    }
+
+
+def client_ip(request: Request) -> str:
+    """
+    Client address, honouring X-Forwarded-For set by our own proxies
+
+    RATE_LIMIT_PROXY_HOPS is the number of trusted proxies in front of the
+    app; the entry they appended is used so clients cannot spoof it.
+    """
+    hops = int(os.environ.get('RATE_LIMIT_PROXY_HOPS', 1))
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded and hops > 0:
+        addresses = [a.strip() for a in forwarded.split(",") if a.strip()]
+        if addresses:
+            return addresses[-min(hops, len(addresses))]
+    return request.client.host if request.client else "unknown"
+
+
+class _MemoryBuckets:
+    def __init__(self, maxsize: int = 100000):
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+
+    def take(self, key: str, policy: RateLimitPolicy) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (policy.capacity, now))
+            tokens = min(policy.capacity, tokens + (now - updated) * policy.refill_per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (1 - tokens) / policy.refill_per_second
+
+
+class _MongoBuckets:
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def take(self, key: str, policy: RateLimitPolicy) -> Tuple[bool, float]:
+        now = datetime.now(timezone.utc)
+        elapsed_seconds = {"$divide": [{"$subtract": [now, {"$ifNull": ["$updated_at", now]}]}, 1000]}
+        refilled = {"$min": [
+            policy.capacity,
+            {"$add": [{"$ifNull": ["$tokens", policy.capacity]}, {"$multiply": [elapsed_seconds, policy.refill_per_second]}]}
+        ]}
+        # Refill and take a token atomically in a single pipeline update
+        doc = await self.collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"tokens": refilled, "updated_at": now}},
+                {"$set": {"allowed": {"$gte": ["$tokens", 1]}}},
+                {"$set": {
+                    "tokens": {"$cond": ["$allowed", {"$subtract": ["$tokens", 1]}, "$tokens"]},
+                    "expires_at": now + timedelta(seconds=policy.capacity / policy.refill_per_second),
+                }},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if doc["allowed"]:
+            return True, 0.0
+        return False, (1 - doc["tokens"]) / policy.refill_per_second
+
+
+class RateLimiter:
+    def __init__(self, policies: Dict[str, RateLimitPolicy], collection=None, enabled: bool = True):
+        self.policies = policies
+        self.enabled = enabled
+        self._memory = _MemoryBuckets()
+        self._mongo = _MongoBuckets(collection) if collection is not None else None
+
+    async def hit(self, policy_name: str, key: str) -> Tuple[bool, float]:
+        """
+        Consume one token from the bucket ``policy_name:key``
+
+        Returns:
+            (allowed, retry_after_seconds)
+        """
+        if not self.enabled:
+            return True, 0.0
+        policy = self.policies[policy_name]
+        bucket_key = f"{policy_name}:{key}"
+        if self._mongo is not None:
+            try:
+                return await self._mongo.take(bucket_key, policy)
+            except Exception as e:
+                # Never fail a request because the shared counter store is unavailable
+                logger.warning(f"Shared rate limit store unavailable, using local buckets: {e}")
+        return self._memory.take(bucket_key, policy)
+
+    async def enforce(self, policy_name: str, key: str) -> None:
+        allowed, retry_after = await self.hit(policy_name, key)
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests, please retry later",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+
+    def limit(self, policy_name: str):
+        """FastAPI dependency limiting a route per client IP"""
+        async def dependency(request: Request):
+            await self.enforce(policy_name, client_ip(request))
+        return dependency
+
+
+class LoadSheddingMiddleware:
+    """
+    Concurrency limiter for selected routes
+
+    At most ``max_concurrent`` guarded requests run at once; up to
+    ``max_queue`` more wait (no longer than ``queue_timeout`` seconds).
+    Anything beyond that is rejected with 503 and Retry-After.
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: Iterable[str],
+        methods: Iterable[str] = ("POST",),
+        max_concurrent: int = 32,
+        max_queue: int = 64,
+        queue_timeout: float = 5.0,
+        retry_after: int = 2
+    ):
+        self.app = app
+        self.paths = set(paths)
+        self.methods = set(methods)
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.waiting = 0
+        self.shed_count = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.methods or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            await self._shed(scope, receive, send)
+            return
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            await self._shed(scope, receive, send)
+            return
+        finally:
+            self.waiting -= 1
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._semaphore.release()
+
+    async def _shed(self, scope, receive, send):
+        self.shed_count += 1
+        logger.warning(f"Load shedding {scope['method']} {scope['path']} (waiting={self.waiting}, shed={self.shed_count})")
+        response = JSONResponse(
+            status_code=503,
+            content={"detail": "Service temporarily overloaded, please retry"},
+            headers={"Retry-After": str(self.retry_after)}
+        )
+        await response(scope, receive, send)
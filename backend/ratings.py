@@ -0,0 +1,77 @@
+"""
+Denormalised per-product rating stats, maintained from approved testimonials
+"""
+from pymongo import UpdateOne, UpdateMany
+from typing import Dict, Any
+import logging
+from core import db
+
+logger = logging.getLogger(__name__)
+
+def _rating_stats_pipeline(count_expr, sum_expr, histogram_expr):
+    """Pipeline update setting count/sum/histogram and deriving rating_avg in the same atomic write"""
+    return [
+        {"$set": {
+            "rating_count": count_expr,
+            "rating_sum": sum_expr,
+            "rating_histogram": histogram_expr,
+        }},
+        {"$set": {
+            "rating_avg": {"$cond": [
+                {"$gt": ["$rating_count", 0]},
+                {"$round": [{"$divide": ["$rating_sum", "$rating_count"]}, 2]},
+                0
+            ]}
+        }},
+    ]
+
+async def apply_rating_delta(testimonial: Dict[str, Any], delta: int):
+    """Add (delta=1) or remove (delta=-1) an approved testimonial from its product's rating stats"""
+    product_id = testimonial.get("product_id")
+    if not product_id:
+        return
+    rating = int(testimonial["rating"])
+    histogram = {str(i): {"$ifNull": [f"$rating_histogram.{i}", 0]} for i in range(1, 6)}
+    histogram[str(rating)] = {"$add": [histogram[str(rating)], delta]}
+    await db.products.update_one(
+        {"id": product_id},
+        _rating_stats_pipeline(
+            {"$add": [{"$ifNull": ["$rating_count", 0]}, delta]},
+            {"$add": [{"$ifNull": ["$rating_sum", 0]}, delta * rating]},
+            histogram
+        )
+    )
+
+async def reconcile_rating_stats() -> int:
+    """Rebuild rating stats for all products from approved testimonials, fixing any drift"""
+    rows = await db.testimonials.aggregate([
+        {"$match": {"is_approved": True, "product_id": {"$ne": None}}},
+        {"$group": {"_id": {"product_id": "$product_id", "rating": "$rating"}, "count": {"$sum": 1}}},
+    ]).to_list(None)
+    
+    stats: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        product_stats = stats.setdefault(
+            row["_id"]["product_id"],
+            {"rating_count": 0, "rating_sum": 0, "rating_histogram": {str(i): 0 for i in range(1, 6)}}
+        )
+        rating = int(row["_id"]["rating"])
+        product_stats["rating_count"] += row["count"]
+        product_stats["rating_sum"] += rating * row["count"]
+        product_stats["rating_histogram"][str(rating)] += row["count"]
+    
+    operations = []
+    for product_id, product_stats in stats.items():
+        product_stats["rating_avg"] = round(product_stats["rating_sum"] / product_stats["rating_count"], 2)
+        operations.append(UpdateOne({"id": product_id}, {"$set": product_stats}))
+    # Products whose last approved testimonial disappeared
+    operations.append(UpdateMany(
+        {"id": {"$nin": list(stats)}, "rating_count": {"$gt": 0}},
+        {"$set": {"rating_count": 0, "rating_sum": 0, "rating_avg": 0.0, "rating_histogram": {}}}
+    ))
+    
+    modified = 0
+    for start in range(0, len(operations), 1000):
+        result = await db.products.bulk_write(operations[start:start + 1000], ordered=False)
+        modified += result.modified_count
+    return modified
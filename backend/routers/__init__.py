@@ -0,0 +1,95 @@
+"""
+Per-domain API routers
+
+Each module exposes a ``router`` (APIRouter without prefix); server.py
+mounts them under /api in the order of ROUTER_MODULES. Modules are imported
+on demand, so ENABLED_ROUTERS="catalog,orders" starts a worker with only
+those domains loaded.
+"""
+import os
+import importlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import APIRouter
+from starlette.routing import Mount
+
+# Registration order matters: within a module, static paths are declared
+# before the parameterised ones they would otherwise be shadowed by
+ROUTER_MODULES = [
+    "auth",
+    "catalog",
+    "admin",
+    "settings",
+    "uploads",
+    "orders",
+    "contact",
+    "testimonials",
+    "navigation",
+    "newsletter",
+    "pages",
+    "customization",
+    "promo_codes",
+    "inventory",
+    "seo",
+    "jobs",
+    "system",
+]
+
+
+class RouteConflictError(RuntimeError):
+    """Two handlers are registered for the same method and path"""
+
+
+def enabled_router_modules() -> List[str]:
+    names = os.environ.get('ENABLED_ROUTERS', '').strip()
+    if not names:
+        return list(ROUTER_MODULES)
+    selected = [name.strip() for name in names.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in ROUTER_MODULES]
+    if unknown:
+        raise ValueError(f"Unknown router(s) in ENABLED_ROUTERS: {', '.join(unknown)}")
+    return [name for name in ROUTER_MODULES if name in selected]
+
+
+def load_routers(names: Optional[Iterable[str]] = None) -> List[APIRouter]:
+    """Import the requested router modules and return their routers in registration order"""
+    return [
+        importlib.import_module(f"{__name__}.{name}").router
+        for name in (enabled_router_modules() if names is None else names)
+    ]
+
+
+def _route_signature(path: str) -> str:
+    # /admin/orders/{order_id} and /admin/orders/{id} match the same requests
+    parts = path.split("/")
+    return "/".join("{}" if part.startswith("{") and part.endswith("}") else part for part in parts)
+
+
+def find_route_conflicts(routes) -> Dict[Tuple[str, str], List[str]]:
+    """
+    Group routes by (method, path template) and return the groups with more than one handler
+
+    Returns:
+        dict: {(method, path): ["module.handler", ...]}
+    """
+    handlers = defaultdict(list)
+    for route in routes:
+        if isinstance(route, Mount):
+            continue
+        methods = getattr(route, "methods", None) or []
+        endpoint = getattr(route, "endpoint", None)
+        name = f"{endpoint.__module__}.{endpoint.__name__}" if endpoint else getattr(route, "name", "?")
+        for method in methods:
+            if method == "HEAD":
+                continue
+            handlers[(method, _route_signature(route.path))].append(name)
+    return {key: names for key, names in handlers.items() if len(names) > 1}
+
+
+def check_route_conflicts(app) -> None:
+    """Fail fast at startup if a method + path is served by more than one handler"""
+    conflicts = find_route_conflicts(app.routes)
+    if conflicts:
+        lines = [f"{method} {path}: {', '.join(names)}" for (method, path), names in sorted(conflicts.items())]
+        raise RouteConflictError("Conflicting route registrations:\n  " + "\n  ".join(lines))
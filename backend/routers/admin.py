@@ -0,0 +1,73 @@
+"""
+Admin dashboard and user management routes
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List
+from datetime import datetime, timezone, timedelta
+from core import db, get_admin_user, revoke_user_sessions
+from models import User, UserUpdate, AdminStats
+
+router = APIRouter()
+
+# --- Admin Routes ---
+@router.get("/admin/stats", response_model=AdminStats)
+async def get_admin_stats(admin_user: User = Depends(get_admin_user)):
+    # Calculate statistics
+    total_users = await db.users.count_documents({})
+    total_products = await db.products.count_documents({})
+    total_historical_content = await db.historical_content.count_documents({})
+    total_contact_messages = await db.contact_messages.count_documents({})
+    
+    # Recent items (last 30 days)
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+    recent_users = await db.users.count_documents({"created_at": {"$gte": thirty_days_ago}})
+    recent_products = await db.products.count_documents({"created_at": {"$gte": thirty_days_ago}})
+    recent_contact_messages = await db.contact_messages.count_documents({"created_at": {"$gte": thirty_days_ago}})
+    
+    return AdminStats(
+        total_users=total_users,
+        total_products=total_products,
+        total_historical_content=total_historical_content,
+        total_contact_messages=total_contact_messages,
+        recent_users=recent_users,
+        recent_products=recent_products,
+        recent_contact_messages=recent_contact_messages
+    )
+
+@router.get("/admin/users", response_model=List[User])
+async def get_all_users(admin_user: User = Depends(get_admin_user)):
+    users = await db.users.find({}, {"_id": 0, "hashed_password": 0}).to_list(1000)
+    # Add back hashed_password as empty string for Pydantic model
+    for user in users:
+        user["hashed_password"] = ""
+    return [User(**user) for user in users]
+
+@router.put("/admin/users/{user_id}", response_model=User)
+async def update_user_admin(user_id: str, user_data: UserUpdate, admin_user: User = Depends(get_admin_user)):
+    user = await db.users.find_one({"id": user_id})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    update_data = {k: v for k, v in user_data.dict().items() if v is not None}
+    if update_data:
+        await db.users.update_one({"id": user_id}, {"$set": update_data})
+        # Tokens carry the role: make the user sign in again with the new one
+        if "role" in update_data or "is_active" in update_data:
+            await revoke_user_sessions(user_id)
+    
+    updated_user = await db.users.find_one({"id": user_id})
+    return User(**updated_user)
+
+@router.delete("/admin/users/{user_id}")
+async def delete_user_admin(user_id: str, admin_user: User = Depends(get_admin_user)):
+    user = await db.users.find_one({"id": user_id})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Prevent admin from deleting themselves
+    if user_id == admin_user.id:
+        raise HTTPException(status_code=400, detail="Cannot delete your own account")
+    
+    await db.users.delete_one({"id": user_id})
+    await revoke_user_sessions(user_id)
+    return {"message": "User deleted successfully"}
@@ -0,0 +1,167 @@
+"""
+Authentication and user profile routes
+"""
+from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, Optional
+from datetime import datetime, timezone, timedelta
+from core import (
+    db, rate_limiter, revocation_list, optional_security, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS,
+    verify_password, get_password_hash, create_user_access_token, get_token_claims, get_current_user,
+    revoke_user_sessions
+)
+from auth_tokens import issue_refresh_token, use_refresh_token, revoke_refresh_token
+from models import User, UserCreate, UserUpdate, UserLogin, Token, RefreshRequest
+
+router = APIRouter()
+
+# --- Authentication Routes ---
+@router.post("/auth/register", response_model=User)
+async def register(user_data: UserCreate):
+    # Check if user exists
+    existing_user = await db.users.find_one({"email": user_data.email})
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    # Create new user
+    hashed_password = get_password_hash(user_data.password)
+    user_dict = user_data.dict()
+    del user_dict["password"]
+    user_dict["hashed_password"] = hashed_password
+    
+    new_user = User(**user_dict)
+    # Insert the full user dict with hashed_password to database
+    user_dict_with_id = new_user.dict()
+    user_dict_with_id["hashed_password"] = hashed_password
+    await db.users.insert_one(user_dict_with_id)
+    # Orders placed as a guest before signing up show up in my-orders straight away
+    await db.orders.update_many(
+        {"customer_email": new_user.email, "user_id": None},
+        {"$set": {"user_id": new_user.id}}
+    )
+    return new_user
+
+@router.post("/auth/login", response_model=Token, dependencies=[Depends(rate_limiter.limit("login"))])
+async def login(user_credentials: UserLogin):
+    await rate_limiter.enforce("login_email", user_credentials.email.lower())
+    user = await db.users.find_one({"email": user_credentials.email})
+    # bcrypt is CPU-bound: keep it off the event loop
+    if not user or not await run_in_threadpool(verify_password, user_credentials.password, user["hashed_password"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return await issue_tokens(user)
+
+async def issue_tokens(user: dict, family_id: Optional[str] = None) -> dict:
+    """A new access token and refresh token pair (refresh rotation keeps the family)"""
+    refresh_token = await issue_refresh_token(
+        db.refresh_tokens, user["id"], timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS), family_id=family_id
+    )
+    return {
+        "access_token": create_user_access_token(user),
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+@router.post("/auth/refresh", response_model=Token, dependencies=[Depends(rate_limiter.limit("refresh"))])
+async def refresh_access_token(refresh_data: RefreshRequest):
+    """Swap a refresh token for a new pair; each refresh token works once"""
+    invalid_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    record = await use_refresh_token(db.refresh_tokens, refresh_data.refresh_token)
+    if record is None:
+        raise invalid_exception
+    # Read the user again so role and status changes apply from the next access token
+    user = await db.users.find_one({"id": record["user_id"]}, {"_id": 0, "hashed_password": 0})
+    if not user or not user.get("is_active", True):
+        raise invalid_exception
+    return await issue_tokens(user, family_id=record["family_id"])
+
+@router.post("/auth/logout")
+async def logout(
+    refresh_data: Optional[RefreshRequest] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
+    """End this session: revoke the access token and the refresh token's family"""
+    if refresh_data:
+        await revoke_refresh_token(db.refresh_tokens, refresh_data.refresh_token)
+    if credentials:
+        try:
+            claims = await get_token_claims(credentials)
+        except HTTPException:
+            claims = None  # already invalid
+        if claims and "jti" in claims:
+            await revocation_list.revoke_token(claims["jti"], datetime.fromtimestamp(claims["exp"], timezone.utc))
+    return {"message": "Logged out"}
+
+@router.get("/auth/me", response_model=User)
+async def read_users_me(current_user: User = Depends(get_current_user)):
+    user = await db.users.find_one({"id": current_user.id})
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return User(**user)
+
+# --- User Profile Routes ---
+@router.put("/users/me", response_model=User)
+async def update_user_profile(
+    user_update: UserUpdate,
+    current_user: User = Depends(get_current_user)
+):
+    """Update current user's profile"""
+    update_data = {}
+    
+    if user_update.full_name is not None:
+        update_data["full_name"] = user_update.full_name
+    
+    if update_data:
+        await db.users.update_one(
+            {"id": current_user.id},
+            {"$set": update_data}
+        )
+        
+    # Fetch updated user
+    updated_user = await db.users.find_one({"id": current_user.id})
+    return User(**updated_user)
+
+@router.put("/users/me/password")
+async def change_password(
+    password_data: Dict[str, str],
+    current_user: User = Depends(get_current_user)
+):
+    """Change current user's password"""
+    current_password = password_data.get("current_password")
+    new_password = password_data.get("new_password")
+    
+    if not current_password or not new_password:
+        raise HTTPException(
+            status_code=400,
+            detail="Both current and new passwords are required"
+        )
+    
+    # Verify current password
+    user_with_password = await db.users.find_one({"id": current_user.id})
+    if not verify_password(current_password, user_with_password.get("hashed_password")):
+        raise HTTPException(
+            status_code=400,
+            detail="Current password is incorrect"
+        )
+    
+    # Update password
+    hashed_password = get_password_hash(new_password)
+    await db.users.update_one(
+        {"id": current_user.id},
+        {"$set": {"hashed_password": hashed_password}}
+    )
+    
+    # Sign out every other session; this one continues with the new tokens
+    await revoke_user_sessions(current_user.id)
+    tokens = await issue_tokens(user_with_password)
+    return {"message": "Password changed successfully", **tokens}
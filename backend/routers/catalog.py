@@ -0,0 +1,325 @@
+"""
+Catalogue routes: categories, products and historical content
+"""
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from datetime import datetime, timezone
+from typing import List, Optional
+from core import db, catalog_db, menu_cache, get_current_user, get_admin_user, apply_reorder
+from stock_flags import low_stock_fields
+from upload_gc import sync_upload_refs
+from seo_snapshots import refresh_snapshots, remove_snapshots
+from product_detail import RELATED_LIMIT, get_product_detail, invalidate_product_detail
+from categories import (
+    invalidate_categories, resolve_category, validate_parent, adjust_product_count, build_category_tree
+)
+from models import (
+    User, Category, CategoryNode, CategoryCreate, CategoryUpdate, Product, ProductCreate, ProductUpdate, ProductDetail,
+    StockAdjustment, HistoricalContent, HistoricalContentCreate, HistoricalContentUpdate, ReorderItem
+)
+
+router = APIRouter()
+
+# --- Category Routes ---
+async def get_active_categories() -> List[dict]:
+    categories = menu_cache.get("categories")
+    if categories is None:
+        # Primary read: a lagging secondary would put the pre-invalidation list back for a whole TTL
+        categories = await db.categories.find({"is_active": True}, {"_id": 0}).sort("order", 1).to_list(1000)
+        menu_cache.set("categories", categories)
+    return categories
+
+@router.get("/categories", response_model=List[Category])
+async def get_categories():
+    """Get all active categories (public)"""
+    return [Category(**cat) for cat in await get_active_categories()]
+
+@router.get("/categories/tree", response_model=List[CategoryNode])
+async def get_category_tree():
+    """Active categories nested under their parents, with product counts including subcategories (public)"""
+    return build_category_tree(await get_active_categories())
+
+@router.get("/admin/categories", response_model=List[Category])
+async def get_all_categories_admin(admin: User = Depends(get_admin_user)):
+    """Get all categories including inactive (admin only)"""
+    categories = await db.categories.find({}, {"_id": 0}).sort("order", 1).to_list(1000)
+    return [Category(**cat) for cat in categories]
+
+@router.post("/admin/categories", response_model=Category)
+async def create_category(category_data: CategoryCreate, admin: User = Depends(get_admin_user)):
+    """Create a new category (admin only)"""
+    category_data.parent_id = category_data.parent_id or None
+    await validate_parent(None, category_data.parent_id)
+    if await db.categories.find_one({"slug": category_data.slug}, {"_id": 1}):
+        raise HTTPException(status_code=400, detail="Slug already used by another category")
+    category = Category(**category_data.model_dump())
+    # Products can already be filed under this slug: (category, rating_avg) index
+    category.product_count = await db.products.count_documents({"category": category.slug})
+    await db.categories.insert_one(category.model_dump())
+    await sync_upload_refs("categories", category.id)
+    invalidate_categories()
+    return category
+
+@router.post("/admin/categories/reorder")
+async def reorder_categories(
+    categories_order: List[ReorderItem],
+    admin: User = Depends(get_admin_user)
+):
+    """Reorder categories (admin only)"""
+    await apply_reorder(db.categories, categories_order, touch_updated_at=False)
+    menu_cache.invalidate("categories")
+    return {"message": "Categories reordered successfully"}
+
+@router.get("/admin/categories/{category_id}", response_model=Category)
+async def get_category_admin(category_id: str, admin: User = Depends(get_admin_user)):
+    """Get a specific category (admin only)"""
+    category = await db.categories.find_one({"id": category_id}, {"_id": 0})
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return Category(**category)
+
+@router.put("/admin/categories/{category_id}", response_model=Category)
+async def update_category(category_id: str, category_data: CategoryUpdate, admin: User = Depends(get_admin_user)):
+    """Update a category (admin only)"""
+    category = await db.categories.find_one({"id": category_id}, {"_id": 0})
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    
+    update_data = {k: v for k, v in category_data.model_dump().items() if v is not None}
+    if "parent_id" in update_data:
+        update_data["parent_id"] = update_data["parent_id"] or None
+        await validate_parent(category_id, update_data["parent_id"])
+    slug_changed = "slug" in update_data and update_data["slug"] != category["slug"]
+    if slug_changed and await db.categories.find_one({"slug": update_data["slug"]}, {"_id": 1}):
+        raise HTTPException(status_code=400, detail="Slug already used by another category")
+    if update_data:
+        await db.categories.update_one({"id": category_id}, {"$set": update_data})
+        if slug_changed:
+            # Products reference the category by slug
+            await db.products.update_many({"category": category["slug"]}, {"$set": {"category": update_data["slug"]}})
+        await sync_upload_refs("categories", category_id)
+        category.update(update_data)
+        invalidate_categories()
+        # Product pages embed their category
+        invalidate_product_detail()
+    
+    return Category(**category)
+
+@router.delete("/admin/categories/{category_id}")
+async def delete_category(category_id: str, admin: User = Depends(get_admin_user)):
+    """Delete a category (admin only)"""
+    category = await db.categories.find_one({"id": category_id}, {"_id": 0, "slug": 1, "product_count": 1})
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    
+    # Check if any products use this category: the maintained count, confirmed on the
+    # (category, rating_avg) index when it is 0 in case it drifted
+    products_count = category.get("product_count", 0)
+    if products_count == 0 and await db.products.find_one({"category": category["slug"]}, {"_id": 1}):
+        products_count = await db.products.count_documents({"category": category["slug"]})
+    if products_count > 0:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Cannot delete category. {products_count} product(s) are using this category."
+        )
+    if await db.categories.find_one({"parent_id": category_id}, {"_id": 1}):
+        raise HTTPException(status_code=400, detail="Cannot delete category. Move or delete its subcategories first.")
+    
+    await db.categories.delete_one({"id": category_id})
+    await sync_upload_refs("categories", category_id)
+    invalidate_categories()
+    
+    return {"message": "Category deleted successfully"}
+
+# --- Product Routes ---
+@router.get("/products", response_model=List[Product])
+async def get_products(
+    category: Optional[str] = None,
+    sort: Optional[str] = None,
+    min_rating: Optional[float] = None
+):
+    """List products, optionally filtered by category / minimum rating and sorted by rating (sort=rating_avg)"""
+    query = {"category": category} if category else {}
+    if min_rating is not None:
+        query["rating_avg"] = {"$gte": min_rating}
+    
+    cursor = catalog_db.products.find(query, {"_id": 0})
+    if sort == "rating_avg":
+        cursor = cursor.sort([("rating_avg", -1), ("rating_count", -1)])
+    elif sort is not None:
+        raise HTTPException(status_code=400, detail="Unsupported sort, expected 'rating_avg'")
+    
+    products = await cursor.to_list(1000)
+    return [Product(**product) for product in products]
+
+@router.post("/products", response_model=Product)
+async def create_product(
+    product_data: ProductCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
+):
+    await resolve_category(product_data.category)
+    product_dict = product_data.dict()
+    product_dict["created_by"] = current_user.id
+    product_dict.update(low_stock_fields(product_dict))
+    product = Product(**product_dict)
+    await db.products.insert_one(product.dict())
+    await adjust_product_count(product.category, 1)
+    await sync_upload_refs("products", product.id)
+    # Can be related to any product
+    invalidate_product_detail()
+    
+    # Opening balance for the stock ledger
+    if product.track_inventory:
+        opening = StockAdjustment(
+            product_id=product.id,
+            adjustment_type="set",
+            quantity=product.stock_quantity,
+            stock_after=product.stock_quantity,
+            reason="Création du produit",
+            performed_by=current_user.email
+        )
+        await db.stock_adjustments.insert_one(opening.model_dump())
+    background_tasks.add_task(refresh_snapshots, "product", product.id)
+    return product
+
+@router.get("/products/{product_id}", response_model=Product)
+async def get_product(product_id: str):
+    product = await catalog_db.products.find_one({"id": product_id}, {"_id": 0})
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return Product(**product)
+
+@router.get("/products/{product_id}/detail", response_model=ProductDetail)
+async def get_product_page(product_id: str, related: int = Query(4, ge=0, le=RELATED_LIMIT)):
+    """Product with its category, review summary and related products, for the product page (public)"""
+    detail = await get_product_detail(product_id)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return {**detail, "related": detail["related"][:related]}
+
+@router.put("/products/{product_id}", response_model=Product)
+async def update_product(
+    product_id: str,
+    product_data: ProductUpdate,
+    background_tasks: BackgroundTasks,
+    admin_user: User = Depends(get_admin_user)
+):
+    product = await db.products.find_one({"id": product_id})
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    update_data = {k: v for k, v in product_data.dict().items() if v is not None}
+    category_changed = "category" in update_data and update_data["category"] != product.get("category")
+    if category_changed:
+        await resolve_category(update_data["category"])
+    if update_data.keys() & {"stock_quantity", "low_stock_threshold", "track_inventory"}:
+        update_data.update(low_stock_fields({**product, **update_data}))
+    if update_data:
+        update_data["updated_at"] = datetime.now(timezone.utc)
+        query = {"id": product_id}
+        if category_changed:
+            # Only move the product (and its count) out of the category it was read in
+            query["category"] = product.get("category")
+        result = await db.products.update_one(query, {"$set": update_data})
+        if result.matched_count == 0:
+            if category_changed and await db.products.find_one({"id": product_id}, {"_id": 1}):
+                raise HTTPException(status_code=409, detail="Product was modified concurrently, please retry")
+            raise HTTPException(status_code=404, detail="Product not found")
+        await sync_upload_refs("products", product_id)
+        invalidate_product_detail()
+        background_tasks.add_task(refresh_snapshots, "product", product_id)
+    if category_changed:
+        await adjust_product_count(product.get("category"), -1)
+        await adjust_product_count(update_data["category"], 1)
+    
+    # Stock edited through the product form still goes through the ledger
+    if "stock_quantity" in update_data and update_data["stock_quantity"] != product.get("stock_quantity", 0):
+        adjustment = StockAdjustment(
+            product_id=product_id,
+            adjustment_type="set",
+            quantity=update_data["stock_quantity"],
+            stock_after=update_data["stock_quantity"],
+            reason="Modification du produit",
+            performed_by=admin_user.email
+        )
+        await db.stock_adjustments.insert_one(adjustment.model_dump())
+    
+    updated_product = await db.products.find_one({"id": product_id})
+    return Product(**updated_product)
+
+@router.delete("/products/{product_id}")
+async def delete_product(product_id: str, background_tasks: BackgroundTasks, admin_user: User = Depends(get_admin_user)):
+    product = await db.products.find_one({"id": product_id})
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    result = await db.products.delete_one({"id": product_id})
+    if result.deleted_count == 0:
+        # Deleted by a concurrent request, which decremented the count
+        raise HTTPException(status_code=404, detail="Product not found")
+    await adjust_product_count(product.get("category"), -1)
+    # The images become unreferenced; the upload GC removes them after its grace period
+    await sync_upload_refs("products", product_id)
+    invalidate_product_detail()
+    background_tasks.add_task(remove_snapshots, "product", product_id)
+    return {"message": "Product deleted successfully"}
+
+# --- Historical Content Routes ---
+@router.get("/historical-content", response_model=List[HistoricalContent])
+async def get_historical_content(region: Optional[str] = None):
+    query = {"region": region} if region else {}
+    content = await catalog_db.historical_content.find(query, {"_id": 0}).to_list(1000)
+    return [HistoricalContent(**item) for item in content]
+
+@router.get("/historical-content/{content_id}", response_model=HistoricalContent)
+async def get_historical_content_item(content_id: str):
+    content = await catalog_db.historical_content.find_one({"id": content_id}, {"_id": 0})
+    if not content:
+        raise HTTPException(status_code=404, detail="Historical content not found")
+    return HistoricalContent(**content)
+
+@router.post("/historical-content", response_model=HistoricalContent)
+async def create_historical_content(
+    content_data: HistoricalContentCreate,
+    background_tasks: BackgroundTasks,
+    admin_user: User = Depends(get_admin_user)
+):
+    content_dict = content_data.dict()
+    content_dict["created_by"] = admin_user.id
+    content = HistoricalContent(**content_dict)
+    await db.historical_content.insert_one(content.dict())
+    await sync_upload_refs("historical_content", content.id)
+    background_tasks.add_task(refresh_snapshots, "history", content.id)
+    return content
+
+@router.put("/historical-content/{content_id}", response_model=HistoricalContent)
+async def update_historical_content(
+    content_id: str,
+    content_data: HistoricalContentUpdate,
+    background_tasks: BackgroundTasks,
+    admin_user: User = Depends(get_admin_user)
+):
+    content = await db.historical_content.find_one({"id": content_id})
+    if not content:
+        raise HTTPException(status_code=404, detail="Historical content not found")
+    
+    update_data = {k: v for k, v in content_data.dict().items() if v is not None}
+    if update_data:
+        update_data["updated_at"] = datetime.now(timezone.utc)
+        await db.historical_content.update_one({"id": content_id}, {"$set": update_data})
+        await sync_upload_refs("historical_content", content_id)
+        background_tasks.add_task(refresh_snapshots, "history", content_id)
+    
+    updated_content = await db.historical_content.find_one({"id": content_id})
+    return HistoricalContent(**updated_content)
+
+@router.delete("/historical-content/{content_id}")
+async def delete_historical_content(content_id: str, background_tasks: BackgroundTasks, admin_user: User = Depends(get_admin_user)):
+    content = await db.historical_content.find_one({"id": content_id})
+    if not content:
+        raise HTTPException(status_code=404, detail="Historical content not found")
+    
+    await db.historical_content.delete_one({"id": content_id})
+    await sync_upload_refs("historical_content", content_id)
+    background_tasks.add_task(remove_snapshots, "history", content_id)
+    return {"message": "Historical content deleted successfully"}
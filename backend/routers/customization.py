@@ -0,0 +1,64 @@
+"""
+Site customization routes
+"""
+from fastapi import APIRouter, Depends
+from datetime import datetime, timezone
+from core import db, get_admin_user
+from models import User, SiteCustomization, CustomizationUpdate
+from upload_gc import sync_upload_refs
+
+router = APIRouter()
+
+# --- Customization Routes ---
+@router.get("/customization", response_model=SiteCustomization)
+async def get_customization():
+    """Get site customization settings (public)"""
+    customization = await db.customization.find_one({"id": "site_customization"}, {"_id": 0})
+    
+    if not customization:
+        # Return default values if not found
+        default_customization = SiteCustomization()
+        await db.customization.insert_one(default_customization.model_dump())
+        return default_customization
+    
+    return SiteCustomization(**customization)
+
+@router.get("/admin/customization")
+async def get_customization_admin(admin: User = Depends(get_admin_user)):
+    """Get site customization settings (admin only)"""
+    customization = await db.customization.find_one({"id": "site_customization"}, {"_id": 0})
+    
+    if not customization:
+        default_customization = SiteCustomization()
+        await db.customization.insert_one(default_customization.model_dump())
+        return default_customization.model_dump()
+    
+    return customization
+
+@router.put("/admin/customization", response_model=SiteCustomization)
+async def update_customization(
+    customization_data: CustomizationUpdate,
+    admin: User = Depends(get_admin_user)
+):
+    """Update site customization (admin only)"""
+    # Get existing customization or create default
+    existing = await db.customization.find_one({"id": "site_customization"}, {"_id": 0})
+    
+    if not existing:
+        existing = SiteCustomization().model_dump()
+        await db.customization.insert_one(existing)
+    
+    # Update with new data
+    update_data = {k: v for k, v in customization_data.model_dump().items() if v is not None}
+    update_data["updated_at"] = datetime.now(timezone.utc)
+    
+    if update_data:
+        await db.customization.update_one(
+            {"id": "site_customization"},
+            {"$set": update_data}
+        )
+        await sync_upload_refs("customization", "site_customization")
+    
+    # Return updated customization
+    updated = await db.customization.find_one({"id": "site_customization"}, {"_id": 0})
+    return SiteCustomization(**updated)
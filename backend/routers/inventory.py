@@ -0,0 +1,141 @@
+"""
+Stock management routes
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional
+from datetime import datetime
+from core import db, get_admin_user
+from models import User, Product, StockAdjustment, StockAdjustmentRequest
+from stock_flags import low_stock_fields
+from product_detail import invalidate_product_detail
+from stock_ledger import take_stock_snapshots, stock_at, detect_stock_drift, compact_stock_adjustments
+
+router = APIRouter()
+
+# --- Stock Management Routes ---
+@router.get("/admin/inventory", response_model=List[Product])
+async def get_inventory_overview(admin: User = Depends(get_admin_user)):
+    """Get all products with inventory information (admin only)"""
+    products = await db.products.find({}, {"_id": 0}).sort("name.fr", 1).to_list(1000)
+    return [Product(**product) for product in products]
+
+@router.get("/admin/inventory/low-stock", response_model=List[Product])
+async def get_low_stock_products(admin: User = Depends(get_admin_user)):
+    """Get products with low stock (admin only)"""
+    products = await db.products.find(
+        {"is_low_stock": True},
+        {"_id": 0}
+    ).sort("stock_quantity", 1).to_list(1000)
+    return [Product(**product) for product in products]
+
+@router.post("/admin/inventory/{product_id}/adjust")
+async def adjust_stock(
+    product_id: str,
+    adjustment: StockAdjustmentRequest,
+    admin: User = Depends(get_admin_user)
+):
+    """Adjust stock for a product (admin only)"""
+    product = await db.products.find_one({"id": product_id}, {"_id": 0})
+    if not product:
+        raise HTTPException(status_code=404, detail="Produit non trouvé")
+    
+    current_stock = product.get('stock_quantity', 0)
+    
+    # Calculate new stock based on adjustment type
+    if adjustment.adjustment_type == "set":
+        new_stock = adjustment.quantity
+    elif adjustment.adjustment_type == "increase":
+        new_stock = current_stock + adjustment.quantity
+    elif adjustment.adjustment_type == "decrease":
+        new_stock = max(0, current_stock - adjustment.quantity)
+    else:
+        raise HTTPException(status_code=400, detail="Type d'ajustement invalide")
+    
+    # Update product stock
+    allow_backorder = product.get('allow_backorder', False)
+    await db.products.update_one(
+        {"id": product_id},
+        {
+            "$set": {
+                "stock_quantity": new_stock,
+                "in_stock": new_stock > 0 or allow_backorder,
+                **low_stock_fields({**product, "stock_quantity": new_stock})
+            }
+        }
+    )
+    # in_stock decides where it shows up as a related product
+    invalidate_product_detail()
+    
+    # Log adjustment
+    stock_adjustment = StockAdjustment(
+        product_id=product_id,
+        adjustment_type=adjustment.adjustment_type,
+        quantity=adjustment.quantity if adjustment.adjustment_type == "set" else (
+            adjustment.quantity if adjustment.adjustment_type == "increase" else -adjustment.quantity
+        ),
+        stock_after=new_stock,
+        reason=adjustment.reason,
+        notes=adjustment.notes,
+        performed_by=admin.get('email') if isinstance(admin, dict) else admin.email
+    )
+    await db.stock_adjustments.insert_one(stock_adjustment.model_dump())
+    
+    # Return updated product
+    updated_product = await db.products.find_one({"id": product_id}, {"_id": 0})
+    return Product(**updated_product)
+
+@router.get("/admin/inventory/drift")
+async def get_stock_drift(admin: User = Depends(get_admin_user)):
+    """Products whose stock_quantity disagrees with the stock ledger (admin only)"""
+    return await detect_stock_drift()
+
+@router.post("/admin/inventory/snapshots")
+async def create_stock_snapshots(admin: User = Depends(get_admin_user)):
+    """Write today's stock snapshot for every product now (admin only)"""
+    written = await take_stock_snapshots()
+    return {"message": "Stock snapshots written", "products": written}
+
+@router.post("/admin/inventory/compact")
+async def compact_stock_history(
+    older_than_months: int = Query(12, ge=1),
+    admin: User = Depends(get_admin_user)
+):
+    """Roll old stock adjustments up into monthly summaries (admin only)"""
+    return await compact_stock_adjustments(older_than_months)
+
+@router.get("/admin/inventory/{product_id}/history")
+async def get_stock_history(
+    product_id: str,
+    before: Optional[datetime] = None,
+    after: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=500),
+    admin: User = Depends(get_admin_user)
+):
+    """Get stock adjustment history for a product, newest first; page with before=<created_at of last row> (admin only)"""
+    query = {"product_id": product_id}
+    if before or after:
+        query["created_at"] = {}
+        if before:
+            query["created_at"]["$lt"] = before
+        if after:
+            query["created_at"]["$gte"] = after
+    
+    adjustments = await db.stock_adjustments.find(
+        query,
+        {"_id": 0}
+    ).sort("created_at", -1).limit(limit).to_list(limit)
+    
+    return adjustments
+
+@router.get("/admin/inventory/{product_id}/stock-at")
+async def get_stock_at(product_id: str, at: datetime, admin: User = Depends(get_admin_user)):
+    """Stock level of a product at a point in time (admin only)"""
+    return await stock_at(product_id, at)
+
+@router.get("/admin/inventory/{product_id}/summaries")
+async def get_stock_summaries(product_id: str, admin: User = Depends(get_admin_user)):
+    """Monthly summaries of compacted stock adjustments (admin only)"""
+    return await db.stock_adjustment_summaries.find(
+        {"product_id": product_id},
+        {"_id": 0}
+    ).sort("month", -1).to_list(None)
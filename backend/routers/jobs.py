@@ -0,0 +1,34 @@
+"""
+Scheduled job routes: status, run history and manual triggers
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+from core import get_admin_user
+from jobs import scheduler
+from models import User
+
+router = APIRouter()
+
+# --- Scheduled Job Routes ---
+@router.get("/admin/jobs")
+async def get_jobs(admin: User = Depends(get_admin_user)):
+    """Registered jobs with their schedule, next run and last result (admin only)"""
+    return {
+        "leader": await scheduler.leader(),
+        "worker": scheduler.worker_id,
+        "jobs": await scheduler.status(),
+    }
+
+@router.get("/admin/jobs/runs")
+async def get_job_runs(job: Optional[str] = None, limit: int = 50, admin: User = Depends(get_admin_user)):
+    """Recent job runs, newest first, optionally for one job (admin only)"""
+    return await scheduler.history(job, min(max(limit, 1), 500))
+
+@router.post("/admin/jobs/{job_name}/run")
+async def trigger_job(job_name: str, admin: User = Depends(get_admin_user)):
+    """Queue a job to run on the leader's next tick (admin only)"""
+    try:
+        queued_at = await scheduler.trigger(job_name, admin.email)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"success": True, "job": job_name, "queued_at": queued_at}
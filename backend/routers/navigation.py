@@ -0,0 +1,205 @@
+"""
+Navigation menu, footer and banner routes
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List
+from datetime import datetime, timezone
+from core import db, menu_cache, get_admin_user, apply_reorder
+from upload_gc import sync_upload_refs
+from models import (
+    User, NavigationItem, NavigationItemCreate, NavigationItemUpdate, ReorderItem,
+    FooterSettings, FooterSettingsUpdate, Banner, BannerCreate, BannerUpdate
+)
+
+router = APIRouter()
+
+# --- Navigation Menu Routes ---
+@router.get("/navigation", response_model=List[NavigationItem])
+async def get_navigation_menu():
+    """Get active navigation items (public)"""
+    items = menu_cache.get("navigation")
+    if items is None:
+        # Primary read: a lagging secondary would put the pre-invalidation menu back for a whole TTL
+        items = await db.navigation.find({"is_active": True}, {"_id": 0}).sort("order", 1).to_list(1000)
+        menu_cache.set("navigation", items)
+    return [NavigationItem(**item) for item in items]
+
+@router.get("/admin/navigation", response_model=List[NavigationItem])
+async def get_all_navigation_items(admin: User = Depends(get_admin_user)):
+    """Get all navigation items including inactive (admin only)"""
+    items = await db.navigation.find({}, {"_id": 0}).sort("order", 1).to_list(1000)
+    return [NavigationItem(**item) for item in items]
+
+@router.post("/admin/navigation", response_model=NavigationItem)
+async def create_navigation_item(item_data: NavigationItemCreate, admin: User = Depends(get_admin_user)):
+    """Create a new navigation item (admin only)"""
+    item = NavigationItem(**item_data.model_dump())
+    await db.navigation.insert_one(item.model_dump())
+    menu_cache.invalidate("navigation")
+    return item
+
+@router.get("/admin/navigation/{item_id}", response_model=NavigationItem)
+async def get_navigation_item(item_id: str, admin: User = Depends(get_admin_user)):
+    """Get a specific navigation item (admin only)"""
+    item = await db.navigation.find_one({"id": item_id}, {"_id": 0})
+    if not item:
+        raise HTTPException(status_code=404, detail="Navigation item not found")
+    return NavigationItem(**item)
+
+@router.put("/admin/navigation/{item_id}", response_model=NavigationItem)
+async def update_navigation_item(
+    item_id: str,
+    item_data: NavigationItemUpdate,
+    admin: User = Depends(get_admin_user)
+):
+    """Update a navigation item (admin only)"""
+    item = await db.navigation.find_one({"id": item_id}, {"_id": 0})
+    if not item:
+        raise HTTPException(status_code=404, detail="Navigation item not found")
+    
+    update_dict = {k: v for k, v in item_data.model_dump().items() if v is not None}
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    
+    if update_dict:
+        await db.navigation.update_one({"id": item_id}, {"$set": update_dict})
+        item.update(update_dict)
+        menu_cache.invalidate("navigation")
+    
+    return NavigationItem(**item)
+
+@router.delete("/admin/navigation/{item_id}")
+async def delete_navigation_item(item_id: str, admin: User = Depends(get_admin_user)):
+    """Delete a navigation item (admin only)"""
+    result = await db.navigation.delete_one({"id": item_id})
+    
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Navigation item not found")
+    menu_cache.invalidate("navigation")
+    
+    return {"message": "Navigation item deleted successfully"}
+
+@router.post("/admin/navigation/reorder")
+async def reorder_navigation_items(
+    items_order: List[ReorderItem],
+    admin: User = Depends(get_admin_user)
+):
+    """Reorder navigation items (admin only)"""
+    # items_order format: [{"id": "...", "order": 0}, {"id": "...", "order": 1}, ...]
+    await apply_reorder(db.navigation, items_order)
+    menu_cache.invalidate("navigation")
+    
+    return {"message": "Navigation items reordered successfully"}
+
+# --- Footer Routes ---
+@router.get("/footer", response_model=FooterSettings)
+async def get_footer_settings():
+    """Get footer settings (public)"""
+    footer = await db.footer_settings.find_one({"id": "footer_config"}, {"_id": 0})
+    if not footer:
+        # Return default footer if none exists
+        default_footer = FooterSettings()
+        return default_footer
+    return FooterSettings(**footer)
+
+@router.put("/admin/footer", response_model=FooterSettings)
+async def update_footer_settings(
+    footer_data: FooterSettingsUpdate,
+    admin: User = Depends(get_admin_user)
+):
+    """Update footer settings (admin only)"""
+    footer = await db.footer_settings.find_one({"id": "footer_config"}, {"_id": 0})
+    
+    update_dict = {k: v for k, v in footer_data.model_dump().items() if v is not None}
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    
+    if footer:
+        await db.footer_settings.update_one(
+            {"id": "footer_config"},
+            {"$set": update_dict}
+        )
+        footer.update(update_dict)
+        return FooterSettings(**footer)
+    else:
+        # Create new footer settings
+        new_footer = FooterSettings(**update_dict)
+        await db.footer_settings.insert_one(new_footer.model_dump())
+        return new_footer
+
+# --- Banner/Slider Routes ---
+@router.get("/banners", response_model=List[Banner])
+async def get_active_banners():
+    """Get active banners (public)"""
+    banners = menu_cache.get("banners")
+    if banners is None:
+        # Primary read, as for the navigation menu
+        banners = await db.banners.find({"is_active": True}, {"_id": 0}).sort("order", 1).to_list(1000)
+        menu_cache.set("banners", banners)
+    return [Banner(**b) for b in banners]
+
+@router.get("/admin/banners", response_model=List[Banner])
+async def get_all_banners(admin: User = Depends(get_admin_user)):
+    """Get all banners including inactive (admin only)"""
+    banners = await db.banners.find({}, {"_id": 0}).sort("order", 1).to_list(1000)
+    return [Banner(**b) for b in banners]
+
+@router.post("/admin/banners", response_model=Banner)
+async def create_banner(banner_data: BannerCreate, admin: User = Depends(get_admin_user)):
+    """Create a new banner (admin only)"""
+    banner = Banner(**banner_data.model_dump())
+    await db.banners.insert_one(banner.model_dump())
+    await sync_upload_refs("banners", banner.id)
+    menu_cache.invalidate("banners")
+    return banner
+
+@router.get("/admin/banners/{banner_id}", response_model=Banner)
+async def get_banner(banner_id: str, admin: User = Depends(get_admin_user)):
+    """Get a specific banner (admin only)"""
+    banner = await db.banners.find_one({"id": banner_id}, {"_id": 0})
+    if not banner:
+        raise HTTPException(status_code=404, detail="Banner not found")
+    return Banner(**banner)
+
+@router.put("/admin/banners/{banner_id}", response_model=Banner)
+async def update_banner(
+    banner_id: str,
+    banner_data: BannerUpdate,
+    admin: User = Depends(get_admin_user)
+):
+    """Update a banner (admin only)"""
+    banner = await db.banners.find_one({"id": banner_id}, {"_id": 0})
+    if not banner:
+        raise HTTPException(status_code=404, detail="Banner not found")
+    
+    update_dict = {k: v for k, v in banner_data.model_dump().items() if v is not None}
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    
+    if update_dict:
+        await db.banners.update_one({"id": banner_id}, {"$set": update_dict})
+        await sync_upload_refs("banners", banner_id)
+        banner.update(update_dict)
+        menu_cache.invalidate("banners")
+    
+    return Banner(**banner)
+
+@router.delete("/admin/banners/{banner_id}")
+async def delete_banner(banner_id: str, admin: User = Depends(get_admin_user)):
+    """Delete a banner (admin only)"""
+    result = await db.banners.delete_one({"id": banner_id})
+    
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Banner not found")
+    await sync_upload_refs("banners", banner_id)
+    menu_cache.invalidate("banners")
+    
+    return {"message": "Banner deleted successfully"}
+
+@router.post("/admin/banners/reorder")
+async def reorder_banners(
+    banners_order: List[ReorderItem],
+    admin: User = Depends(get_admin_user)
+):
+    """Reorder banners (admin only)"""
+    await apply_reorder(db.banners, banners_order)
+    menu_cache.invalidate("banners")
+    
+    return {"message": "Banners reordered successfully"}
@@ -0,0 +1,195 @@
+"""
+Newsletter routes
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+from datetime import datetime, timezone
+from core import db, rate_limiter, get_admin_user
+from models import (
+    User, NewsletterSubscriber, NewsletterSubscribe, NewsletterSubscription, NewsletterCampaign, NewsletterCampaignCreate
+)
+from campaigns import campaign_progress
+from email_templates import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+from jobs import scheduler
+from upload_gc import sync_upload_refs
+
+router = APIRouter()
+
+# --- Newsletter Routes ---
+@router.post("/newsletter/subscribe", response_model=NewsletterSubscription, dependencies=[Depends(rate_limiter.limit("newsletter"))])
+async def subscribe_newsletter(subscriber_data: NewsletterSubscribe):
+    """Subscribe to newsletter (public)"""
+    if subscriber_data.language not in SUPPORTED_LANGUAGES:
+        subscriber_data.language = DEFAULT_LANGUAGE
+    
+    # Check if already subscribed
+    existing = await db.newsletter_subscribers.find_one({"email": subscriber_data.email}, {"_id": 0})
+    
+    if existing:
+        if existing.get("is_active"):
+            raise HTTPException(status_code=400, detail="Email already subscribed")
+        else:
+            # Reactivate subscription
+            reactivated = {"is_active": True, "language": subscriber_data.language, "subscribed_at": datetime.now(timezone.utc)}
+            await db.newsletter_subscribers.update_one(
+                {"email": subscriber_data.email},
+                {"$set": reactivated}
+            )
+            # The unsubscribe token only travels in newsletters sent to this address
+            return NewsletterSubscription(email=subscriber_data.email, **reactivated)
+    
+    subscriber = NewsletterSubscriber(**subscriber_data.model_dump())
+    await db.newsletter_subscribers.insert_one(subscriber.model_dump())
+    return NewsletterSubscription(**subscriber.model_dump())
+
+@router.get("/admin/newsletter/subscribers", response_model=List[NewsletterSubscriber])
+async def get_newsletter_subscribers(admin: User = Depends(get_admin_user)):
+    """Get all newsletter subscribers (admin only)"""
+    subscribers = await db.newsletter_subscribers.find({}, {"_id": 0}).sort("subscribed_at", -1).to_list(1000)
+    return [NewsletterSubscriber(**s) for s in subscribers]
+
+@router.delete("/admin/newsletter/subscribers/{subscriber_id}")
+async def delete_newsletter_subscriber(subscriber_id: str, admin: User = Depends(get_admin_user)):
+    """Delete a newsletter subscriber (admin only)"""
+    result = await db.newsletter_subscribers.delete_one({"id": subscriber_id})
+    
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Subscriber not found")
+    
+    return {"message": "Subscriber deleted successfully"}
+
+async def _unsubscribe(token: str):
+    result = await db.newsletter_subscribers.update_one(
+        {"unsubscribe_token": token},
+        {"$set": {"is_active": False, "unsubscribed_at": datetime.now(timezone.utc)}}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Invalid unsubscribe link")
+    # Deliveries not sent yet are dropped too
+    pending = await db.campaign_deliveries.find(
+        {"unsubscribe_token": token, "status": "pending"},
+        {"_id": 1, "campaign_id": 1}
+    ).to_list(None)
+    for delivery in pending:
+        skipped = await db.campaign_deliveries.update_one(
+            {"_id": delivery["_id"], "status": "pending"},
+            {"$set": {"status": "skipped"}}
+        )
+        if skipped.modified_count:
+            await db.newsletter_campaigns.update_one({"id": delivery["campaign_id"]}, {"$inc": {"skipped_count": 1}})
+    return {"success": True, "message": "You have been unsubscribed"}
+
+@router.get("/newsletter/unsubscribe")
+async def unsubscribe_newsletter(token: str):
+    """Unsubscribe through the link in a newsletter (public)"""
+    return await _unsubscribe(token)
+
+@router.post("/newsletter/unsubscribe")
+async def unsubscribe_newsletter_one_click(token: str):
+    """RFC 8058 one-click unsubscribe from the List-Unsubscribe header (public)"""
+    return await _unsubscribe(token)
+
+# --- Newsletter Campaign Routes ---
+async def _get_campaign(campaign_id: str) -> dict:
+    campaign = await db.newsletter_campaigns.find_one({"id": campaign_id}, {"_id": 0})
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return campaign
+
+def _with_progress(campaign: dict) -> dict:
+    return {**NewsletterCampaign(**campaign).model_dump(), "progress": campaign_progress(campaign)}
+
+@router.post("/admin/newsletter/campaigns", response_model=NewsletterCampaign)
+async def create_campaign(campaign_data: NewsletterCampaignCreate, admin: User = Depends(get_admin_user)):
+    """Create a draft campaign (admin only)"""
+    if not campaign_data.subject or not campaign_data.body_html:
+        raise HTTPException(status_code=400, detail="Subject and body are required in at least one language")
+    campaign = NewsletterCampaign(**campaign_data.model_dump(), created_by=admin.id)
+    await db.newsletter_campaigns.insert_one(campaign.model_dump())
+    await sync_upload_refs("newsletter_campaigns", campaign.id)
+    return campaign
+
+@router.get("/admin/newsletter/campaigns")
+async def get_campaigns(admin: User = Depends(get_admin_user)):
+    """List campaigns with their delivery progress (admin only)"""
+    campaigns = await db.newsletter_campaigns.find({}, {"_id": 0}).sort("created_at", -1).to_list(100)
+    return [_with_progress(campaign) for campaign in campaigns]
+
+@router.get("/admin/newsletter/campaigns/{campaign_id}")
+async def get_campaign(campaign_id: str, admin: User = Depends(get_admin_user)):
+    """Campaign with sent/failed/pending counts, throughput and ETA (admin only)"""
+    return _with_progress(await _get_campaign(campaign_id))
+
+@router.get("/admin/newsletter/campaigns/{campaign_id}/deliveries")
+async def get_campaign_deliveries(
+    campaign_id: str,
+    status: Optional[str] = "failed",
+    limit: int = 100,
+    admin: User = Depends(get_admin_user)
+):
+    """Per-recipient delivery state, failed ones by default (admin only)"""
+    query = {"campaign_id": campaign_id}
+    if status:
+        query["status"] = status
+    deliveries = await db.campaign_deliveries.find(
+        query,
+        {"_id": 0, "unsubscribe_token": 0}
+    ).sort("_id", 1).to_list(min(max(limit, 1), 1000))
+    return deliveries
+
+@router.put("/admin/newsletter/campaigns/{campaign_id}", response_model=NewsletterCampaign)
+async def update_campaign(campaign_id: str, campaign_data: NewsletterCampaignCreate, admin: User = Depends(get_admin_user)):
+    """Edit a draft campaign (admin only)"""
+    result = await db.newsletter_campaigns.update_one(
+        {"id": campaign_id, "status": "draft"},
+        {"$set": campaign_data.model_dump()}
+    )
+    if result.matched_count == 0:
+        await _get_campaign(campaign_id)
+        raise HTTPException(status_code=409, detail="Only draft campaigns can be edited")
+    await sync_upload_refs("newsletter_campaigns", campaign_id)
+    return NewsletterCampaign(**await _get_campaign(campaign_id))
+
+@router.post("/admin/newsletter/campaigns/{campaign_id}/send")
+async def send_campaign(campaign_id: str, admin: User = Depends(get_admin_user)):
+    """Queue a draft or paused campaign for delivery by the background sender (admin only)"""
+    now = datetime.now(timezone.utc)
+    result = await db.newsletter_campaigns.update_one(
+        {"id": campaign_id, "status": {"$in": ["draft", "paused"]}},
+        {"$set": {"status": "queued", "queued_at": now, "lease_expires_at": None}}
+    )
+    if result.matched_count == 0:
+        campaign = await _get_campaign(campaign_id)
+        raise HTTPException(status_code=409, detail=f"Campaign is already {campaign['status']}")
+    if "newsletter_campaigns" in scheduler.jobs:
+        await scheduler.trigger("newsletter_campaigns", admin.email)
+    return _with_progress(await _get_campaign(campaign_id))
+
+@router.post("/admin/newsletter/campaigns/{campaign_id}/pause")
+async def pause_campaign(campaign_id: str, admin: User = Depends(get_admin_user)):
+    """Stop after the current batch; /send resumes where it stopped (admin only)"""
+    result = await db.newsletter_campaigns.update_one(
+        {"id": campaign_id, "status": {"$in": ["queued", "sending"]}},
+        {"$set": {"status": "paused", "lease_expires_at": None}}
+    )
+    if result.matched_count == 0:
+        campaign = await _get_campaign(campaign_id)
+        raise HTTPException(status_code=409, detail=f"Campaign is {campaign['status']}")
+    return _with_progress(await _get_campaign(campaign_id))
+
+@router.post("/admin/newsletter/campaigns/{campaign_id}/cancel")
+async def cancel_campaign(campaign_id: str, admin: User = Depends(get_admin_user)):
+    """Cancel a campaign for good; undelivered recipients are skipped (admin only)"""
+    result = await db.newsletter_campaigns.update_one(
+        {"id": campaign_id, "status": {"$in": ["draft", "queued", "sending", "paused"]}},
+        {"$set": {"status": "cancelled", "lease_expires_at": None, "completed_at": datetime.now(timezone.utc)}}
+    )
+    if result.matched_count == 0:
+        campaign = await _get_campaign(campaign_id)
+        raise HTTPException(status_code=409, detail=f"Campaign is already {campaign['status']}")
+    skipped = await db.campaign_deliveries.update_many(
+        {"campaign_id": campaign_id, "status": "pending"},
+        {"$set": {"status": "skipped"}}
+    )
+    await db.newsletter_campaigns.update_one({"id": campaign_id}, {"$inc": {"skipped_count": skipped.modified_count}})
+    return _with_progress(await _get_campaign(campaign_id))
@@ -0,0 +1,297 @@
+"""
+Order routes and order notification emails
+"""
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from typing import List, Optional
+from datetime import datetime, timezone
+import logging
+from pymongo import ReturnDocument
+from core import db, orders_db, order_numbers, rate_limiter, get_current_user, get_optional_user, get_admin_user
+from stock_flags import low_stock_fields
+from product_detail import invalidate_product_detail
+from email_templates import normalize_language
+from order_lifecycle import transition_order, ORDER_STATUSES
+from order_search import build_order_filter, search_orders, count_orders_by_status, order_search_terms, ORDER_SUMMARY_PROJECTION
+from models import User, StockAdjustment, Order, OrderCreate, OrderUpdate, OrderStatusChange, OrderSearchPage, OrderSummaryPage, PromoCode
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# --- Order Routes ---
+@router.post("/orders", response_model=Order, dependencies=[Depends(rate_limiter.limit("orders"))])
+async def create_order(
+    order_data: OrderCreate,
+    background_tasks: BackgroundTasks,
+    current_user: Optional[User] = Depends(get_optional_user)
+):
+    """Create a new order (public; linked to the account when signed in)"""
+    # Calculate totals
+    subtotal = sum(item.price * item.quantity for item in order_data.items)
+    shipping_cost = 0.0  # Free shipping for now
+    discount_amount = 0.0
+    promo_code = None
+    
+    # Apply promo code if provided
+    if order_data.promo_code:
+        try:
+            code = await db.promo_codes.find_one(
+                {"code": order_data.promo_code.upper(), "is_active": True},
+                {"_id": 0}
+            )
+            
+            if code:
+                promo = PromoCode(**code)
+                now = datetime.now(timezone.utc)
+                
+                # Validate promo code
+                is_valid = True
+                if promo.valid_from:
+                    valid_from = promo.valid_from.replace(tzinfo=timezone.utc) if promo.valid_from.tzinfo is None else promo.valid_from
+                    if now < valid_from:
+                        is_valid = False
+                if promo.valid_until:
+                    valid_until = promo.valid_until.replace(tzinfo=timezone.utc) if promo.valid_until.tzinfo is None else promo.valid_until
+                    if now > valid_until:
+                        is_valid = False
+                if promo.usage_limit and promo.usage_count >= promo.usage_limit:
+                    is_valid = False
+                if promo.min_order_amount and subtotal < promo.min_order_amount:
+                    is_valid = False
+                
+                if is_valid:
+                    # Calculate discount
+                    if promo.discount_type == "percentage":
+                        discount_amount = subtotal * (promo.discount_value / 100)
+                        if promo.max_discount_amount:
+                            discount_amount = min(discount_amount, promo.max_discount_amount)
+                    else:  # fixed
+                        discount_amount = min(promo.discount_value, subtotal)
+                    
+                    promo_code = promo.code
+                    
+                    # Increment usage count
+                    await orders_db.promo_codes.update_one(
+                        {"id": promo.id},
+                        {"$inc": {"usage_count": 1}}
+                    )
+        except Exception as e:
+            logger.warning(f"Error applying promo code: {e}")
+    
+    total = subtotal + shipping_cost - discount_amount
+    
+    # Batch fetch all products (optimization: avoid N+1 query)
+    product_ids = [item.product_id for item in order_data.items]
+    products = await db.products.find(
+        {"id": {"$in": product_ids}},
+        {"_id": 0}
+    ).to_list(len(product_ids))
+    products_dict = {p["id"]: p for p in products}
+    
+    # Allocated up front so stock adjustments can reference the order
+    order_number = await order_numbers.next()
+    
+    # Check stock availability and decrement
+    for item in order_data.items:
+        product = products_dict.get(item.product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail=f"Produit {item.product_id} introuvable")
+        # What a cancellation puts back: never more than was taken
+        item.stock_taken = 0
+            
+        if product.get('track_inventory', True):
+            current_stock = product.get('stock_quantity', 0)
+            allow_backorder = product.get('allow_backorder', False)
+            
+            # Check if enough stock
+            if current_stock < item.quantity and not allow_backorder:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Stock insuffisant pour {item.product_name}. Disponible: {current_stock}"
+                )
+            
+            # Decrement stock
+            new_stock = max(0, current_stock - item.quantity)
+            item.stock_taken = max(0, current_stock - new_stock)
+            # A second line for the same product starts from this level
+            product["stock_quantity"] = new_stock
+            await orders_db.products.update_one(
+                {"id": item.product_id},
+                {
+                    "$set": {
+                        "stock_quantity": new_stock,
+                        "in_stock": new_stock > 0 or allow_backorder,
+                        **low_stock_fields({**product, "stock_quantity": new_stock})
+                    }
+                }
+            )
+            
+            # Log stock adjustment
+            adjustment = StockAdjustment(
+                product_id=item.product_id,
+                adjustment_type="order",
+                quantity=-item.quantity,
+                stock_after=new_stock,
+                reason=f"Commande #{order_number}",
+                notes="Décrémenté par commande"
+            )
+            await orders_db.stock_adjustments.insert_one(adjustment.model_dump())
+            invalidate_product_detail(item.product_id)
+    
+    # Guests ordering with a registered email are linked to that account, as their history always showed them
+    if current_user:
+        user_id = current_user.id
+    else:
+        user = await db.users.find_one({"email": order_data.customer_email}, {"_id": 0, "id": 1})
+        user_id = user["id"] if user else None
+    
+    # Create order
+    order = Order(
+        **order_data.model_dump(exclude={'promo_code', 'language'}),
+        language=normalize_language(order_data.language),
+        order_number=order_number,
+        subtotal=subtotal,
+        shipping_cost=shipping_cost,
+        promo_code=promo_code,
+        discount_amount=discount_amount,
+        total=total,
+        user_id=user_id,
+        status_history=[OrderStatusChange(status="pending", at=datetime.now(timezone.utc))]
+    )
+    
+    # Save to database
+    order_doc = order.model_dump()
+    await orders_db.orders.insert_one({**order_doc, "search_terms": order_search_terms(order_doc)})
+    
+    # Send confirmation email in background
+    background_tasks.add_task(
+        send_order_confirmation_email,
+        order
+    )
+    
+    return order
+
+@router.get("/orders/{order_id}", response_model=Order)
+async def get_order_public(order_id: str):
+    """Get order details (public - by order ID)"""
+    order = await db.orders.find_one({"id": order_id}, {"_id": 0})
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return Order(**order)
+
+@router.get("/my-orders", response_model=OrderSummaryPage)
+async def get_my_orders(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """Get current user's orders, newest first (pass next_cursor back as cursor for older ones)"""
+    return await search_orders(
+        {"user_id": current_user.id},
+        limit=limit,
+        cursor=cursor,
+        projection=ORDER_SUMMARY_PROJECTION,
+        count=False
+    )
+
+@router.get("/admin/orders", response_model=List[Order])
+async def get_all_orders_admin(admin: User = Depends(get_admin_user)):
+    """Get all orders (admin only)"""
+    orders = await db.orders.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+    return [Order(**order) for order in orders]
+
+@router.get("/admin/orders/search", response_model=OrderSearchPage)
+async def search_orders_admin(
+    status: Optional[str] = None,
+    payment_status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    promo_code: Optional[str] = None,
+    customer_email: Optional[str] = None,
+    order_number: Optional[str] = Query(None, description="Order number prefix"),
+    q: Optional[str] = Query(None, description="Words starting customer name or shipping city"),
+    sort: str = Query("-created_at", description="created_at or total, - for descending"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    admin: User = Depends(get_admin_user)
+):
+    """Filter, sort and page through orders (admin only)"""
+    query = build_order_filter(
+        status=status,
+        payment_status=payment_status,
+        created_from=created_from,
+        created_to=created_to,
+        promo_code=promo_code,
+        customer_email=customer_email,
+        order_number=order_number,
+        q=q
+    )
+    return await search_orders(query, sort=sort, limit=limit, cursor=cursor)
+
+@router.get("/admin/orders/status-counts")
+async def get_order_status_counts(admin: User = Depends(get_admin_user)):
+    """Number of orders in each status (admin only)"""
+    counts = await count_orders_by_status(ORDER_STATUSES)
+    return {"total": await db.orders.estimated_document_count(), "by_status": counts}
+
+@router.get("/admin/orders/{order_id}", response_model=Order)
+async def get_order_admin(order_id: str, admin: User = Depends(get_admin_user)):
+    """Get order details (admin only)"""
+    order = await db.orders.find_one({"id": order_id}, {"_id": 0})
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return Order(**order)
+
+@router.put("/admin/orders/{order_id}", response_model=Order)
+async def update_order_status(
+    order_id: str,
+    order_data: OrderUpdate,
+    admin: User = Depends(get_admin_user),
+    background_tasks: BackgroundTasks = None
+):
+    """Update order status and notes (admin only); see order_lifecycle for the allowed transitions"""
+    performed_by = admin.get('email') if isinstance(admin, dict) else admin.email
+    extra_fields = {"notes": order_data.notes} if order_data.notes is not None else {}
+    
+    if order_data.status is None:
+        if not extra_fields:
+            raise HTTPException(status_code=400, detail="Nothing to update")
+        order = await orders_db.orders.find_one_and_update(
+            {"id": order_id},
+            {"$set": {**extra_fields, "updated_at": datetime.now(timezone.utc)}},
+            return_document=ReturnDocument.AFTER
+        )
+        if not order:
+            raise HTTPException(status_code=404, detail="Order not found")
+        return Order(**order)
+    
+    order = await transition_order(order_id, order_data.status, performed_by, extra_fields)
+    
+    # Send status update email only when the status actually changed
+    if order["changed"] and background_tasks:
+        background_tasks.add_task(
+            send_order_status_email,
+            Order(**order)
+        )
+    
+    return Order(**order)
+
+def send_order_confirmation_email(order: Order):
+    """Send order confirmation email, in the language the order was placed in"""
+    from email_service import email_service
+    email_service.send_template_email(order.customer_email, "order_confirmation", order.language, {"order": order})
+
+def send_order_status_email(order: Order):
+    """Send order status update email"""
+    from email_service import email_service
+    email_service.send_template_email(order.customer_email, "order_status", order.language, {"order": order})
+
+@router.delete("/admin/orders/{order_id}")
+async def delete_order(order_id: str, admin: User = Depends(get_admin_user)):
+    """Delete an order (admin only)"""
+    result = await db.orders.delete_one({"id": order_id})
+    
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Order not found")
+    
+    return {"message": "Order deleted successfully"}
@@ -0,0 +1,86 @@
+"""
+Custom page routes
+"""
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from typing import List
+from datetime import datetime, timezone
+from core import db, catalog_db, get_admin_user
+from models import User, CustomPage, CustomPageCreate, CustomPageUpdate
+from upload_gc import sync_upload_refs
+from seo_snapshots import refresh_snapshots, remove_snapshots
+
+router = APIRouter()
+
+# --- Custom Pages Routes ---
+@router.get("/pages", response_model=List[CustomPage])
+async def get_published_pages():
+    """Get all published pages (public)"""
+    pages = await catalog_db.custom_pages.find({"is_published": True}, {"_id": 0}).sort("menu_order", 1).to_list(1000)
+    return [CustomPage(**page) for page in pages]
+
+@router.get("/pages/{slug}", response_model=CustomPage)
+async def get_page_by_slug(slug: str):
+    """Get a specific published page by slug (public)"""
+    page = await catalog_db.custom_pages.find_one({"slug": slug, "is_published": True}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    return CustomPage(**page)
+
+@router.get("/admin/pages", response_model=List[CustomPage])
+async def get_all_pages_admin(admin: User = Depends(get_admin_user)):
+    """Get all pages including drafts (admin only)"""
+    pages = await db.custom_pages.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+    return [CustomPage(**page) for page in pages]
+
+@router.post("/admin/pages", response_model=CustomPage)
+async def create_page(page_data: CustomPageCreate, background_tasks: BackgroundTasks, admin: User = Depends(get_admin_user)):
+    """Create a new custom page (admin only)"""
+    page = CustomPage(**page_data.model_dump())
+    await db.custom_pages.insert_one(page.model_dump())
+    await sync_upload_refs("custom_pages", page.id)
+    background_tasks.add_task(refresh_snapshots, "page", page.slug)
+    return page
+
+@router.get("/admin/pages/{page_id}", response_model=CustomPage)
+async def get_page_admin(page_id: str, admin: User = Depends(get_admin_user)):
+    """Get a specific page (admin only)"""
+    page = await db.custom_pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    return CustomPage(**page)
+
+@router.put("/admin/pages/{page_id}", response_model=CustomPage)
+async def update_page(
+    page_id: str,
+    page_data: CustomPageUpdate,
+    background_tasks: BackgroundTasks,
+    admin: User = Depends(get_admin_user)
+):
+    """Update a custom page (admin only)"""
+    page = await db.custom_pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    update_data = {k: v for k, v in page_data.model_dump().items() if v is not None}
+    update_data["updated_at"] = datetime.now(timezone.utc)
+    
+    if update_data:
+        await db.custom_pages.update_one({"id": page_id}, {"$set": update_data})
+        await sync_upload_refs("custom_pages", page_id)
+        if update_data.get("slug", page["slug"]) != page["slug"]:
+            background_tasks.add_task(remove_snapshots, "page", page["slug"])
+        page.update(update_data)
+        # Also drops the snapshots of a page that was unpublished
+        background_tasks.add_task(refresh_snapshots, "page", page["slug"])
+    
+    return CustomPage(**page)
+
+@router.delete("/admin/pages/{page_id}")
+async def delete_page(page_id: str, background_tasks: BackgroundTasks, admin: User = Depends(get_admin_user)):
+    """Delete a custom page (admin only)"""
+    page = await db.custom_pages.find_one_and_delete({"id": page_id}, {"_id": 0, "slug": 1})
+    if page is None:
+        raise HTTPException(status_code=404, detail="Page not found")
+    await sync_upload_refs("custom_pages", page_id)
+    background_tasks.add_task(remove_snapshots, "page", page["slug"])
+    return {"message": "Page deleted successfully"}
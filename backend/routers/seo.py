@@ -0,0 +1,107 @@
+"""
+SEO settings routes
+"""
+import gzip
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import HTMLResponse, PlainTextResponse, FileResponse
+from typing import Optional
+from datetime import datetime, timezone
+from core import db, menu_cache, get_admin_user
+from models import User, SEOSettings
+from upload_gc import sync_upload_refs
+from seo_snapshots import SNAPSHOT_SOURCES, get_snapshot, get_seo_settings as get_cached_seo_settings
+from sitemap import INDEX, site_url, get_sitemap_file
+from jobs import scheduler
+
+router = APIRouter()
+# Served at the site root rather than under /api, where crawlers look for them
+site_router = APIRouter()
+
+# --- SEO Settings Routes ---
+@router.get("/admin/seo-settings", response_model=SEOSettings)
+async def get_seo_settings(admin: User = Depends(get_admin_user)):
+    """Get SEO settings (admin only)"""
+    settings = await db.seo_settings.find_one({"id": "seo_settings"}, {"_id": 0})
+    if not settings:
+        # Return default settings if none exist
+        return SEOSettings()
+    return SEOSettings(**settings)
+
+@router.put("/admin/seo-settings", response_model=SEOSettings)
+async def update_seo_settings(
+    seo_data: SEOSettings,
+    admin: User = Depends(get_admin_user)
+):
+    """Update SEO settings (admin only)"""
+    seo_data.updated_at = datetime.now(timezone.utc)
+    
+    await db.seo_settings.update_one(
+        {"id": "seo_settings"},
+        {"$set": seo_data.model_dump()},
+        upsert=True
+    )
+    await sync_upload_refs("seo_settings", "seo_settings")
+    # Snapshots embed the settings: their versions change with updated_at
+    menu_cache.invalidate("seo_settings")
+    # Sitemap URLs start with canonical_url
+    if "sitemap" in scheduler.jobs:
+        await scheduler.trigger("sitemap", admin.email)
+    
+    updated = await db.seo_settings.find_one({"id": "seo_settings"}, {"_id": 0})
+    return SEOSettings(**updated)
+
+@router.get("/seo-settings")
+async def get_public_seo_settings():
+    """Get public SEO settings (for meta tags)"""
+    settings = await db.seo_settings.find_one({"id": "seo_settings"}, {"_id": 0})
+    if not settings:
+        return SEOSettings().model_dump()
+    return settings
+
+# --- Crawler Snapshots ---
+@router.get("/seo/snapshots/{kind}/{key}", response_class=HTMLResponse)
+async def get_seo_snapshot(kind: str, key: str, request: Request, lang: Optional[str] = None):
+    """Pre-rendered HTML of a product, history article or custom page, for crawlers (public)"""
+    if kind not in SNAPSHOT_SOURCES:
+        raise HTTPException(status_code=404, detail="Page not found")
+    language = lang or request.headers.get("accept-language", "")[:2].lower()
+    snapshot = await get_snapshot(kind, key, language)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Page not found")
+    html, version = snapshot
+    headers = {"ETag": f'"{version}"', "Cache-Control": "public, max-age=300", "Vary": "Accept-Language"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(html, headers=headers)
+
+# --- Robots & Sitemaps ---
+@site_router.get("/robots.txt", response_class=PlainTextResponse)
+async def get_robots_txt():
+    """robots.txt from the SEO settings, pointing crawlers to the sitemap (public)"""
+    settings = await get_cached_seo_settings()
+    robots = (settings.get("robots_txt") or SEOSettings().robots_txt).rstrip("\n")
+    base_url = site_url(settings)
+    if base_url and "sitemap:" not in robots.lower():
+        robots += f"\n\nSitemap: {base_url}/sitemap.xml"
+    return PlainTextResponse(robots + "\n", headers={"Cache-Control": "public, max-age=3600"})
+
+@site_router.get("/sitemap.xml")
+async def get_sitemap_index(request: Request):
+    """Sitemap index listing the shards (public)"""
+    path = await get_sitemap_file(INDEX)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Sitemap not built yet")
+    headers = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return FileResponse(path, media_type="application/xml", headers={**headers, "Content-Encoding": "gzip"})
+    body = await asyncio.to_thread(lambda: gzip.decompress(path.read_bytes()))
+    return Response(body, media_type="application/xml", headers=headers)
+
+@site_router.get("/sitemaps/{name}.xml.gz")
+async def get_sitemap_shard(name: str):
+    """One gzipped sitemap shard (public)"""
+    path = await get_sitemap_file(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    return FileResponse(path, media_type="application/gzip", headers={"Cache-Control": "public, max-age=3600"})
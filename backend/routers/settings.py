@@ -0,0 +1,76 @@
+"""
+Site settings routes
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Dict, Any
+from datetime import datetime, timezone
+import logging
+from core import db, get_admin_user
+from models import User, GeneralSettings
+from upload_gc import sync_upload_refs
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# --- Settings Routes ---
+@router.get("/admin/settings")
+async def get_settings(admin_user: User = Depends(get_admin_user)):
+    """Get site settings (admin only)"""
+    settings = await db.settings.find_one({"id": "site_settings"})
+    
+    if not settings:
+        # Return default settings if none exist
+        return {}
+    
+    # Remove MongoDB _id field
+    if "_id" in settings:
+        del settings["_id"]
+    
+    return settings
+
+@router.put("/admin/settings")
+async def update_settings(
+    settings_update: Dict[str, Any],
+    admin_user: User = Depends(get_admin_user)
+):
+    """Update site settings (admin only)"""
+    try:
+        # Get existing settings or create new
+        existing_settings = await db.settings.find_one({"id": "site_settings"})
+        
+        if existing_settings:
+            # Update existing settings
+            update_data = {
+                **existing_settings,
+                **settings_update,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
+            
+            await db.settings.update_one(
+                {"id": "site_settings"},
+                {"$set": update_data}
+            )
+        else:
+            # Create new settings document
+            new_settings = {
+                "id": "site_settings",
+                **settings_update,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
+            await db.settings.insert_one(new_settings)
+        await sync_upload_refs("settings", "site_settings")
+        
+        return {"success": True, "message": "Settings updated successfully"}
+        
+    except Exception as e:
+        logger.error(f"Error updating settings: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error updating settings: {str(e)}")
+
+@router.get("/settings")
+async def get_public_settings():
+    """Get public general settings"""
+    settings = await db.general_settings.find_one({"id": "general_settings"}, {"_id": 0})
+    if not settings:
+        return GeneralSettings().model_dump()
+    return settings
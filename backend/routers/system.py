@@ -0,0 +1,29 @@
+"""
+API root, health probe and diagnostics
+"""
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from database import ping, pool_metrics
+from core import get_admin_user
+from models import User
+
+router = APIRouter()
+
+# --- Basic Routes ---
+@router.get("/")
+async def root():
+    return {"message": "Soumam Heritage API", "version": "1.0"}
+
+@router.get("/health")
+async def health_check():
+    """Liveness/readiness probe including database reachability (public)"""
+    db_ok = await ping()
+    return JSONResponse(
+        status_code=200 if db_ok else 503,
+        content={"status": "ok" if db_ok else "degraded", "database": db_ok}
+    )
+
+@router.get("/admin/db/pool")
+async def get_db_pool_stats(admin: User = Depends(get_admin_user)):
+    """MongoDB connection pool utilisation for this worker (admin only)"""
+    return pool_metrics.snapshot()
@@ -0,0 +1,109 @@
+"""
+Testimonial routes
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+from datetime import datetime, timezone
+from core import db, rate_limiter, get_admin_user
+from models import User, Testimonial, TestimonialCreate, TestimonialUpdate
+from ratings import apply_rating_delta, reconcile_rating_stats
+from product_detail import invalidate_product_detail
+
+router = APIRouter()
+
+# --- Testimonial Routes ---
+@router.post("/testimonials", response_model=Testimonial, dependencies=[Depends(rate_limiter.limit("testimonials"))])
+async def create_testimonial(testimonial_data: TestimonialCreate):
+    """Submit a new testimonial (public)"""
+    testimonial = Testimonial(**testimonial_data.model_dump())
+    await db.testimonials.insert_one(testimonial.model_dump())
+    return testimonial
+
+@router.get("/testimonials", response_model=List[Testimonial])
+async def get_approved_testimonials(limit: int = 10, product_id: Optional[str] = None):
+    """Get approved testimonials, optionally for one product (public)"""
+    query = {"is_approved": True}
+    if product_id:
+        query["product_id"] = product_id
+    testimonials = await db.testimonials.find(
+        query,
+        {"_id": 0}
+    ).sort("approved_at", -1).limit(limit).to_list(limit)
+    return [Testimonial(**t) for t in testimonials]
+
+@router.get("/admin/testimonials", response_model=List[Testimonial])
+async def get_all_testimonials(admin: User = Depends(get_admin_user)):
+    """Get all testimonials including pending (admin only)"""
+    testimonials = await db.testimonials.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+    return [Testimonial(**t) for t in testimonials]
+
+@router.get("/admin/testimonials/{testimonial_id}", response_model=Testimonial)
+async def get_testimonial(testimonial_id: str, admin: User = Depends(get_admin_user)):
+    """Get a specific testimonial (admin only)"""
+    testimonial = await db.testimonials.find_one({"id": testimonial_id}, {"_id": 0})
+    if not testimonial:
+        raise HTTPException(status_code=404, detail="Testimonial not found")
+    return Testimonial(**testimonial)
+
+@router.put("/admin/testimonials/{testimonial_id}", response_model=Testimonial)
+async def update_testimonial(
+    testimonial_id: str,
+    update_data: TestimonialUpdate,
+    admin: User = Depends(get_admin_user)
+):
+    """Update testimonial (approve/reject) (admin only)"""
+    testimonial = await db.testimonials.find_one({"id": testimonial_id}, {"_id": 0})
+    if not testimonial:
+        raise HTTPException(status_code=404, detail="Testimonial not found")
+    
+    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+    
+    # If approving, set approval timestamp and admin ID
+    if update_dict.get("is_approved") is True:
+        update_dict["approved_at"] = datetime.now(timezone.utc)
+        update_dict["approved_by"] = admin.id
+    
+    if "is_approved" in update_dict:
+        # Only the request that actually flips the flag adjusts the product's rating stats
+        flipped = await db.testimonials.find_one_and_update(
+            {"id": testimonial_id, "is_approved": {"$ne": update_dict["is_approved"]}},
+            {"$set": update_dict},
+            projection={"_id": 0}
+        )
+        if flipped:
+            await apply_rating_delta(flipped, 1 if update_dict["is_approved"] else -1)
+        else:
+            await db.testimonials.update_one({"id": testimonial_id}, {"$set": update_dict})
+        testimonial.update(update_dict)
+    elif update_dict:
+        await db.testimonials.update_one(
+            {"id": testimonial_id},
+            {"$set": update_dict}
+        )
+        testimonial.update(update_dict)
+    
+    if update_dict and testimonial.get("product_id"):
+        invalidate_product_detail(testimonial["product_id"])
+    return Testimonial(**testimonial)
+
+@router.delete("/admin/testimonials/{testimonial_id}")
+async def delete_testimonial(testimonial_id: str, admin: User = Depends(get_admin_user)):
+    """Delete a testimonial (admin only)"""
+    deleted = await db.testimonials.find_one_and_delete({"id": testimonial_id}, projection={"_id": 0})
+    
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Testimonial not found")
+    
+    if deleted.get("is_approved"):
+        await apply_rating_delta(deleted, -1)
+        if deleted.get("product_id"):
+            invalidate_product_detail(deleted["product_id"])
+    
+    return {"message": "Testimonial deleted successfully"}
+
+@router.post("/admin/testimonials/reconcile-ratings")
+async def reconcile_ratings_now(admin: User = Depends(get_admin_user)):
+    """Recompute every product's rating stats from approved testimonials (admin only)"""
+    updated = await reconcile_rating_stats()
+    invalidate_product_detail()
+    return {"message": "Rating stats reconciled", "products_updated": updated}
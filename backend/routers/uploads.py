@@ -0,0 +1,269 @@
+"""
+Image upload and serving routes
+"""
+from fastapi import APIRouter, HTTPException, Depends, Request
+from pymongo import ReturnDocument
+from typing import Optional, Tuple
+from datetime import datetime, timezone, timedelta
+import os
+import re
+import logging
+import aiofiles
+from core import db, storage, UPLOAD_TMP_DIR, get_admin_user
+from ids import new_id
+from models import User, UploadSessionCreate, UploadSession, DirectUploadCreate
+from storage import check_name
+from upload_gc import find_upload_refs, sweep_orphaned_uploads
+from upload_stream import (
+    stream_multipart_image, check_content_length, too_large, sniff_image_type, TempImageFile,
+    MAX_UPLOAD_BYTES, SNIFF_BYTES, IMAGE_CONTENT_TYPES
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+SESSION_MAX_BYTES = int(os.environ.get('UPLOAD_SESSION_MAX_BYTES', 50 * 1024 * 1024))
+CHUNK_MAX_BYTES = int(os.environ.get('UPLOAD_CHUNK_MAX_BYTES', 8 * 1024 * 1024))
+SESSION_TTL_HOURS = int(os.environ.get('UPLOAD_SESSION_TTL_HOURS', 24))
+DIRECT_UPLOAD_EXPIRES_SECONDS = int(os.environ.get('DIRECT_UPLOAD_EXPIRES_SECONDS', 900))
+
+# --- Image Upload Routes ---
+MULTIPART_FILE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"multipart/form-data": {"schema": {
+            "type": "object",
+            "properties": {"file": {"type": "string", "format": "binary"}},
+            "required": ["file"],
+        }}},
+    }
+}
+
+@router.post("/upload", openapi_extra=MULTIPART_FILE_BODY)
+async def upload_image(
+    request: Request,
+    admin_user: User = Depends(get_admin_user)
+):
+    """Upload an image file, streamed to storage without buffering (admin only)"""
+    try:
+        upload = await stream_multipart_image(request, UPLOAD_TMP_DIR)
+        unique_filename = await upload.commit(storage)
+        
+        # Return the URL (through API, or the CDN when STORAGE_PUBLIC_BASE_URL is set)
+        file_url = storage.public_url(unique_filename)
+        
+        return {
+            "success": True,
+            "filename": unique_filename,
+            "url": file_url,
+            "size": upload.size
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error uploading file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error uploading file: {str(e)}")
+
+# --- Resumable Upload Routes ---
+def parse_content_range(header: Optional[str]) -> Tuple[int, int, int]:
+    """Parse "bytes <start>-<end>/<total>" (end inclusive)"""
+    match = re.fullmatch(r"bytes (\d+)-(\d+)/(\d+)", (header or "").strip())
+    if not match:
+        raise HTTPException(status_code=400, detail="Content-Range header required: bytes <start>-<end>/<total>")
+    start, end, total = (int(group) for group in match.groups())
+    if end < start or end >= total:
+        raise HTTPException(status_code=400, detail="Invalid Content-Range")
+    return start, end, total
+
+@router.post("/upload/sessions", response_model=UploadSession)
+async def create_upload_session(session_data: UploadSessionCreate, admin_user: User = Depends(get_admin_user)):
+    """Start a resumable upload for a large image (admin only)"""
+    if session_data.total_size > SESSION_MAX_BYTES:
+        raise too_large(SESSION_MAX_BYTES)
+    
+    session = UploadSession(
+        total_size=session_data.total_size,
+        filename=session_data.filename,
+        created_by=admin_user.id,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=SESSION_TTL_HOURS)
+    )
+    await db.upload_sessions.insert_one(session.model_dump())
+    return session
+
+@router.get("/upload/sessions/{session_id}", response_model=UploadSession)
+async def get_upload_session(session_id: str, admin_user: User = Depends(get_admin_user)):
+    """Current offset of a resumable upload, to resume after an interruption (admin only)"""
+    session = await db.upload_sessions.find_one({"id": session_id}, {"_id": 0})
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return UploadSession(**session)
+
+@router.put("/upload/sessions/{session_id}", response_model=UploadSession)
+async def upload_session_chunk(
+    session_id: str,
+    request: Request,
+    admin_user: User = Depends(get_admin_user)
+):
+    """Append the next chunk (raw body + Content-Range) to a resumable upload (admin only)"""
+    session = await db.upload_sessions.find_one({"id": session_id}, {"_id": 0})
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    if session["completed"]:
+        return UploadSession(**session)
+    
+    start, end, total = parse_content_range(request.headers.get("content-range"))
+    if total != session["total_size"]:
+        raise HTTPException(status_code=400, detail="Content-Range total does not match the session size")
+    if start != session["received"]:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Expected chunk starting at byte {session['received']}",
+            headers={"Upload-Offset": str(session["received"])}
+        )
+    length = end - start + 1
+    if length > CHUNK_MAX_BYTES:
+        raise too_large(CHUNK_MAX_BYTES)
+    check_content_length(request, length)
+    
+    partial_path = UPLOAD_TMP_DIR / f"{session_id}.part"
+    written = 0
+    async with aiofiles.open(partial_path, "r+b" if partial_path.exists() else "wb") as f:
+        await f.seek(start)
+        async for chunk in request.stream():
+            written += len(chunk)
+            if written > length:
+                break
+            await f.write(chunk)
+        if written != length:
+            await f.truncate(start)
+            raise HTTPException(status_code=400, detail=f"Chunk body is {written} bytes, Content-Range announced {length}")
+    
+    # Only the request that wrote at the expected offset moves it forward
+    update = {"received": end + 1}
+    if end + 1 == total:
+        async with aiofiles.open(partial_path, "rb") as f:
+            head = await f.read(SNIFF_BYTES)
+        stored_filename = await TempImageFile(UPLOAD_TMP_DIR, path=partial_path).commit(storage, name=session_id, head=head)
+        update.update({
+            "completed": True,
+            "stored_filename": stored_filename,
+            "url": storage.public_url(stored_filename),
+        })
+    updated = await db.upload_sessions.find_one_and_update(
+        {"id": session_id, "received": start},
+        {"$set": update},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
+        raise HTTPException(status_code=409, detail="Upload session was advanced by another request")
+    return UploadSession(**updated)
+
+@router.delete("/upload/sessions/{session_id}")
+async def abort_upload_session(session_id: str, admin_user: User = Depends(get_admin_user)):
+    """Abort a resumable upload and drop the received bytes (admin only)"""
+    session = await db.upload_sessions.find_one_and_delete({"id": session_id}, projection={"_id": 0})
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    if not session["completed"]:
+        TempImageFile(UPLOAD_TMP_DIR, path=UPLOAD_TMP_DIR / f"{session_id}.part").discard()
+    return {"success": True, "message": "Upload session aborted"}
+
+# --- Direct-to-Storage Upload Routes ---
+@router.post("/upload/presign")
+async def create_direct_upload(upload_data: DirectUploadCreate, admin_user: User = Depends(get_admin_user)):
+    """Presigned POST to send an image straight to the bucket, bypassing the API workers (admin only)"""
+    if not storage.supports_presigned_upload:
+        raise HTTPException(status_code=400, detail="Direct uploads need STORAGE_BACKEND=s3; use /upload or /upload/sessions")
+    extension = next((ext for ext, ct in IMAGE_CONTENT_TYPES.items() if ct == upload_data.content_type), None)
+    if extension is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Allowed types: image/jpeg, image/png, image/webp, image/gif"
+        )
+    if upload_data.size > MAX_UPLOAD_BYTES:
+        raise too_large(MAX_UPLOAD_BYTES)
+    
+    filename = f"{new_id()}.{extension}"
+    presigned = await storage.presign_upload(
+        filename, upload_data.content_type, MAX_UPLOAD_BYTES, DIRECT_UPLOAD_EXPIRES_SECONDS
+    )
+    return {
+        "filename": filename,
+        "upload_url": presigned["url"],
+        "fields": presigned["fields"],
+        "expires_in": DIRECT_UPLOAD_EXPIRES_SECONDS,
+        "complete_url": f"/api/upload/presign/{filename}/complete",
+    }
+
+@router.post("/upload/presign/{filename}/complete")
+async def complete_direct_upload(filename: str, admin_user: User = Depends(get_admin_user)):
+    """Verify a direct upload landed and is the image type it claimed to be (admin only)"""
+    check_name(filename)
+    size = await storage.size(filename)
+    if size is None:
+        raise HTTPException(status_code=404, detail="Upload not found; it may not have finished yet")
+    
+    extension = sniff_image_type(await storage.read_head(filename, SNIFF_BYTES))
+    if extension is None or not filename.endswith(f".{extension}"):
+        await storage.delete(filename)
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Allowed types: image/jpeg, image/png, image/webp, image/gif"
+        )
+    
+    return {
+        "success": True,
+        "filename": filename,
+        "url": storage.public_url(filename),
+        "size": size
+    }
+
+@router.delete("/upload/{filename}")
+async def delete_image(
+    filename: str,
+    admin_user: User = Depends(get_admin_user)
+):
+    """Delete an uploaded image that no document uses anymore (admin only)"""
+    try:
+        refs = await find_upload_refs(check_name(filename))
+        if refs:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "File is still referenced", "references": refs}
+            )
+        
+        if not await storage.delete(filename):
+            raise HTTPException(status_code=404, detail="File not found")
+        
+        return {"success": True, "message": "File deleted successfully"}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error deleting file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error deleting file: {str(e)}")
+
+# --- Upload Maintenance Routes ---
+@router.get("/admin/uploads/usage")
+async def get_upload_usage(admin_user: User = Depends(get_admin_user)):
+    """Storage used by uploads: referenced, orphaned and reclaimable files (admin only)"""
+    return await sweep_orphaned_uploads(dry_run=True, rebuild=False)
+
+@router.post("/admin/uploads/gc")
+async def collect_orphaned_uploads(
+    dry_run: bool = False,
+    grace_hours: Optional[float] = None,
+    admin_user: User = Depends(get_admin_user)
+):
+    """Rebuild the reference index and delete orphaned uploads past the grace period (admin only)"""
+    if grace_hours is not None and grace_hours < 1:
+        raise HTTPException(status_code=400, detail="grace_hours must be at least 1")
+    return await sweep_orphaned_uploads(dry_run=dry_run, grace_hours=grace_hours)
+
+# --- File Serving Route ---
+@router.get("/uploads/{filename}")
+async def serve_uploaded_file(filename: str):
+    """Serve uploaded files through API (streamed, or redirected to the bucket)"""
+    return await storage.response(filename)
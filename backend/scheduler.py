@@ -0,0 +1,328 @@
+"""
+In-process job scheduler
+
+Jobs run on an interval or a cron expression (5 fields, UTC) inside the
+API process, never on the request path. Every worker runs a Scheduler but
+only the one holding the leader lease (``job_locks``, renewed every tick)
+starts jobs; if it dies the lease expires and another worker takes over.
+
+Schedules live in ``scheduled_jobs`` (next_run_at, last status), so a
+restart or a change of leader neither skips nor repeats a run. Each run is
+recorded in ``job_runs`` with its duration, status and result. An admin
+trigger only sets next_run_at to now; the leader picks it up on its next
+tick.
+"""
+import os
+import time
+import socket
+import asyncio
+import functools
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from ids import new_id
+
+logger = logging.getLogger(__name__)
+
+LEADER_LOCK_ID = "scheduler_leader"
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class CronSchedule:
+    """
+    Standard 5-field cron expression: minute hour day-of-month month day-of-week
+
+    Fields accept ``*``, numbers, ranges (1-5), lists (1,15) and steps
+    (*/10, 0-30/5). Day-of-week 0 and 7 are Sunday. As in cron, when both
+    day fields are restricted a day matching either one is a match.
+    """
+
+    _BOUNDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: '{expression}'")
+        self.expression = expression
+        fields = [self._parse(part, low, high) for part, (low, high) in zip(parts, self._BOUNDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = fields
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(part: str, low: int, high: int) -> Set[int]:
+        values: Set[int] = set()
+        for item in part.split(","):
+            step = 1
+            if "/" in item:
+                item, step_text = item.split("/", 1)
+                step = int(step_text)
+            if item == "*":
+                start, end = low, high
+            elif "-" in item:
+                start, end = (int(value) for value in item.split("-", 1))
+            else:
+                start = end = int(item)
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Invalid cron field '{part}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, value: datetime) -> bool:
+        day_ok = value.day in self.days
+        # Python: Monday=0; cron: Sunday=0
+        weekday_ok = (value.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """First matching minute strictly after ``after``"""
+        value = _as_utc(after).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = value + timedelta(days=366 * 5)
+        while value < limit:
+            if value.month not in self.months or not self._day_matches(value):
+                value = (value + timedelta(days=1)).replace(hour=0, minute=0)
+            elif value.hour not in self.hours:
+                value = (value + timedelta(hours=1)).replace(minute=0)
+            elif value.minute not in self.minutes:
+                value += timedelta(minutes=1)
+            else:
+                return value
+        raise ValueError(f"Cron expression never matches: '{self.expression}'")
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: Optional[float] = None  # seconds
+    cron: Optional[str] = None
+    run_on_start: bool = False
+    timeout: Optional[float] = None  # seconds, None = no limit
+    description: str = ""
+    _cron: Optional[CronSchedule] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if (self.interval is None) == (self.cron is None):
+            raise ValueError(f"Job '{self.name}' needs exactly one of interval or cron")
+        if self.cron is not None:
+            self._cron = CronSchedule(self.cron)
+
+    def next_after(self, now: datetime) -> datetime:
+        if self._cron is not None:
+            return self._cron.next_after(now)
+        return now + timedelta(seconds=self.interval)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "interval_seconds": self.interval,
+            "cron": self.cron,
+            "timeout_seconds": self.timeout,
+        }
+
+
+def _storable(result: Any) -> Any:
+    if result is None or isinstance(result, (bool, int, float, str, dict, list)):
+        return result
+    return str(result)
+
+
+class Scheduler:
+    """Runs registered jobs on the worker holding the leader lease"""
+
+    def __init__(self, database, lease_seconds: float = 30, tick_seconds: float = 5):
+        self.jobs_state = database.scheduled_jobs
+        self.runs = database.job_runs
+        self.locks = database.job_locks
+        self.lease_seconds = lease_seconds
+        self.tick_seconds = tick_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{new_id()[-8:]}"
+        self.jobs: Dict[str, Job] = {}
+        self.is_leader = False
+        self._running: Dict[str, asyncio.Task] = {}
+
+    def add_job(self, name: str, func: Callable[[], Awaitable[Any]], **options) -> Job:
+        if name in self.jobs:
+            raise ValueError(f"Job '{name}' is already registered")
+        job = Job(name=name, func=func, **options)
+        self.jobs[name] = job
+        return job
+
+    async def _renew_leadership(self) -> bool:
+        now = datetime.now(timezone.utc)
+        try:
+            lock = await self.locks.find_one_and_update(
+                {"_id": LEADER_LOCK_ID, "$or": [{"owner": self.worker_id}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": self.worker_id, "expires_at": now + timedelta(seconds=self.lease_seconds), "renewed_at": now}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Held by a live worker: the upsert collided with its lock document
+            return False
+        return lock is not None
+
+    async def _release_leadership(self):
+        await self.locks.delete_one({"_id": LEADER_LOCK_ID, "owner": self.worker_id})
+        self.is_leader = False
+
+    async def _start_due_jobs(self):
+        now = datetime.now(timezone.utc)
+        states = {state["_id"]: state async for state in self.jobs_state.find({"_id": {"$in": list(self.jobs)}})}
+        for job in self.jobs.values():
+            if job.name in self._running:
+                continue
+            state = states.get(job.name)
+            if state is None or state.get("next_run_at") is None:
+                first_run = now if job.run_on_start else job.next_after(now)
+                await self.jobs_state.update_one(
+                    {"_id": job.name},
+                    {"$set": {"next_run_at": first_run}},
+                    upsert=True
+                )
+                if first_run > now:
+                    continue
+                state = {}
+            elif _as_utc(state["next_run_at"]) > now:
+                continue
+
+            trigger = "manual" if state.get("triggered_by") else "schedule"
+            # Advance the schedule before running, so a crash mid-run does not re-run in a loop
+            await self.jobs_state.update_one(
+                {"_id": job.name},
+                {"$set": {"next_run_at": job.next_after(now)}, "$unset": {"triggered_by": ""}}
+            )
+            task = asyncio.create_task(self._execute(job, trigger, state.get("triggered_by")))
+            self._running[job.name] = task
+            # Not in _execute's finally: the job must become runnable again even if recording the run fails
+            task.add_done_callback(functools.partial(self._forget_run, job.name))
+
+    def _forget_run(self, name: str, task: asyncio.Task):
+        if self._running.get(name) is task:
+            del self._running[name]
+
+    async def _execute(self, job: Job, trigger: str, triggered_by: Optional[str] = None):
+        run_id = new_id()
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        status, error, result = "success", None, None
+        try:
+            await self.runs.insert_one({
+                "id": run_id,
+                "job": job.name,
+                "status": "running",
+                "trigger": trigger,
+                "triggered_by": triggered_by,
+                "worker": self.worker_id,
+                "started_at": started_at,
+            })
+            result = await asyncio.wait_for(job.func(), job.timeout)
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"Exceeded {job.timeout:.0f}s"
+            logger.error(f"Job {job.name} timed out after {job.timeout:.0f}s")
+        except asyncio.CancelledError:
+            status, error = "cancelled", "Leadership lost or shutting down"
+            raise
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Job {job.name} failed: {str(e)}")
+        finally:
+            finished_at = datetime.now(timezone.utc)
+            duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            await self.runs.update_one(
+                {"id": run_id},
+                {"$set": {
+                    "status": status,
+                    "error": error,
+                    "result": _storable(result),
+                    "finished_at": finished_at,
+                    "duration_ms": duration_ms,
+                }}
+            )
+            await self.jobs_state.update_one(
+                {"_id": job.name},
+                {"$set": {
+                    "last_run_at": started_at,
+                    "last_status": status,
+                    "last_duration_ms": duration_ms,
+                    "last_error": error,
+                }}
+            )
+            if status == "success":
+                logger.info(f"Job {job.name} finished in {duration_ms:.0f}ms")
+
+    def _cancel_running(self):
+        for task in self._running.values():
+            task.cancel()
+
+    async def run(self):
+        """Leader election and dispatch loop; start once per worker"""
+        logger.info(f"Scheduler started on {self.worker_id} with {len(self.jobs)} job(s)")
+        try:
+            while True:
+                try:
+                    leader = await self._renew_leadership()
+                    if leader != self.is_leader:
+                        logger.info(f"Scheduler {'acquired' if leader else 'lost'} leadership on {self.worker_id}")
+                        if not leader:
+                            self._cancel_running()
+                    self.is_leader = leader
+                    if leader:
+                        await self._start_due_jobs()
+                except Exception as e:
+                    logger.error(f"Scheduler error: {str(e)}")
+                await asyncio.sleep(self.tick_seconds)
+        except asyncio.CancelledError:
+            self._cancel_running()
+            if self.is_leader:
+                await self._release_leadership()
+            raise
+
+    async def trigger(self, name: str, requested_by: str) -> datetime:
+        """Ask the leader to run a job on its next tick"""
+        if name not in self.jobs:
+            raise KeyError(name)
+        now = datetime.now(timezone.utc)
+        await self.jobs_state.update_one(
+            {"_id": name},
+            {"$set": {"next_run_at": now, "triggered_by": requested_by}},
+            upsert=True
+        )
+        return now
+
+    async def status(self) -> List[Dict[str, Any]]:
+        states = {state["_id"]: state async for state in self.jobs_state.find({"_id": {"$in": list(self.jobs)}})}
+        jobs = []
+        for job in self.jobs.values():
+            state = states.get(job.name, {})
+            jobs.append({
+                **job.describe(),
+                "next_run_at": state.get("next_run_at"),
+                "last_run_at": state.get("last_run_at"),
+                "last_status": state.get("last_status"),
+                "last_duration_ms": state.get("last_duration_ms"),
+                "last_error": state.get("last_error"),
+                "pending_trigger": bool(state.get("triggered_by")),
+            })
+        return jobs
+
+    async def leader(self) -> Optional[Dict[str, Any]]:
+        return await self.locks.find_one({"_id": LEADER_LOCK_ID}, {"_id": 0})
+
+    async def history(self, name: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        query = {"job": name} if name else {}
+        return await self.runs.find(query, {"_id": 0}).sort("started_at", -1).to_list(limit)
@@ -0,0 +1,308 @@
+"""
+Pre-rendered HTML snapshots of public pages for crawlers
+
+The shop is a single-page app: a crawler fetching /shop/<id> gets an
+empty shell whose title and meta tags only exist once several API calls
+have run. For the pages worth indexing (products, history articles and
+published custom pages) this module renders a small static document
+instead: title, meta description, canonical and hreflang links,
+OpenGraph/Twitter tags, JSON-LD and the page text.
+
+Snapshots are files under SEO_SNAPSHOT_DIR, one per page and language,
+named after a version hash of what they show (the document's updated_at,
+stock and rating fields, and the SEO settings' updated_at). Serving one
+costs a projected read of those fields and a file read; a stale version
+is re-rendered on the spot. Content writes also re-render in the
+background (refresh_snapshots), so the next crawl finds the file ready.
+
+BotSnapshotMiddleware sends crawler requests for /shop/<id>,
+/history/<id> and /page/<slug> to these snapshots, for deployments where
+the proxy forwards crawler traffic to the API; anything else can fetch
+/api/seo/snapshots/<kind>/<key> directly.
+"""
+import os
+import re
+import json
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import quote
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+from markupsafe import Markup
+
+from core import db, catalog_db, menu_cache
+from email_templates import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE, RTL_LANGUAGES, SHOP_NAME, localized, normalize_language
+from models import SEOSettings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(os.environ.get('SEO_SNAPSHOT_DIR', Path(__file__).parent / "seo_snapshots"))
+TEMPLATE_DIR = Path(__file__).parent / "templates" / "seo"
+BOT_USER_AGENTS = re.compile(
+    os.environ.get(
+        'SEO_BOT_USER_AGENTS',
+        r"googlebot|bingbot|yandex|baiduspider|duckduckbot|slurp|applebot|facebookexternalhit|"
+        r"twitterbot|linkedinbot|pinterest|whatsapp|telegrambot|discordbot|slackbot|embedly"
+    ),
+    re.IGNORECASE
+)
+
+# kind -> where the document lives, how it is looked up, its public path and what changes its snapshot
+SNAPSHOT_SOURCES: Dict[str, Dict[str, Any]] = {
+    "product": {
+        "collection": "products",
+        "key": "id",
+        "query": {},
+        "path": "/shop/{}",
+        "version_fields": ["updated_at", "created_at", "in_stock", "price", "rating_count", "rating_avg"],
+    },
+    "history": {
+        "collection": "historical_content",
+        "key": "id",
+        "query": {},
+        "path": "/history/{}",
+        "version_fields": ["updated_at", "created_at"],
+    },
+    "page": {
+        "collection": "custom_pages",
+        "key": "slug",
+        "query": {"is_published": True},
+        "path": "/page/{}",
+        "version_fields": ["updated_at", "created_at"],
+    },
+}
+# Public path prefix -> kind, for BotSnapshotMiddleware
+PUBLIC_PATHS = {"shop": "product", "history": "history", "page": "page"}
+_PUBLIC_PATH = re.compile(r"^/(shop|history|page)/([^/]+)/?$")
+
+environment = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=select_autoescape(enabled_extensions=("html",)),
+    undefined=StrictUndefined,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+def _json_ld(data: Dict[str, Any]) -> Markup:
+    # "</" would end the <script> element early
+    return Markup(json.dumps(data, ensure_ascii=False, default=str).replace("</", "<\\/"))
+
+
+def _summary(text: str, length: int = 160) -> str:
+    """Plain-text excerpt for meta descriptions"""
+    text = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", text or "")).strip()
+    return text if len(text) <= length else text[:length - 1].rsplit(" ", 1)[0] + "…"
+
+
+environment.filters["localized"] = localized
+environment.filters["summary"] = _summary
+environment.filters["json_ld"] = _json_ld
+
+
+async def get_seo_settings() -> Dict[str, Any]:
+    settings = menu_cache.get("seo_settings")
+    if settings is None:
+        # Primary read: a lagging secondary would put the pre-invalidation settings back for a whole TTL
+        settings = await db.seo_settings.find_one({"id": "seo_settings"}, {"_id": 0}) or SEOSettings().model_dump()
+        menu_cache.set("seo_settings", settings)
+    return settings
+
+
+def _version(kind: str, document: Dict[str, Any], settings: Dict[str, Any]) -> str:
+    fields = [document.get(field) for field in SNAPSHOT_SOURCES[kind]["version_fields"]]
+    fields.append(settings.get("updated_at"))
+    return hashlib.sha1(repr(fields).encode()).hexdigest()[:16]
+
+
+def _snapshot_stem(kind: str, key: str, language: str) -> Path:
+    # Keys are ids or admin-chosen slugs: hash them into safe file names
+    return SNAPSHOT_DIR / kind / f"{hashlib.sha1(key.encode()).hexdigest()}.{language}"
+
+
+def _absolute(base_url: str, path: str) -> str:
+    if not path or re.match(r"^https?://", path):
+        return path
+    return f"{base_url}{path}" if base_url else path
+
+
+def render_snapshot(kind: str, document: Dict[str, Any], settings: Dict[str, Any], language: str) -> str:
+    """The snapshot HTML of one document (CPU work: async code runs it in a thread)"""
+    source = SNAPSHOT_SOURCES[kind]
+    base_url = (settings.get("canonical_url") or "").rstrip("/")
+    path = source["path"].format(document[source["key"]])
+    site_name = localized(settings.get("site_title"), language) or SHOP_NAME
+
+    if kind == "product":
+        title = localized(document.get("name"), language)
+        body = localized(document.get("description"), language)
+        images = [_absolute(base_url, url) for url in document.get("image_urls") or []]
+        structured = {
+            "@context": "https://schema.org",
+            "@type": "Product",
+            "name": title,
+            "description": _summary(body, 500),
+            "image": images,
+            "sku": document["id"],
+            "category": document.get("category"),
+            "offers": {
+                "@type": "Offer",
+                "price": f"{document.get('price', 0):.2f}",
+                "priceCurrency": document.get("currency", "EUR"),
+                "availability": "https://schema.org/InStock" if document.get("in_stock", True) else "https://schema.org/OutOfStock",
+                "url": _absolute(base_url, path),
+            },
+        }
+        if document.get("rating_count"):
+            structured["aggregateRating"] = {
+                "@type": "AggregateRating",
+                "ratingValue": document.get("rating_avg"),
+                "reviewCount": document["rating_count"],
+            }
+        og_type = "product"
+    elif kind == "history":
+        title = localized(document.get("title"), language)
+        body = localized(document.get("content"), language)
+        images = [_absolute(base_url, url) for url in document.get("image_urls") or []]
+        structured = {
+            "@context": "https://schema.org",
+            "@type": "Article",
+            "headline": title,
+            "image": images,
+            "datePublished": document.get("created_at"),
+            "dateModified": document.get("updated_at") or document.get("created_at"),
+            "publisher": {"@type": "Organization", "name": site_name},
+        }
+        og_type = "article"
+    else:
+        title = localized(document.get("title"), language)
+        body = localized(document.get("content"), language)
+        images = []
+        structured = {
+            "@context": "https://schema.org",
+            "@type": "WebPage",
+            "name": title,
+            "dateModified": document.get("updated_at") or document.get("created_at"),
+        }
+        og_type = "website"
+
+    description = _summary(localized(document.get("meta_description"), language) or body) \
+        or localized(settings.get("site_description"), language)
+    structured["description"] = structured.get("description") or description
+    image = images[0] if images else _absolute(base_url, settings.get("og_image") or "")
+
+    return environment.get_template("snapshot.html").render(
+        kind=kind,
+        language=language,
+        direction="rtl" if language in RTL_LANGUAGES else "ltr",
+        title=title,
+        site_name=site_name,
+        description=description,
+        keywords=localized(settings.get("site_keywords"), language),
+        canonical=_absolute(base_url, path) + ("" if language == DEFAULT_LANGUAGE else f"?lang={language}"),
+        alternates={lang: _absolute(base_url, path) + ("" if lang == DEFAULT_LANGUAGE else f"?lang={lang}") for lang in SUPPORTED_LANGUAGES},
+        default_url=_absolute(base_url, path),
+        og_type=og_type,
+        image=image,
+        images=images,
+        twitter_handle=settings.get("twitter_handle") or "",
+        structured_data=structured if settings.get("structured_data_enabled", True) else None,
+        # Custom pages hold admin-authored HTML; product and history texts are plain
+        body=Markup(body) if kind == "page" else body,
+        document=document,
+    )
+
+
+def _write_snapshot(stem: Path, version: str, html: str) -> None:
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    target = stem.with_name(f"{stem.name}.{version}.html")
+    temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temporary.write_text(html, encoding="utf-8")
+    os.replace(temporary, target)
+    # Older versions of the same page and language are dead
+    for old in stem.parent.glob(f"{stem.name}.*.html"):
+        if old != target:
+            old.unlink(missing_ok=True)
+
+
+def _read_snapshot(stem: Path, version: str) -> Optional[str]:
+    try:
+        return stem.with_name(f"{stem.name}.{version}.html").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+async def get_snapshot(kind: str, key: str, language: str) -> Optional[Tuple[str, str]]:
+    """
+    The snapshot of one page, rendered if missing or stale
+
+    Returns:
+        (html, version), or None when the document does not exist or is not public
+    """
+    source = SNAPSHOT_SOURCES[kind]
+    language = normalize_language(language)
+    collection = catalog_db[source["collection"]]
+    query = {source["key"]: key, **source["query"]}
+    projection = {"_id": 0, **{field: 1 for field in source["version_fields"]}}
+    current = await collection.find_one(query, projection)
+    if current is None:
+        return None
+
+    settings = await get_seo_settings()
+    version = _version(kind, current, settings)
+    stem = _snapshot_stem(kind, key, language)
+    html = await asyncio.to_thread(_read_snapshot, stem, version)
+    if html is not None:
+        return html, version
+
+    document = await collection.find_one(query, {"_id": 0})
+    if document is None:
+        return None
+    version = _version(kind, document, settings)
+    html = await asyncio.to_thread(render_snapshot, kind, document, settings, language)
+    await asyncio.to_thread(_write_snapshot, stem, version, html)
+    return html, version
+
+
+async def refresh_snapshots(kind: str, key: str) -> None:
+    """Re-render a page in every language after its content changed (background task)"""
+    try:
+        for language in SUPPORTED_LANGUAGES:
+            if await get_snapshot(kind, key, language) is None:
+                await remove_snapshots(kind, key)
+                return
+    except Exception as e:
+        logger.error(f"Error refreshing {kind} snapshot {key}: {str(e)}")
+
+
+async def remove_snapshots(kind: str, key: str) -> None:
+    """Drop a deleted or unpublished page's snapshots"""
+    def remove():
+        for language in SUPPORTED_LANGUAGES:
+            stem = _snapshot_stem(kind, key, language)
+            for path in stem.parent.glob(f"{stem.name}.*.html"):
+                path.unlink(missing_ok=True)
+    await asyncio.to_thread(remove)
+
+
+def is_bot(user_agent: str) -> bool:
+    return bool(user_agent) and BOT_USER_AGENTS.search(user_agent) is not None
+
+
+class BotSnapshotMiddleware:
+    """Routes crawler requests for public page paths to their snapshot"""
+
+    def __init__(self, app, prefix: str = "/api/seo/snapshots"):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            match = _PUBLIC_PATH.match(scope["path"])
+            if match and is_bot(dict(scope["headers"]).get(b"user-agent", b"").decode("latin-1")):
+                path = f"{self.prefix}/{PUBLIC_PATHS[match.group(1)]}/{match.group(2)}"
+                scope = {**scope, "path": path, "raw_path": quote(path).encode()}
+        await self.app(scope, receive, send)
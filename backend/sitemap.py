@@ -0,0 +1,210 @@
+"""
+Sitemaps
+
+build_sitemaps() (scheduler job "sitemap") lists the public pages (the
+static sections, products, history articles and published custom pages)
+in shards of SITEMAP_SHARD_SIZE documents, each page with its fr/en/ar
+URLs as hreflang alternates and ``lastmod`` from updated_at. A shard is
+only rendered again when its fingerprint (keys and lastmods) changed:
+ids grow with time, so new products land in the last shard of their kind
+and an edit rewrites one shard.
+
+Shards and the sitemap index are stored gzipped in ``sitemap_shards`` so
+every worker serves the same build; each worker copies a version to
+SITEMAP_DIR the first time it is asked for it and serves that file from
+then on. The public URLs need the site's address: SEO settings
+canonical_url, or PUBLIC_SITE_URL.
+"""
+import os
+import gzip
+import hashlib
+import asyncio
+import logging
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote
+from xml.sax.saxutils import escape, quoteattr
+
+from core import db, catalog_db, menu_cache
+from email_templates import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+from seo_snapshots import SNAPSHOT_SOURCES, get_seo_settings
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_DIR = Path(os.environ.get('SITEMAP_DIR', Path(__file__).parent / "sitemaps"))
+SHARD_SIZE = int(os.environ.get('SITEMAP_SHARD_SIZE', 10000))  # documents; each has one URL per language
+STATIC_PATHS = ["/", "/shop", "/history", "/contact", "/testimonials", "/promotions"]
+INDEX = "index"
+
+_URLSET_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:xhtml="http://www.w3.org/1999/xhtml">\n'
+)
+
+
+def site_url(settings: Dict[str, Any]) -> str:
+    return (settings.get("canonical_url") or os.environ.get('PUBLIC_SITE_URL', '')).rstrip("/")
+
+
+def _lastmod(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+def _localized_url(base_url: str, path: str, language: str) -> str:
+    return f"{base_url}{path}" + ("" if language == DEFAULT_LANGUAGE else f"?lang={language}")
+
+
+def render_urlset(base_url: str, entries: List[Tuple[str, Optional[str]]]) -> bytes:
+    """Gzipped <urlset> of (path, lastmod) entries, one <url> per language with its alternates"""
+    parts = [_URLSET_OPEN]
+    for path, lastmod in entries:
+        alternates = "".join(
+            f'<xhtml:link rel="alternate" hreflang="{language}" href={quoteattr(_localized_url(base_url, path, language))}/>'
+            for language in SUPPORTED_LANGUAGES
+        ) + f'<xhtml:link rel="alternate" hreflang="x-default" href={quoteattr(base_url + path)}/>'
+        modified = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+        for language in SUPPORTED_LANGUAGES:
+            parts.append(f"<url><loc>{escape(_localized_url(base_url, path, language))}</loc>{modified}{alternates}</url>\n")
+    parts.append("</urlset>\n")
+    return gzip.compress("".join(parts).encode("utf-8"), mtime=0)
+
+
+def render_index(base_url: str, shards: List[Dict[str, Any]]) -> bytes:
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for shard in shards:
+        modified = f"<lastmod>{shard['lastmod']}</lastmod>" if shard.get("lastmod") else ""
+        location = escape(f"{base_url}/sitemaps/{shard['_id']}.xml.gz")
+        parts.append(f"<sitemap><loc>{location}</loc>{modified}</sitemap>\n")
+    parts.append("</sitemapindex>\n")
+    return gzip.compress("".join(parts).encode("utf-8"), mtime=0)
+
+
+def _fingerprint(base_url: str, entries: List[Tuple[str, Optional[str]]]) -> str:
+    digest = hashlib.sha1(base_url.encode())
+    for path, lastmod in entries:
+        digest.update(f"\0{path}\0{lastmod or ''}".encode())
+    return digest.hexdigest()
+
+
+async def _document_shards():
+    """(name, entries) per shard of each document kind, streamed in id order"""
+    for kind, source in SNAPSHOT_SOURCES.items():
+        number = 0
+        entries: List[Tuple[str, Optional[str]]] = []
+        async for document in catalog_db[source["collection"]].find(
+            source["query"],
+            {"_id": 0, "id": 1, source["key"]: 1, "updated_at": 1, "created_at": 1},
+            batch_size=1000
+        ).sort("id", 1):
+            lastmod = _lastmod(document.get("updated_at") or document.get("created_at"))
+            entries.append((source["path"].format(quote(str(document[source["key"]]), safe="")), lastmod))
+            if len(entries) >= SHARD_SIZE:
+                yield f"{kind}-{number}", entries
+                number += 1
+                entries = []
+        if entries:
+            yield f"{kind}-{number}", entries
+
+
+async def build_sitemaps() -> int:
+    """Rewrite the shards whose content changed, then the index; returns the number of shards rewritten"""
+    settings = await get_seo_settings()
+    base_url = site_url(settings)
+    if not base_url:
+        logger.warning("Sitemap not built: set canonical_url in the SEO settings or PUBLIC_SITE_URL")
+        return 0
+
+    stored = {
+        shard["_id"]: shard["fingerprint"]
+        async for shard in db.sitemap_shards.find({}, {"_id": 1, "fingerprint": 1})
+    }
+    now = datetime.now(timezone.utc)
+    shards: List[Dict[str, Any]] = []
+    rewritten = 0
+
+    async def save(name: str, entries: List[Tuple[str, Optional[str]]]):
+        nonlocal rewritten
+        fingerprint = _fingerprint(base_url, entries)
+        lastmod = max((lastmod for _, lastmod in entries if lastmod), default=None)
+        shards.append({"_id": name, "fingerprint": fingerprint, "lastmod": lastmod})
+        if stored.get(name) == fingerprint:
+            return
+        body = await asyncio.to_thread(render_urlset, base_url, entries)
+        await db.sitemap_shards.update_one(
+            {"_id": name},
+            {"$set": {"fingerprint": fingerprint, "lastmod": lastmod, "gz": body, "built_at": now}},
+            upsert=True
+        )
+        rewritten += 1
+
+    await save("static", [(path, None) for path in STATIC_PATHS])
+    async for name, entries in _document_shards():
+        await save(name, entries)
+
+    # The index fingerprint covers every shard's: it is the build id workers key their copies on
+    names = [shard["_id"] for shard in shards]
+    build = hashlib.sha1("".join(f"{shard['_id']}:{shard['fingerprint']}\n" for shard in shards).encode()).hexdigest()
+    if stored.get(INDEX) != build:
+        await db.sitemap_shards.update_one(
+            {"_id": INDEX},
+            {"$set": {
+                "fingerprint": build,
+                "shards": {shard["_id"]: shard["fingerprint"] for shard in shards},
+                "gz": render_index(base_url, shards),
+                "built_at": now,
+            }},
+            upsert=True
+        )
+        # Shards of a kind that shrank
+        await db.sitemap_shards.delete_many({"_id": {"$nin": names + [INDEX]}})
+        menu_cache.invalidate("sitemap_manifest")
+        logger.info(f"Sitemap rebuilt: {rewritten} of {len(names)} shard(s) rewritten")
+    return rewritten
+
+
+async def _manifest() -> Optional[Dict[str, Any]]:
+    manifest = menu_cache.get("sitemap_manifest")
+    if manifest is None:
+        manifest = await db.sitemap_shards.find_one({"_id": INDEX}, {"_id": 0, "fingerprint": 1, "shards": 1})
+        if manifest is None:
+            return None
+        menu_cache.set("sitemap_manifest", manifest)
+    return manifest
+
+
+def _copy_to_disk(target: Path, body: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(body)
+    os.replace(temporary, target)
+    # Copies of earlier versions
+    for old in target.parent.glob(f"{target.name.split('.', 1)[0]}.*.xml.gz"):
+        if old != target:
+            old.unlink(missing_ok=True)
+
+
+async def get_sitemap_file(name: str) -> Optional[Path]:
+    """Local gzipped copy of the index or a shard of the current build, None if there is none"""
+    for attempt in range(2):
+        manifest = await _manifest()
+        if manifest is None:
+            return None
+        fingerprint = manifest["fingerprint"] if name == INDEX else manifest["shards"].get(name)
+        if fingerprint is None:
+            return None
+        # Named after the content, so a shard that did not change keeps its copy across builds
+        target = SITEMAP_DIR / f"{name}.{fingerprint[:16]}.xml.gz"
+        if await asyncio.to_thread(target.exists):
+            return target
+        shard = await db.sitemap_shards.find_one({"_id": name, "fingerprint": fingerprint}, {"_id": 0, "gz": 1})
+        if shard is not None:
+            await asyncio.to_thread(_copy_to_disk, target, bytes(shard["gz"]))
+            return target
+        # Rebuilt since this worker cached the manifest
+        menu_cache.invalidate("sitemap_manifest")
+    return None
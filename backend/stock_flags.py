@@ -0,0 +1,29 @@
+"""
+Low-stock flag
+
+The rule behind ``is_low_stock``, kept apart from low_stock (which needs
+core's database and settings) so scripts such as seed_data can apply it
+without a JWT secret or the alerting machinery.
+"""
+from typing import Dict, Any
+
+# Same rule as low_stock_fields, for pipeline updates
+LOW_STOCK_EXPR = {"$and": [
+    {"$ne": [{"$ifNull": ["$track_inventory", True]}, False]},
+    {"$lte": [{"$ifNull": ["$stock_quantity", 0]}, {"$ifNull": ["$low_stock_threshold", 5]}]},
+]}
+
+
+def low_stock_fields(product: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fields to $set alongside a stock change
+
+    Args:
+        product: Product document with the values after the write applied
+    """
+    is_low = product.get("track_inventory", True) and product.get("stock_quantity", 0) <= product.get("low_stock_threshold", 5)
+    fields = {"is_low_stock": bool(is_low)}
+    if not is_low:
+        # Re-arm the alert for the next crossing
+        fields["low_stock_notified"] = False
+    return fields
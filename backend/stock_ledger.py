@@ -0,0 +1,216 @@
+"""
+Stock ledger built on the append-only ``stock_adjustments`` log
+
+- stock_after on each adjustment records the resulting stock level
+- stock_snapshots: one document per product and UTC day
+- stock_at(): stock level at any time, from the nearest adjustment or
+  snapshot plus replay of the adjustments in between
+- detect_stock_drift(): products whose stock_quantity disagrees with the ledger
+- compact_stock_adjustments(): rolls old adjustments up into
+  ``stock_adjustment_summaries`` (one per product and month)
+"""
+import os
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional
+
+from pymongo import UpdateOne
+
+from core import db
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def apply_adjustment(stock: int, adjustment: Dict[str, Any]) -> int:
+    """Replay one adjustment the way the write paths applied it (decrements never go below zero)"""
+    if adjustment.get("stock_after") is not None:
+        return adjustment["stock_after"]
+    if adjustment["adjustment_type"] == "set":
+        return adjustment["quantity"]
+    return max(0, stock + adjustment["quantity"])
+
+
+async def take_stock_snapshots(now: Optional[datetime] = None) -> int:
+    """Upsert today's snapshot for every product (re-running on the same day refreshes it)"""
+    now = now or datetime.now(timezone.utc)
+    day = now.strftime('%Y-%m-%d')
+    written = 0
+    operations = []
+    async for product in db.products.find({}, {"_id": 0, "id": 1, "stock_quantity": 1}):
+        operations.append(UpdateOne(
+            {"_id": f"{product['id']}:{day}"},
+            {"$set": {
+                "product_id": product["id"],
+                "day": day,
+                "taken_at": now,
+                "stock_quantity": product.get("stock_quantity", 0),
+            }},
+            upsert=True
+        ))
+        if len(operations) >= BATCH_SIZE:
+            await db.stock_snapshots.bulk_write(operations, ordered=False)
+            written += len(operations)
+            operations = []
+    if operations:
+        await db.stock_snapshots.bulk_write(operations, ordered=False)
+        written += len(operations)
+    return written
+
+
+async def stock_at(product_id: str, at: datetime) -> Dict[str, Any]:
+    """
+    Stock level of a product at a point in time
+
+    Returns:
+        dict: stock, source ("adjustment", "snapshot", "replay" or "none")
+              and the number of adjustments replayed
+    """
+    at = _as_utc(at)
+    latest = await db.stock_adjustments.find_one(
+        {"product_id": product_id, "created_at": {"$lte": at}},
+        {"_id": 0},
+        sort=[("created_at", -1)]
+    )
+    if latest and latest.get("stock_after") is not None:
+        return {"product_id": product_id, "at": at, "stock": latest["stock_after"], "source": "adjustment", "replayed": 0}
+
+    snapshot = await db.stock_snapshots.find_one(
+        {"product_id": product_id, "taken_at": {"$lte": at}},
+        sort=[("taken_at", -1)]
+    )
+    if latest is None:
+        # Nothing moved since the snapshot (or the log before it was compacted)
+        if snapshot:
+            return {"product_id": product_id, "at": at, "stock": snapshot["stock_quantity"], "source": "snapshot", "replayed": 0}
+        return {"product_id": product_id, "at": at, "stock": 0, "source": "none", "replayed": 0}
+
+    # Legacy adjustments without stock_after: replay from the snapshot (or from zero)
+    query = {"product_id": product_id, "created_at": {"$lte": at}}
+    stock = 0
+    if snapshot:
+        query["created_at"]["$gt"] = snapshot["taken_at"]
+        stock = snapshot["stock_quantity"]
+    replayed = 0
+    async for adjustment in db.stock_adjustments.find(query, {"_id": 0}).sort("created_at", 1):
+        stock = apply_adjustment(stock, adjustment)
+        replayed += 1
+    return {"product_id": product_id, "at": at, "stock": stock, "source": "replay", "replayed": replayed}
+
+
+async def detect_stock_drift(concurrency: int = 10) -> List[Dict[str, Any]]:
+    """Compare each tracked product's stock_quantity with the ledger's current value"""
+    now = datetime.now(timezone.utc)
+    products = await db.products.find(
+        {"track_inventory": {"$ne": False}},
+        {"_id": 0, "id": 1, "name": 1, "stock_quantity": 1}
+    ).to_list(None)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def check(product: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            ledger = await stock_at(product["id"], now)
+        if ledger["source"] == "none" or ledger["stock"] == product.get("stock_quantity", 0):
+            return None
+        return {
+            "product_id": product["id"],
+            "name": product.get("name"),
+            "stock_quantity": product.get("stock_quantity", 0),
+            "ledger_stock": ledger["stock"],
+            "difference": product.get("stock_quantity", 0) - ledger["stock"],
+            "source": ledger["source"],
+        }
+
+    results = await asyncio.gather(*(check(product) for product in products))
+    return [drift for drift in results if drift]
+
+
+def _month_start(value: datetime, months_back: int = 0) -> datetime:
+    month_index = value.year * 12 + value.month - 1 - months_back
+    return datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+async def compact_stock_adjustments(older_than_months: Optional[int] = None) -> Dict[str, int]:
+    """
+    Roll adjustments older than the retention window into monthly summaries and delete them
+
+    A snapshot at the cut-off is written first for every affected product,
+    so stock_at() stays exact after the cut-off and day-precise (from the
+    daily snapshots) before it.
+    """
+    if older_than_months is None:
+        older_than_months = int(os.environ.get('STOCK_LEDGER_RETENTION_MONTHS', 12))
+    cutoff = _month_start(datetime.now(timezone.utc), older_than_months)
+
+    summaries = await db.stock_adjustments.aggregate([
+        {"$match": {"created_at": {"$lt": cutoff}}},
+        {"$sort": {"created_at": 1}},
+        {"$group": {
+            "_id": {
+                "product_id": "$product_id",
+                "month": {"$dateToString": {"format": "%Y-%m", "date": "$created_at"}},
+            },
+            "adjustments": {"$sum": 1},
+            "net_quantity": {"$sum": {"$cond": [{"$eq": ["$adjustment_type", "set"]}, 0, "$quantity"]}},
+            "sets": {"$sum": {"$cond": [{"$eq": ["$adjustment_type", "set"]}, 1, 0]}},
+            "orders": {"$sum": {"$cond": [{"$eq": ["$adjustment_type", "order"]}, 1, 0]}},
+            "first_at": {"$first": "$created_at"},
+            "last_at": {"$last": "$created_at"},
+            "closing_stock": {"$last": "$stock_after"},
+        }},
+    ], allowDiskUse=True).to_list(None)
+    if not summaries:
+        return {"summaries": 0, "deleted": 0}
+
+    # Anchor the ledger at the cut-off before the raw rows disappear
+    product_ids = sorted({row["_id"]["product_id"] for row in summaries})
+    anchors = []
+    for product_id in product_ids:
+        state = await stock_at(product_id, cutoff - timedelta(microseconds=1))
+        anchors.append(UpdateOne(
+            {"_id": f"{product_id}:{cutoff.strftime('%Y-%m-%d')}:compaction"},
+            {"$set": {
+                "product_id": product_id,
+                "day": (cutoff - timedelta(days=1)).strftime('%Y-%m-%d'),
+                "taken_at": cutoff - timedelta(microseconds=1),
+                "stock_quantity": state["stock"],
+                "compaction": True,
+            }},
+            upsert=True
+        ))
+    for start in range(0, len(anchors), BATCH_SIZE):
+        await db.stock_snapshots.bulk_write(anchors[start:start + BATCH_SIZE], ordered=False)
+
+    # $inc keeps re-runs and partially compacted months additive
+    operations = []
+    for row in summaries:
+        fields = {"product_id": row["_id"]["product_id"], "month": row["_id"]["month"]}
+        if row["closing_stock"] is not None:
+            fields["closing_stock"] = row["closing_stock"]
+        operations.append(UpdateOne(
+            {"_id": f"{row['_id']['product_id']}:{row['_id']['month']}"},
+            {
+                "$set": fields,
+                "$inc": {
+                    "adjustments": row["adjustments"],
+                    "net_quantity": row["net_quantity"],
+                    "sets": row["sets"],
+                    "orders": row["orders"],
+                },
+                "$min": {"first_at": row["first_at"]},
+                "$max": {"last_at": row["last_at"]},
+            },
+            upsert=True
+        ))
+    for start in range(0, len(operations), BATCH_SIZE):
+        await db.stock_adjustment_summaries.bulk_write(operations[start:start + BATCH_SIZE], ordered=False)
+
+    result = await db.stock_adjustments.delete_many({"created_at": {"$lt": cutoff}})
+    logger.info(f"Compacted {result.deleted_count} stock adjustments older than {cutoff.date()} into {len(operations)} summaries")
+    return {"summaries": len(operations), "deleted": result.deleted_count}
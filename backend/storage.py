@@ -0,0 +1,327 @@
+"""
+Storage backends for uploaded images
+
+STORAGE_BACKEND selects where uploads live:
+- local (default): UPLOAD_DIR on the worker's own disk
+- s3: an S3-compatible bucket (AWS S3, or MinIO/any compatible server via
+  S3_ENDPOINT_URL), so every worker reads and writes the same objects
+
+Image URLs keep the /api/uploads/<name> form unless STORAGE_PUBLIC_BASE_URL
+points at a CDN or public bucket. For the s3 backend, /api/uploads/<name>
+either redirects to a short-lived presigned URL (STORAGE_SERVE_MODE=redirect)
+or streams the object through the API (proxy, the default).
+"""
+import os
+import re
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, AsyncIterator
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+# Uploads are flat names like 01J...XYZ.jpg; anything else is refused before touching storage
+_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,127}")
+STREAM_CHUNK_BYTES = 64 * 1024
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def check_name(name: str) -> str:
+    if not _NAME_PATTERN.fullmatch(name) or ".." in name:
+        raise HTTPException(status_code=400, detail="Invalid file name")
+    return name
+
+
+class StorageBackend(ABC):
+    """Interface shared by the storage backends"""
+
+    supports_presigned_upload = False
+
+    @abstractmethod
+    async def save(self, source: Path, name: str, content_type: Optional[str] = None):
+        """Move a completed local file into storage under ``name``"""
+
+    @abstractmethod
+    async def delete(self, name: str) -> bool:
+        """Remove an object; False if it did not exist"""
+
+    @abstractmethod
+    async def size(self, name: str) -> Optional[int]:
+        """Object size in bytes, None if it does not exist"""
+
+    @abstractmethod
+    async def read_head(self, name: str, length: int) -> bytes:
+        """First ``length`` bytes of an object"""
+
+    @abstractmethod
+    async def delete_many(self, names: List[str]) -> int:
+        """Remove several objects; returns how many were removed"""
+
+    @abstractmethod
+    def iter_objects(self, batch_size: int = 500) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Batches of {name, size, modified} for every stored object"""
+
+    @abstractmethod
+    async def response(self, name: str):
+        """Response serving the object to a client"""
+
+    async def presign_upload(self, name: str, content_type: str, max_bytes: int, expires_in: int) -> Dict[str, Any]:
+        raise HTTPException(status_code=400, detail="Direct uploads are not supported by this storage backend")
+
+    def public_url_prefix(self) -> str:
+        """What public_url() puts before the name"""
+        return "/api/uploads/"
+
+    def public_url(self, name: str) -> str:
+        return f"{self.public_url_prefix()}{check_name(name)}"
+
+
+class LocalStorage(StorageBackend):
+    """Files in a local directory (single host, or a shared volume mounted on every worker)"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, name: str) -> Path:
+        return self.root / check_name(name)
+
+    async def save(self, source: Path, name: str, content_type: Optional[str] = None):
+        # Same filesystem as UPLOAD_TMP_DIR: an atomic rename, readers never see a partial file
+        os.replace(source, self._path(name))
+
+    async def delete(self, name: str) -> bool:
+        try:
+            self._path(name).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def size(self, name: str) -> Optional[int]:
+        try:
+            return self._path(name).stat().st_size
+        except FileNotFoundError:
+            return None
+
+    async def read_head(self, name: str, length: int) -> bytes:
+        with open(self._path(name), "rb") as f:
+            return f.read(length)
+
+    def _unlink_many(self, names: List[str]) -> int:
+        removed = 0
+        for name in names:
+            try:
+                self._path(name).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    async def delete_many(self, names: List[str]) -> int:
+        return await asyncio.to_thread(self._unlink_many, names)
+
+    def _stat_many(self, names: List[str]) -> List[Dict[str, Any]]:
+        objects = []
+        for name in names:
+            try:
+                stat = (self.root / name).stat()
+            except FileNotFoundError:
+                continue
+            objects.append({
+                "name": name,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+            })
+        return objects
+
+    async def iter_objects(self, batch_size: int = 500) -> AsyncIterator[List[Dict[str, Any]]]:
+        # One directory read up front, then stat() a batch at a time off the event loop
+        names = await asyncio.to_thread(
+            lambda: sorted(
+                entry.name for entry in os.scandir(self.root)
+                if entry.is_file() and _NAME_PATTERN.fullmatch(entry.name)
+            )
+        )
+        for start in range(0, len(names), batch_size):
+            yield await asyncio.to_thread(self._stat_many, names[start:start + batch_size])
+
+    async def response(self, name: str):
+        path = self._path(name)
+        if not path.is_file():
+            raise HTTPException(status_code=404, detail="File not found")
+        return FileResponse(path, headers={"Cache-Control": CACHE_CONTROL})
+
+
+class S3Storage(StorageBackend):
+    """Objects in an S3-compatible bucket; boto3 calls run in worker threads"""
+
+    supports_presigned_upload = True
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        public_base_url: Optional[str] = None,
+        serve_mode: str = "proxy",
+        url_expires_in: int = 3600,
+    ):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.public_base_url = public_base_url.rstrip("/") if public_base_url else None
+        self.serve_mode = serve_mode
+        self.url_expires_in = url_expires_in
+        # Credentials come from the usual AWS_* variables / instance profile
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            config=Config(
+                signature_version="s3v4",
+                # MinIO and most self-hosted servers only route path-style requests
+                s3={"addressing_style": "path" if endpoint_url else "auto"},
+            ),
+        )
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}{check_name(name)}"
+
+    async def _head(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.to_thread(self.client.head_object, Bucket=self.bucket, Key=self._key(name))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    async def save(self, source: Path, name: str, content_type: Optional[str] = None):
+        extra = {"CacheControl": CACHE_CONTROL}
+        if content_type:
+            extra["ContentType"] = content_type
+        try:
+            await asyncio.to_thread(
+                self.client.upload_file, str(source), self.bucket, self._key(name), ExtraArgs=extra
+            )
+        finally:
+            source.unlink(missing_ok=True)
+
+    async def delete(self, name: str) -> bool:
+        # DeleteObject succeeds for missing keys, so look first to report 404s
+        if await self._head(name) is None:
+            return False
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=self._key(name))
+        return True
+
+    async def size(self, name: str) -> Optional[int]:
+        head = await self._head(name)
+        return head["ContentLength"] if head else None
+
+    async def read_head(self, name: str, length: int) -> bytes:
+        obj = await asyncio.to_thread(
+            self.client.get_object, Bucket=self.bucket, Key=self._key(name), Range=f"bytes=0-{length - 1}"
+        )
+        return await asyncio.to_thread(obj["Body"].read)
+
+    async def delete_many(self, names: List[str]) -> int:
+        removed = 0
+        # DeleteObjects takes at most 1000 keys
+        for start in range(0, len(names), 1000):
+            result = await asyncio.to_thread(
+                self.client.delete_objects,
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": self._key(name)} for name in names[start:start + 1000]], "Quiet": True}
+            )
+            failed = result.get("Errors", [])
+            for error in failed:
+                logger.error(f"Error deleting {error.get('Key')}: {error.get('Message')}")
+            removed += len(names[start:start + 1000]) - len(failed)
+        return removed
+
+    async def iter_objects(self, batch_size: int = 500) -> AsyncIterator[List[Dict[str, Any]]]:
+        kwargs = {"Bucket": self.bucket, "Prefix": self.prefix, "MaxKeys": min(batch_size, 1000)}
+        while True:
+            page = await asyncio.to_thread(self.client.list_objects_v2, **kwargs)
+            yield [
+                {"name": obj["Key"][len(self.prefix):], "size": obj["Size"], "modified": obj["LastModified"]}
+                for obj in page.get("Contents", [])
+                if _NAME_PATTERN.fullmatch(obj["Key"][len(self.prefix):])
+            ]
+            if not page.get("IsTruncated"):
+                break
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    async def response(self, name: str):
+        key = self._key(name)
+        if self.serve_mode == "redirect":
+            if self.public_base_url:
+                return RedirectResponse(self.public_url(name))
+            url = self.client.generate_presigned_url(
+                "get_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=self.url_expires_in
+            )
+            return RedirectResponse(url)
+
+        try:
+            obj = await asyncio.to_thread(self.client.get_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                raise HTTPException(status_code=404, detail="File not found")
+            raise
+        headers = {"Content-Length": str(obj["ContentLength"]), "Cache-Control": CACHE_CONTROL}
+        if obj.get("ETag"):
+            headers["ETag"] = obj["ETag"]
+        # A sync iterator: Starlette pulls each chunk in its thread pool
+        return StreamingResponse(
+            obj["Body"].iter_chunks(STREAM_CHUNK_BYTES),
+            media_type=obj.get("ContentType") or "application/octet-stream",
+            headers=headers
+        )
+
+    async def presign_upload(self, name: str, content_type: str, max_bytes: int, expires_in: int) -> Dict[str, Any]:
+        """Presigned POST the browser sends the file to, limited to max_bytes and content_type"""
+        presigned = self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=self._key(name),
+            Fields={"Content-Type": content_type, "Cache-Control": CACHE_CONTROL},
+            Conditions=[
+                {"Content-Type": content_type},
+                {"Cache-Control": CACHE_CONTROL},
+                ["content-length-range", 1, max_bytes],
+            ],
+            ExpiresIn=expires_in,
+        )
+        return {"url": presigned["url"], "fields": presigned["fields"]}
+
+    def public_url_prefix(self) -> str:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{self.prefix}"
+        return super().public_url_prefix()
+
+
+def create_storage(upload_dir: Path) -> StorageBackend:
+    """Storage backend configured by STORAGE_BACKEND and the S3_* variables"""
+    backend = os.environ.get('STORAGE_BACKEND', 'local').lower()
+    if backend == 'local':
+        return LocalStorage(upload_dir)
+    if backend == 's3':
+        bucket = os.environ.get('S3_BUCKET')
+        if not bucket:
+            raise ValueError("S3_BUCKET environment variable is required when STORAGE_BACKEND=s3")
+        return S3Storage(
+            bucket=bucket,
+            prefix=os.environ.get('S3_PREFIX', 'uploads'),
+            endpoint_url=os.environ.get('S3_ENDPOINT_URL') or None,
+            region=os.environ.get('S3_REGION') or None,
+            public_base_url=os.environ.get('STORAGE_PUBLIC_BASE_URL') or None,
+            serve_mode=os.environ.get('STORAGE_SERVE_MODE', 'proxy').lower(),
+            url_expires_in=int(os.environ.get('STORAGE_URL_EXPIRES_SECONDS', 3600)),
+        )
+    raise ValueError(f"Unknown STORAGE_BACKEND '{backend}' (expected 'local' or 's3')")
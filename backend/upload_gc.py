@@ -0,0 +1,208 @@
+"""
+Upload reference index and orphaned-upload garbage collection
+
+``upload_refs`` maps each upload filename to the documents whose fields
+point at it (any string containing /uploads/<name> or the storage
+backend's public URL of <name>, so image_url, image_urls, logo_url,
+og_image and images embedded in page or newsletter content all count).
+Admin write paths call sync_upload_refs() after changing a document;
+rebuild_upload_refs() rescans every referencing collection and runs
+before each GC sweep, so writes made outside the API (seed and
+maintenance scripts) are picked up too. Orders are only covered by the
+rebuild: their item images are product images, which the product keeps
+referenced until it is edited or deleted, and the next sweep rebuilds
+before deleting anything.
+
+sweep_orphaned_uploads() walks storage in batches and deletes files no
+document references once they are older than the grace period, which
+leaves time to attach a fresh upload to the product being edited.
+"""
+import os
+import re
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Set, Optional
+
+from pymongo import UpdateOne
+
+from core import db, storage, UPLOAD_TMP_DIR
+from upload_stream import cleanup_stale_temp_files
+
+logger = logging.getLogger(__name__)
+
+# Collection -> projection (None: the whole document)
+REFERENCING_COLLECTIONS: Dict[str, Optional[Dict[str, int]]] = {
+    "products": None,
+    "categories": None,
+    "historical_content": None,
+    "banners": None,
+    "custom_pages": None,
+    "customization": None,
+    "settings": None,
+    "seo_settings": None,
+    # Sent newsletters keep pointing at their images
+    "newsletter_campaigns": {"id": 1, "body_html": 1},
+    # Order history and confirmation emails show the product image of the time
+    "orders": {"id": 1, "items.image_url": 1},
+}
+
+
+def _upload_url_pattern() -> re.Pattern:
+    # /uploads/<name> covers local files, /api/uploads and older URLs; a CDN or bucket base URL adds its own prefix
+    prefixes = sorted({"/uploads/", storage.public_url_prefix()}, key=len, reverse=True)
+    return re.compile(f"(?:{'|'.join(map(re.escape, prefixes))})([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+_UPLOAD_URL = _upload_url_pattern()
+BATCH_SIZE = 500
+
+
+def extract_upload_names(value: Any) -> Set[str]:
+    """Upload filenames referenced anywhere in a document"""
+    names: Set[str] = set()
+    if isinstance(value, str):
+        names.update(_UPLOAD_URL.findall(value))
+    elif isinstance(value, dict):
+        for item in value.values():
+            names |= extract_upload_names(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            names |= extract_upload_names(item)
+    return names
+
+
+def _ref_update(collection: str, document_id: str, filename: str, now: datetime) -> UpdateOne:
+    return UpdateOne(
+        {"_id": f"{collection}:{document_id}:{filename}"},
+        {"$set": {"filename": filename, "collection": collection, "document_id": document_id, "updated_at": now}},
+        upsert=True
+    )
+
+
+async def sync_upload_refs(collection: str, document_id: str):
+    """Bring the index in line with a document after it was created, updated or deleted"""
+    document = await db[collection].find_one({"id": document_id}, REFERENCING_COLLECTIONS.get(collection))
+    names = extract_upload_names(document) if document else set()
+    await db.upload_refs.delete_many({
+        "collection": collection,
+        "document_id": document_id,
+        "filename": {"$nin": sorted(names)},
+    })
+    if names:
+        now = datetime.now(timezone.utc)
+        await db.upload_refs.bulk_write(
+            [_ref_update(collection, document_id, name, now) for name in sorted(names)],
+            ordered=False
+        )
+
+
+async def rebuild_upload_refs() -> int:
+    """Rescan every referencing collection; returns the number of references"""
+    started = datetime.now(timezone.utc)
+    total = 0
+    for collection, projection in REFERENCING_COLLECTIONS.items():
+        operations = []
+        async for document in db[collection].find({}, projection):
+            document_id = document.get("id") or str(document["_id"])
+            for name in extract_upload_names(document):
+                operations.append(_ref_update(collection, document_id, name, started))
+            if len(operations) >= BATCH_SIZE:
+                await db.upload_refs.bulk_write(operations, ordered=False)
+                total += len(operations)
+                operations = []
+        if operations:
+            await db.upload_refs.bulk_write(operations, ordered=False)
+            total += len(operations)
+    # References synced by writes during the scan carry a later timestamp and survive
+    await db.upload_refs.delete_many({"updated_at": {"$lt": started}})
+    return total
+
+
+async def find_upload_refs(filename: str, limit: int = 20):
+    return await db.upload_refs.find(
+        {"filename": filename},
+        {"_id": 0, "collection": 1, "document_id": 1}
+    ).to_list(limit)
+
+
+def _temp_usage() -> Dict[str, int]:
+    files = 0
+    size = 0
+    for path in UPLOAD_TMP_DIR.glob("*.part"):
+        try:
+            size += path.stat().st_size
+            files += 1
+        except FileNotFoundError:
+            pass
+    return {"files": files, "bytes": size}
+
+
+async def sweep_orphaned_uploads(
+    dry_run: bool = False,
+    rebuild: bool = True,
+    grace_hours: Optional[float] = None,
+    batch_size: int = BATCH_SIZE
+) -> Dict[str, Any]:
+    """
+    Delete stored uploads nobody references once past the grace period
+
+    Args:
+        dry_run: Only report what would be deleted (the admin usage report)
+        rebuild: Rescan the referencing collections first
+        grace_hours: Minimum age of an unreferenced file before it is deleted
+
+    Returns:
+        dict: files/bytes totals, referenced, orphaned, reclaimable and deleted counts
+    """
+    if grace_hours is None:
+        grace_hours = float(os.environ.get('UPLOAD_GC_GRACE_HOURS', 24))
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=grace_hours)
+    if rebuild:
+        await rebuild_upload_refs()
+    # An empty index against a non-empty store means a wrong or freshly restored database, not garbage
+    if not dry_run and not await db.upload_refs.find_one({}):
+        dry_run = True
+        logger.warning("Upload GC found no referenced uploads at all; not deleting anything")
+
+    report = {
+        "backend": type(storage).__name__,
+        "grace_hours": grace_hours,
+        "files": 0, "bytes": 0,
+        "referenced_files": 0, "referenced_bytes": 0,
+        "orphaned_files": 0, "orphaned_bytes": 0,
+        "reclaimable_files": 0, "reclaimable_bytes": 0,
+        "deleted_files": 0, "deleted_bytes": 0,
+    }
+    async for batch in storage.iter_objects(batch_size):
+        if not batch:
+            continue
+        referenced = set(await db.upload_refs.distinct("filename", {"filename": {"$in": [obj["name"] for obj in batch]}}))
+        candidates = {}
+        for obj in batch:
+            report["files"] += 1
+            report["bytes"] += obj["size"]
+            if obj["name"] in referenced:
+                report["referenced_files"] += 1
+                report["referenced_bytes"] += obj["size"]
+                continue
+            report["orphaned_files"] += 1
+            report["orphaned_bytes"] += obj["size"]
+            if obj["modified"] < cutoff:
+                report["reclaimable_files"] += 1
+                report["reclaimable_bytes"] += obj["size"]
+                candidates[obj["name"]] = obj["size"]
+        if dry_run or not candidates:
+            continue
+
+        # A write may have attached one of these files since the batch was checked
+        still_used = set(await db.upload_refs.distinct("filename", {"filename": {"$in": list(candidates)}}))
+        doomed = [name for name in candidates if name not in still_used]
+        report["deleted_files"] += await storage.delete_many(doomed)
+        report["deleted_bytes"] += sum(candidates[name] for name in doomed)
+
+    ttl_seconds = int(os.environ.get('UPLOAD_SESSION_TTL_HOURS', 24)) * 3600
+    if not dry_run:
+        await asyncio.to_thread(cleanup_stale_temp_files, UPLOAD_TMP_DIR, ttl_seconds)
+    report["temp"] = await asyncio.to_thread(_temp_usage)
+    return report
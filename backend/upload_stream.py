@@ -0,0 +1,212 @@
+"""
+Streaming image uploads
+
+The request body is parsed incrementally (python-multipart) and written
+chunk by chunk to a temp file, so neither the whole file nor a spooled
+copy is ever held by the worker. Sizes are checked against Content-Length
+before the body is read and again while streaming; the image type comes
+from the file's magic bytes, not the client's content type; the temp file
+is handed to the storage backend only once complete, so a failed upload
+never leaves a partial image behind.
+"""
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Optional, List
+
+import aiofiles
+from fastapi import HTTPException, Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from ids import new_id
+from storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = int(os.environ.get('UPLOAD_MAX_BYTES', 10 * 1024 * 1024))
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # boundaries and part headers around the file
+
+# Signature prefix -> extension
+_MAGIC = [
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+]
+SNIFF_BYTES = 12
+
+IMAGE_CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """Extension for a supported image signature, None otherwise"""
+    for signature, extension in _MAGIC:
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def too_large(limit: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File size exceeds {limit // (1024 * 1024)}MB limit")
+
+
+def check_content_length(request: Request, limit: int, overhead: int = 0) -> Optional[int]:
+    """Reject oversized bodies from the header alone, before reading anything"""
+    header = request.headers.get("content-length")
+    if header is None:
+        return None
+    try:
+        length = int(header)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length")
+    if length > limit + overhead:
+        raise too_large(limit)
+    return length
+
+
+class TempImageFile:
+    """Temp file in tmp_dir, handed to the storage backend once committed"""
+
+    def __init__(self, tmp_dir: Path, limit: int = MAX_UPLOAD_BYTES, path: Optional[Path] = None):
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.path = path or tmp_dir / f"{new_id()}.part"
+        self.limit = limit
+        self.size = 0
+        self.head = b""
+        self._file = None
+
+    async def open(self, mode: str = "wb"):
+        self._file = await aiofiles.open(self.path, mode)
+        return self
+
+    async def write(self, data: bytes):
+        self.size += len(data)
+        if self.size > self.limit:
+            raise too_large(self.limit)
+        if len(self.head) < SNIFF_BYTES:
+            self.head += data[:SNIFF_BYTES - len(self.head)]
+        await self._file.write(data)
+
+    async def close(self):
+        if self._file is not None:
+            await self._file.close()
+            self._file = None
+
+    async def commit(self, storage: StorageBackend, name: Optional[str] = None, head: Optional[bytes] = None) -> str:
+        """Validate the signature and store the file; returns the final filename"""
+        await self.close()
+        extension = sniff_image_type(head if head is not None else self.head)
+        if extension is None:
+            self.discard()
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid file type. Allowed types: image/jpeg, image/png, image/webp, image/gif"
+            )
+        filename = f"{name or new_id()}.{extension}"
+        try:
+            await storage.save(self.path, filename, IMAGE_CONTENT_TYPES[extension])
+        except BaseException:
+            self.discard()
+            raise
+        return filename
+
+    def discard(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def cleanup_stale_temp_files(tmp_dir: Path, max_age_seconds: float) -> int:
+    """Remove temp and partial uploads abandoned for longer than max_age_seconds"""
+    if not tmp_dir.exists():
+        return 0
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for path in tmp_dir.glob("*.part"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+async def stream_multipart_image(request: Request, tmp_dir: Path, field_name: str = "file") -> TempImageFile:
+    """
+    Stream the ``field_name`` part of a multipart body into a temp file
+
+    The caller commits or discards the returned file.
+    """
+    check_content_length(request, MAX_UPLOAD_BYTES, MULTIPART_OVERHEAD_BYTES)
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data body")
+
+    target = await TempImageFile(tmp_dir).open()
+    pending: List[bytes] = []
+    state = {"header_field": b"", "header_value": b"", "headers": {}, "in_file": False, "found": False}
+
+    def on_part_begin():
+        state["headers"] = {}
+
+    def on_header_field(data, start, end):
+        state["header_field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["header_value"] += data[start:end]
+
+    def on_header_end():
+        state["headers"][state["header_field"].lower()] = state["header_value"]
+        state["header_field"] = b""
+        state["header_value"] = b""
+
+    def on_headers_finished():
+        _, disposition = parse_options_header(state["headers"].get(b"content-disposition", b""))
+        state["in_file"] = disposition.get(b"name") == field_name.encode() and not state["found"]
+        if state["in_file"]:
+            state["found"] = True
+
+    def on_part_data(data, start, end):
+        if state["in_file"]:
+            pending.append(data[start:end])
+
+    def on_part_end():
+        state["in_file"] = False
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            for data in pending:
+                await target.write(data)
+            pending.clear()
+        parser.finalize()
+        for data in pending:
+            await target.write(data)
+        await target.close()
+        if not state["found"] or target.size == 0:
+            raise HTTPException(status_code=400, detail=f"Missing '{field_name}' file field")
+        return target
+    except BaseException:
+        await target.close()
+        target.discard()
+        raise
@@ -0,0 +1,297 @@
+"""
+Synthetic data sets for the benchmark suite.
+
+Documents follow the shapes of the API models in backend/server.py so the
+endpoints under test see realistic payloads and index selectivity.
+"""
+import random
+import uuid
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Iterator
+
+BATCH_SIZE = 5000
+
+# Full-size data set; --scale shrinks every collection proportionally
+FULL_SIZES = {
+    "categories": 12,
+    "products": 10000,
+    "users": 20000,
+    "orders": 500000,
+    "stock_adjustments": 1000000,
+    "testimonials": 20000,
+    "historical_content": 200,
+    "banners": 6,
+    "navigation": 8,
+    "promo_codes": 50,
+}
+
+CATEGORY_SLUGS = [
+    "dattes", "huiles", "epices", "thes", "miels", "patisseries",
+    "robes-kabyles", "bijoux-kabyles", "poteries", "tapis", "savons", "coffrets",
+]
+REGIONS = ["algerie", "kabylie", "vallee-soumam"]
+CITIES = ["Paris", "Lyon", "Marseille", "Lille", "Toulouse", "Bordeaux", "Nantes", "Alger", "Béjaïa", "Tizi Ouzou"]
+ORIGINS = ["Biskra", "Béjaïa", "Tizi Ouzou", "Akbou", "Sidi Aïch", "Ghardaïa"]
+ORDER_STATUSES = ["pending", "confirmed", "processing", "shipped", "delivered", "cancelled"]
+
+ADMIN_EMAIL = "bench-admin@example.com"
+PROMO_CODE = "BENCH10"
+
+
+def scaled_sizes(scale: float) -> Dict[str, int]:
+    return {name: max(1, int(size * scale)) for name, size in FULL_SIZES.items()}
+
+
+def _i18n(fr: str) -> Dict[str, str]:
+    return {"fr": fr, "en": f"{fr} (en)", "ar": f"{fr} (ar)"}
+
+
+def _past(rng: random.Random, days: int = 730) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(seconds=rng.randint(0, days * 86400))
+
+
+def categories(rng: random.Random, count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        slug = CATEGORY_SLUGS[i % len(CATEGORY_SLUGS)] + ("" if i < len(CATEGORY_SLUGS) else f"-{i}")
+        yield {
+            "id": str(uuid.uuid4()),
+            "name": _i18n(slug.replace("-", " ").title()),
+            "slug": slug,
+            "description": _i18n(f"Catégorie {slug}"),
+            "icon": "🛍️",
+            "image_url": None,
+            "order": i,
+            "is_active": True,
+            "created_at": _past(rng),
+        }
+
+
+def products(rng: random.Random, count: int, category_slugs: List[str]) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        stock = rng.choice([0, 1, 3, 5, 10, 25, 50, 100, 250])
+        yield {
+            "id": str(uuid.uuid4()),
+            "name": _i18n(f"Produit {i}"),
+            "description": _i18n("Produit artisanal du terroir algérien. " * 8),
+            "category": rng.choice(category_slugs),
+            "price": round(rng.uniform(3, 250), 2),
+            "currency": "EUR",
+            "image_urls": [f"/api/uploads/bench-{i}-{n}.jpg" for n in range(rng.randint(1, 4))],
+            "in_stock": True,
+            "track_inventory": True,
+            "stock_quantity": stock,
+            "low_stock_threshold": 5,
+            # Backorders keep the checkout scenario from failing once stock runs out
+            "allow_backorder": True,
+            "origin": _i18n(rng.choice(ORIGINS)),
+            "created_at": _past(rng),
+            "created_by": None,
+        }
+
+
+def users(rng: random.Random, count: int, hashed_password: str) -> Iterator[Dict[str, Any]]:
+    yield {
+        "id": str(uuid.uuid4()),
+        "email": ADMIN_EMAIL,
+        "full_name": "Bench Admin",
+        "role": "admin",
+        "is_active": True,
+        "hashed_password": hashed_password,
+        "created_at": _past(rng),
+    }
+    for i in range(count - 1):
+        yield {
+            "id": str(uuid.uuid4()),
+            "email": f"client{i}@example.com",
+            "full_name": f"Client {i}",
+            "role": "user",
+            "is_active": True,
+            "hashed_password": hashed_password,
+            "created_at": _past(rng),
+        }
+
+
+def orders(rng: random.Random, count: int, product_docs: List[Dict[str, Any]], user_count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        items = []
+        for product in rng.sample(product_docs, k=min(len(product_docs), rng.randint(1, 4))):
+            items.append({
+                "product_id": product["id"],
+                "product_name": product["name"]["fr"],
+                "quantity": rng.randint(1, 3),
+                "price": product["price"],
+                "image_url": product["image_urls"][0],
+            })
+        subtotal = round(sum(item["price"] * item["quantity"] for item in items), 2)
+        created_at = _past(rng)
+        status = rng.choice(ORDER_STATUSES)
+        customer = rng.randrange(user_count)
+        yield {
+            "id": str(uuid.uuid4()),
+            "order_number": f"ORD-{created_at.strftime('%Y%m%d')}-{i:08d}",
+            "user_id": None,
+            "customer_name": f"Client {customer}",
+            "customer_email": f"client{customer}@example.com",
+            "customer_phone": f"+33 6 {rng.randint(10000000, 99999999)}",
+            "shipping_address": f"{rng.randint(1, 200)} rue de la Soummam",
+            "shipping_city": rng.choice(CITIES),
+            "shipping_postal_code": f"{rng.randint(10000, 95999)}",
+            "items": items,
+            "subtotal": subtotal,
+            "shipping_cost": 0.0,
+            "promo_code": PROMO_CODE if rng.random() < 0.1 else None,
+            "discount_amount": 0.0,
+            "total": subtotal,
+            "payment_method": rng.choice(["cash", "bank_transfer", "paypal"]),
+            "payment_status": "paid" if status in ("shipped", "delivered") else "pending",
+            "status": status,
+            "notes": None,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def stock_adjustments(rng: random.Random, count: int, product_ids: List[str]) -> Iterator[Dict[str, Any]]:
+    for _ in range(count):
+        adjustment_type = rng.choice(["increase", "decrease", "order", "order", "order", "set"])
+        quantity = rng.randint(1, 20)
+        yield {
+            "id": str(uuid.uuid4()),
+            "product_id": rng.choice(product_ids),
+            "adjustment_type": adjustment_type,
+            "quantity": quantity if adjustment_type in ("increase", "set") else -quantity,
+            "reason": "bench",
+            "notes": None,
+            "performed_by": ADMIN_EMAIL,
+            "created_at": _past(rng),
+        }
+
+
+def testimonials(rng: random.Random, count: int, product_ids: List[str]) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        approved = rng.random() < 0.8
+        created_at = _past(rng)
+        yield {
+            "id": str(uuid.uuid4()),
+            "customer_name": f"Client {i}",
+            "customer_email": f"client{i}@example.com",
+            "rating": rng.choice([3, 4, 4, 5, 5, 5]),
+            "comment": "Très bon produit, livraison rapide. " * 3,
+            "product_id": rng.choice(product_ids) if rng.random() < 0.7 else None,
+            "is_approved": approved,
+            "created_at": created_at,
+            "approved_at": created_at if approved else None,
+            "approved_by": None,
+        }
+
+
+def historical_content(rng: random.Random, count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        yield {
+            "id": str(uuid.uuid4()),
+            "title": _i18n(f"Histoire {i}"),
+            "content": _i18n("Récit historique de la vallée de la Soummam. " * 40),
+            "region": rng.choice(REGIONS),
+            "image_urls": [f"/api/uploads/history-{i}.jpg"],
+            "created_at": _past(rng),
+            "created_by": None,
+        }
+
+
+def banners(rng: random.Random, count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        yield {
+            "id": str(uuid.uuid4()),
+            "title": _i18n(f"Bannière {i}"),
+            "subtitle": _i18n("Sous-titre"),
+            "description": _i18n("Description"),
+            "image_url": f"/api/uploads/banner-{i}.jpg",
+            "cta_text": _i18n("Découvrir"),
+            "cta_link": "/shop",
+            "order": i,
+            "is_active": True,
+            "background_color": None,
+            "created_at": _past(rng),
+            "updated_at": _past(rng),
+        }
+
+
+def navigation(rng: random.Random, count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        yield {
+            "id": str(uuid.uuid4()),
+            "label": _i18n(f"Menu {i}"),
+            "url": f"/page-{i}",
+            "is_external": False,
+            "order": i,
+            "is_active": True,
+            "icon": None,
+            "created_at": _past(rng),
+            "updated_at": _past(rng),
+        }
+
+
+def promo_codes(rng: random.Random, count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        now = datetime.now(timezone.utc)
+        yield {
+            "id": str(uuid.uuid4()),
+            "code": PROMO_CODE if i == 0 else f"BENCH{i:04d}",
+            "description": _i18n("Remise de test"),
+            "discount_type": "percentage",
+            "discount_value": 10.0,
+            "min_order_amount": None,
+            "max_discount_amount": None,
+            "usage_limit": None,
+            "usage_count": 0,
+            "user_usage_limit": None,
+            "valid_from": now - timedelta(days=30),
+            "valid_until": now + timedelta(days=365),
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+async def _insert(collection, docs: Iterator[Dict[str, Any]]) -> int:
+    inserted = 0
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) >= BATCH_SIZE:
+            await collection.insert_many(batch, ordered=False)
+            inserted += len(batch)
+            batch = []
+    if batch:
+        await collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    return inserted
+
+
+async def seed(db, sizes: Dict[str, int], hashed_password: str, seed_value: int = 42) -> Dict[str, int]:
+    """Drop and repopulate every benchmark collection, returning inserted counts"""
+    rng = random.Random(seed_value)
+    for name in sizes:
+        await db[name].delete_many({})
+
+    counts = {}
+    category_docs = list(categories(rng, sizes["categories"]))
+    product_docs = list(products(rng, sizes["products"], [c["slug"] for c in category_docs]))
+    # The API maintains product_count on writes; seed it to match
+    per_category = Counter(p["category"] for p in product_docs)
+    for category in category_docs:
+        category["product_count"] = per_category[category["slug"]]
+    counts["categories"] = await _insert(db.categories, iter(category_docs))
+    counts["products"] = await _insert(db.products, iter(product_docs))
+    product_ids = [p["id"] for p in product_docs]
+
+    counts["users"] = await _insert(db.users, users(rng, sizes["users"], hashed_password))
+    counts["orders"] = await _insert(db.orders, orders(rng, sizes["orders"], product_docs, sizes["users"]))
+    counts["stock_adjustments"] = await _insert(db.stock_adjustments, stock_adjustments(rng, sizes["stock_adjustments"], product_ids))
+    counts["testimonials"] = await _insert(db.testimonials, testimonials(rng, sizes["testimonials"], product_ids))
+    counts["historical_content"] = await _insert(db.historical_content, historical_content(rng, sizes["historical_content"]))
+    counts["banners"] = await _insert(db.banners, banners(rng, sizes["banners"]))
+    counts["navigation"] = await _insert(db.navigation, navigation(rng, sizes["navigation"]))
+    counts["promo_codes"] = await _insert(db.promo_codes, promo_codes(rng, sizes["promo_codes"]))
+    return counts
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+API benchmark suite
+===================
+
+Runs the FastAPI app in-process (no network hop) against a local mongod or
+an in-memory mongomock-motor stand-in, seeds a realistic data set and
+replays scripted scenarios, reporting throughput, latency percentiles and
+MongoDB operations per request.
+
+Usage (from the repository root):
+    python -m benchmarks.run --mongo-url mongodb://localhost:27017
+    python -m benchmarks.run --mock --scale 0.01 --scenarios browse,search
+    python -m benchmarks.run --scale 0.1 --save-baseline
+    python -m benchmarks.run --scale 0.1 --compare --tolerance 0.15
+
+--scale 1.0 seeds 10k products, 500k orders and 1M stock adjustments.
+Seeding is skipped when the target database already holds a data set of
+the same size (use --reseed to force it). Baselines are only comparable
+between runs with the same scale, backend and machine.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from datetime import timedelta, datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REPO_DIR / "backend"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "endSessions", "buildInfo", "saslStart", "saslContinue"}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Délices et Trésors d'Algérie API")
+    parser.add_argument("--mongo-url", default=os.environ.get("BENCH_MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db-name", default=os.environ.get("BENCH_DB_NAME", "delices_bench"))
+    parser.add_argument("--mock", action="store_true", help="Use mongomock-motor instead of a real mongod")
+    parser.add_argument("--scale", type=float, default=1.0, help="Fraction of the full data set to seed")
+    parser.add_argument("--reseed", action="store_true", help="Drop and reseed even if the data set looks current")
+    parser.add_argument("--scenarios", default="browse,browse_v2,search,checkout,admin_dashboard,admin_dashboard_v2")
+    parser.add_argument("--concurrency", type=int, default=16, help="Virtual users per scenario")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="Warm-up requests per scenario")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true", help="Exit 1 when a scenario regresses vs the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression")
+    return parser.parse_args(argv)
+
+
+class CommandCounter:
+    """pymongo CommandListener counting database round trips"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def started(self, event):
+        if event.command_name not in IGNORED_COMMANDS:
+            with self._lock:
+                self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def configure_environment(args) -> Optional[CommandCounter]:
+    """Point the app at the benchmark database before server.py is imported"""
+    os.environ["MONGO_URL"] = args.mongo_url
+    os.environ["DB_NAME"] = args.db_name
+    os.environ.setdefault("JWT_SECRET_KEY", secrets.token_hex(32))
+    # Measure the endpoints, not the abuse protection in front of them
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    # ... or the maintenance jobs and low-stock alerts running on startup
+    os.environ["SCHEDULER_ENABLED"] = "false"
+    os.environ["LOW_STOCK_WATCHER_ENABLED"] = "false"
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    import database
+
+    # One log line per request would swamp the report
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if args.mock:
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("❌ --mock requires mongomock-motor (pip install mongomock-motor)")
+        # Pre-register the stand-in so get_client() hands it to server.py
+        database._clients[args.mongo_url] = AsyncMongoMockClient()
+        return None
+
+    counter = CommandCounter()
+    database.register_listener(counter)
+    return counter
+
+
+async def ensure_dataset(db, args, hashed_password: str) -> Dict[str, int]:
+    from .datasets import scaled_sizes, seed
+
+    sizes = scaled_sizes(args.scale)
+    meta = await db.bench_meta.find_one({"_id": "dataset"})
+    if meta and meta.get("sizes") == sizes and not args.reseed:
+        print(f"♻️  Reusing seeded data set (scale {args.scale})")
+        return meta["counts"]
+
+    print(f"🌱 Seeding data set (scale {args.scale}): {sizes}")
+    started = time.perf_counter()
+    counts = await seed(db, sizes, hashed_password)
+    await db.bench_meta.replace_one(
+        {"_id": "dataset"},
+        {"_id": "dataset", "sizes": sizes, "counts": counts, "seeded_at": datetime.now(timezone.utc)},
+        upsert=True
+    )
+    print(f"   done in {time.perf_counter() - started:.1f}s")
+    return counts
+
+
+async def run_scenario(client, scenario, ctx, args, counter: Optional[CommandCounter]) -> Dict[str, Any]:
+    rng = random.Random(scenario.name)
+    headers = {"Authorization": f"Bearer {ctx.admin_token}"} if scenario.admin else {}
+
+    async def issue(step_index: int, latencies: List[float], errors: List[int]):
+        method, path, body = scenario.steps[step_index % len(scenario.steps)](ctx, rng)
+        started = time.perf_counter()
+        response = await client.request(method, path, json=body, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            errors.append(response.status_code)
+
+    # Warm-up: fill caches and connection pools, not measured
+    for i in range(args.warmup):
+        await issue(i, [], [])
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    ops_before = counter.count if counter else None
+    deadline = time.perf_counter() + args.duration
+
+    async def virtual_user(offset: int):
+        step = offset
+        while time.perf_counter() < deadline:
+            await issue(step, latencies, errors)
+            step += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    requests = len(latencies)
+    return {
+        "requests": requests,
+        "errors": len(errors),
+        "error_statuses": sorted(set(errors)),
+        "rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "db_ops_per_request": round((counter.count - ops_before) / requests, 2) if counter and requests else None,
+    }
+
+
+def print_report(results: Dict[str, Dict[str, Any]]):
+    print("\n📊 RESULTS")
+    print("=" * 88)
+    print(f"{'scenario':<18}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'db ops/req':>12}")
+    print("-" * 88)
+    for name, r in results.items():
+        ops = "n/a" if r["db_ops_per_request"] is None else f"{r['db_ops_per_request']:.2f}"
+        print(f"{name:<18}{r['requests']:>10}{r['errors']:>8}{r['rps']:>10.1f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}{ops:>12}")
+    print("=" * 88)
+
+
+def compare_with_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return human-readable regressions (empty when within tolerance)"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {current['rps']} < baseline {previous['rps']}")
+        for key in ("p95_ms", "p99_ms"):
+            if current[key] > previous[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {current[key]} > baseline {previous[key]}")
+        if current["db_ops_per_request"] is not None and previous.get("db_ops_per_request") is not None:
+            if current["db_ops_per_request"] > previous["db_ops_per_request"] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: db_ops_per_request {current['db_ops_per_request']} > baseline {previous['db_ops_per_request']}"
+                )
+        if current["errors"] > previous.get("errors", 0):
+            regressions.append(f"{name}: {current['errors']} errors (baseline {previous.get('errors', 0)})")
+    return regressions
+
+
+async def main_async(args, counter: Optional[CommandCounter]) -> int:
+    import httpx
+    import core
+    import server
+    from email_service import email_service
+    from .datasets import ADMIN_EMAIL
+    from .scenarios import SCENARIOS, BenchContext
+
+    # Order confirmations would otherwise try to reach SMTP from every checkout
+    email_service.send_email = lambda *args, **kwargs: True
+
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in SCENARIOS]
+    if unknown:
+        print(f"❌ Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(SCENARIOS)}")
+        return 2
+
+    await server.app.router.startup()
+    try:
+        counts = await ensure_dataset(core.db, args, core.get_password_hash("bench-password"))
+
+        product_docs = await core.db.products.find(
+            {}, {"_id": 0, "id": 1, "name": 1, "price": 1, "image_urls": 1}
+        ).limit(2000).to_list(2000)
+        category_slugs = [c["slug"] for c in await core.db.categories.find({}, {"_id": 0, "slug": 1}).to_list(1000)]
+        admin = await core.db.users.find_one({"email": ADMIN_EMAIL})
+        ctx = BenchContext(
+            product_docs=product_docs,
+            category_slugs=category_slugs,
+            admin_token=core.create_user_access_token(admin, expires_delta=timedelta(hours=6)),
+        )
+
+        results = {}
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            for name in selected:
+                scenario = SCENARIOS[name]
+                print(f"🚀 {name}: {scenario.description} ({args.concurrency} users, {args.duration:.0f}s)")
+                results[name] = await run_scenario(client, scenario, ctx, args, counter)
+    finally:
+        await server.app.router.shutdown()
+
+    print_report(results)
+
+    report = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "backend": "mongomock" if args.mock else "mongod",
+        "scale": args.scale,
+        "dataset": counts,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "scenarios": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"💾 Results written to {args.output}")
+
+    exit_code = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"⚠️  No baseline at {args.baseline}; run with --save-baseline first")
+        else:
+            baseline = json.loads(args.baseline.read_text())
+            if baseline.get("scale") != args.scale or baseline.get("backend") != report["backend"]:
+                print("⚠️  Baseline was recorded with a different scale/backend; comparison may be meaningless")
+            regressions = compare_with_baseline(results, baseline, args.tolerance)
+            if regressions:
+                print("\n❌ REGRESSIONS")
+                for line in regressions:
+                    print(f"   - {line}")
+                exit_code = 1
+            else:
+                print(f"\n✅ Within {args.tolerance:.0%} of baseline")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"💾 Baseline saved to {args.baseline}")
+
+    return exit_code
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    counter = configure_environment(args)
+    return asyncio.run(main_async(args, counter))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
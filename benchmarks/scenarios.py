@@ -0,0 +1,133 @@
+"""
+Scripted traffic mixes replayed by the benchmark runner.
+
+Each scenario is a cycle of request builders; a virtual user walks the
+cycle repeatedly, picking random ids from the seeded data set.
+
+A scenario's steps never change once it has a baseline: a new endpoint
+mix goes in a new scenario (name_v2, ...) so results stay comparable.
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from .datasets import PROMO_CODE, REGIONS
+
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]]]  # method, path, JSON body
+
+
+@dataclass
+class BenchContext:
+    product_docs: List[Dict[str, Any]]
+    category_slugs: List[str]
+    admin_token: str
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    steps: List[Callable[[BenchContext, random.Random], RequestSpec]]
+    admin: bool = False
+    tags: List[str] = field(default_factory=list)
+
+
+def _random_product(ctx: BenchContext, rng: random.Random) -> Dict[str, Any]:
+    return rng.choice(ctx.product_docs)
+
+
+def _order_payload(ctx: BenchContext, rng: random.Random) -> Dict[str, Any]:
+    items = []
+    for product in rng.sample(ctx.product_docs, k=rng.randint(1, 3)):
+        items.append({
+            "product_id": product["id"],
+            "product_name": product["name"]["fr"],
+            "quantity": rng.randint(1, 2),
+            "price": product["price"],
+            "image_url": product["image_urls"][0],
+        })
+    return {
+        "customer_name": "Client Bench",
+        "customer_email": f"bench{rng.randint(0, 99999)}@example.com",
+        "customer_phone": "+33 6 12 34 56 78",
+        "shipping_address": "1 rue de la Soummam",
+        "shipping_city": "Paris",
+        "shipping_postal_code": "75001",
+        "items": items,
+        "promo_code": PROMO_CODE if rng.random() < 0.3 else None,
+        "payment_method": "cash",
+    }
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "browse": Scenario(
+        name="browse",
+        description="Homepage and shop navigation",
+        steps=[
+            lambda ctx, rng: ("GET", "/api/customization", None),
+            lambda ctx, rng: ("GET", "/api/navigation", None),
+            lambda ctx, rng: ("GET", "/api/banners", None),
+            lambda ctx, rng: ("GET", "/api/categories", None),
+            lambda ctx, rng: ("GET", "/api/testimonials?limit=6", None),
+            lambda ctx, rng: ("GET", "/api/products", None),
+            lambda ctx, rng: ("GET", f"/api/products/{_random_product(ctx, rng)['id']}", None),
+        ],
+    ),
+    "browse_v2": Scenario(
+        name="browse_v2",
+        description="Homepage and shop navigation with the category tree and product pages",
+        steps=[
+            lambda ctx, rng: ("GET", "/api/customization", None),
+            lambda ctx, rng: ("GET", "/api/navigation", None),
+            lambda ctx, rng: ("GET", "/api/banners", None),
+            lambda ctx, rng: ("GET", "/api/categories/tree", None),
+            lambda ctx, rng: ("GET", "/api/testimonials?limit=6", None),
+            lambda ctx, rng: ("GET", "/api/products", None),
+            lambda ctx, rng: ("GET", f"/api/products/{_random_product(ctx, rng)['id']}/detail", None),
+        ],
+    ),
+    "search": Scenario(
+        name="search",
+        description="Catalogue filtering by category and history by region",
+        steps=[
+            lambda ctx, rng: ("GET", f"/api/products?category={rng.choice(ctx.category_slugs)}", None),
+            lambda ctx, rng: ("GET", f"/api/historical-content?region={rng.choice(REGIONS)}", None),
+            lambda ctx, rng: ("GET", f"/api/products/{_random_product(ctx, rng)['id']}", None),
+        ],
+    ),
+    "checkout": Scenario(
+        name="checkout",
+        description="Promo validation followed by order placement",
+        steps=[
+            lambda ctx, rng: ("GET", "/api/promo-codes/active", None),
+            lambda ctx, rng: ("POST", "/api/promo-codes/validate", {"code": PROMO_CODE, "order_amount": round(rng.uniform(20, 300), 2)}),
+            lambda ctx, rng: ("POST", "/api/orders", _order_payload(ctx, rng)),
+        ],
+        tags=["writes"],
+    ),
+    "admin_dashboard": Scenario(
+        name="admin_dashboard",
+        description="Admin dashboard widgets and order list",
+        steps=[
+            lambda ctx, rng: ("GET", "/api/admin/stats", None),
+            lambda ctx, rng: ("GET", "/api/admin/orders", None),
+            lambda ctx, rng: ("GET", "/api/admin/inventory/low-stock", None),
+            lambda ctx, rng: ("GET", "/api/admin/testimonials", None),
+            lambda ctx, rng: ("GET", f"/api/admin/inventory/{_random_product(ctx, rng)['id']}/history", None),
+        ],
+        admin=True,
+    ),
+    "admin_dashboard_v2": Scenario(
+        name="admin_dashboard_v2",
+        description="Admin dashboard widgets with status counts and the paged order search",
+        steps=[
+            lambda ctx, rng: ("GET", "/api/admin/stats", None),
+            lambda ctx, rng: ("GET", "/api/admin/orders/status-counts", None),
+            lambda ctx, rng: ("GET", "/api/admin/orders/search?limit=50", None),
+            lambda ctx, rng: ("GET", "/api/admin/inventory/low-stock", None),
+            lambda ctx, rng: ("GET", "/api/admin/testimonials", None),
+            lambda ctx, rng: ("GET", f"/api/admin/inventory/{_random_product(ctx, rng)['id']}/history", None),
+        ],
+        admin=True,
+    ),
+}
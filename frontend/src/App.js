@@ -12,6 +12,8 @@ import HomePage from './components/HomePageNew';
 // RecipesPage removed - focusing on dates and olive oil
 import ShopPage from './components/ShopPage';
 import HistoryPage from './components/HistoryPage';
+import ProductPage from './components/ProductPage';
+import HistoryArticlePage from './components/HistoryArticlePage';
 import ContactPage from './components/ContactPage';
 import AuthPage from './components/AuthPage';
 import ProfilePage from './components/ProfilePage';
@@ -63,6 +65,49 @@ export const useLanguage = () => useContext(LanguageContext);
 const AuthContext = createContext();
 export const useAuth = () => useContext(AuthContext);
 
+export const storeTokens = ({ access_token, refresh_token }) => {
+  localStorage.setItem('token', access_token);
+  if (refresh_token) {
+    localStorage.setItem('refresh_token', refresh_token);
+  }
+  axios.defaults.headers.common['Authorization'] = `Bearer ${access_token}`;
+};
+
+const clearTokens = () => {
+  localStorage.removeItem('token');
+  localStorage.removeItem('refresh_token');
+  delete axios.defaults.headers.common['Authorization'];
+};
+
+// Access tokens are short-lived: on a 401, swap the refresh token for a new pair once and replay the request
+let refreshing = null;
+axios.interceptors.response.use(
+  response => response,
+  async (error) => {
+    const request = error.config;
+    const refreshToken = localStorage.getItem('refresh_token');
+    if (
+      error.response?.status !== 401 || !request || request._retried || !refreshToken ||
+      request.url?.includes('/auth/refresh') || request.url?.includes('/auth/login')
+    ) {
+      return Promise.reject(error);
+    }
+    request._retried = true;
+    try {
+      // Requests failing together share one refresh: a refresh token works only once
+      refreshing = refreshing || axios.post(`${API}/auth/refresh`, { refresh_token: refreshToken })
+        .finally(() => { refreshing = null; });
+      const { data } = await refreshing;
+      storeTokens(data);
+      request.headers['Authorization'] = `Bearer ${data.access_token}`;
+      return axios(request);
+    } catch (refreshError) {
+      clearTokens();
+      return Promise.reject(error);
+    }
+  }
+);
+
 // Translations
 const translations = {
   fr: {
@@ -110,7 +155,11 @@ const translations = {
 };
 
 function App() {
-  const [language, setLanguage] = useState('fr');
+  // ?lang= selects the language on arrival (sitemap and hreflang links use it)
+  const [language, setLanguage] = useState(() => {
+    const requested = new URLSearchParams(window.location.search).get('lang');
+    return ['fr', 'en', 'ar'].includes(requested) ? requested : 'fr';
+  });
   const [user, setUser] = useState(null);
   const [loading, setLoading] = useState(true);
 
@@ -132,8 +181,7 @@ function App() {
       setUser(response.data);
     } catch (error) {
       console.error('Failed to fetch user profile:', error);
-      localStorage.removeItem('token');
-      delete axios.defaults.headers.common['Authorization'];
+      clearTokens();
     } finally {
       setLoading(false);
     }
@@ -142,10 +190,7 @@ function App() {
   const login = async (email, password) => {
     try {
       const response = await axios.post(`${API}/auth/login`, { email, password });
-      const { access_token } = response.data;
-      
-      localStorage.setItem('token', access_token);
-      axios.defaults.headers.common['Authorization'] = `Bearer ${access_token}`;
+      storeTokens(response.data);
       
       await fetchUserProfile();
       return { success: true };
@@ -176,8 +221,14 @@ function App() {
   };
 
   const logout = () => {
-    localStorage.removeItem('token');
-    delete axios.defaults.headers.common['Authorization'];
+    const token = localStorage.getItem('token');
+    const refreshToken = localStorage.getItem('refresh_token');
+    axios.post(
+      `${API}/auth/logout`,
+      refreshToken ? { refresh_token: refreshToken } : undefined,
+      { headers: token ? { Authorization: `Bearer ${token}` } : {} }
+    ).catch(error => console.error('Logout failed:', error));
+    clearTokens();
     setUser(null);
   };
 
@@ -425,7 +476,9 @@ function App() {
                       <Route path="/" element={<HomePage />} />
                       {/* Recipes removed - Délices et Trésors d'Algérie focuses on dates and olive oil */}
                       <Route path="/shop" element={<ShopPage />} />
+                      <Route path="/shop/:id" element={<ProductPage />} />
                       <Route path="/history" element={<HistoryPage />} />
+                      <Route path="/history/:id" element={<HistoryArticlePage />} />
                       <Route path="/contact" element={<ContactPage />} />
                       <Route path="/testimonials" element={<TestimonialsPage />} />
                       <Route path="/promotions" element={<PromotionsPage />} />
@@ -1,6 +1,6 @@
 import React, { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { useAuth, useLanguage } from '../App';
+import { useAuth, useLanguage, storeTokens } from '../App';
 import { 
   Save,
   ArrowLeft,
@@ -103,7 +103,7 @@ const AccountSettings = () => {
     try {
       const token = localStorage.getItem('token');
       
-      await axios.put(
+      const response = await axios.put(
         `${API}/users/me/password`,
         {
           current_password: formData.current_password,
@@ -111,6 +111,8 @@ const AccountSettings = () => {
         },
         { headers: { Authorization: `Bearer ${token}` } }
       );
+      // Other sessions were signed out; this one continues with the new tokens
+      storeTokens(response.data);
 
       // Clear password fields
       setFormData(prev => ({
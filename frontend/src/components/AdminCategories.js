@@ -19,7 +19,8 @@ export default function AdminCategories() {
     description: { fr: '', en: '', ar: '' },
     icon: '🛍️',
     order: 0,
-    is_active: true
+    is_active: true,
+    parent_id: ''
   });
 
   useEffect(() => {
@@ -48,7 +49,7 @@ export default function AdminCategories() {
   const handleOpenModal = (category = null) => {
     if (category) {
       setEditingCategory(category);
-      setFormData(category);
+      setFormData({ ...category, parent_id: category.parent_id || '' });
     } else {
       setEditingCategory(null);
       setFormData({
@@ -57,7 +58,8 @@ export default function AdminCategories() {
         description: { fr: '', en: '', ar: '' },
         icon: '🛍️',
         order: categories.length,
-        is_active: true
+        is_active: true,
+        parent_id: ''
       });
     }
     setIsModalOpen(true);
@@ -212,6 +214,11 @@ export default function AdminCategories() {
                     <h3 className="text-lg font-bold text-gray-900">{category.name.fr}</h3>
                   </div>
                   <p className="text-sm text-gray-500">/{category.slug}</p>
+                  {category.parent_id && (
+                    <p className="text-xs text-gray-500">
+                      Sous-catégorie de {categories.find(c => c.id === category.parent_id)?.name.fr || '?'}
+                    </p>
+                  )}
                 </div>
                 <div className="flex space-x-2">
                   <button
@@ -237,6 +244,7 @@ export default function AdminCategories() {
                 <span className={`px-2 py-1 rounded ${category.is_active ? 'bg-green-100 text-green-800' : 'bg-gray-100 text-gray-800'}`}>
                   {category.is_active ? 'Active' : 'Inactive'}
                 </span>
+                <span className="text-gray-500">{category.product_count || 0} produit(s)</span>
                 <span className="text-gray-500">Ordre: {category.order}</span>
               </div>
             </div>
@@ -323,6 +331,25 @@ export default function AdminCategories() {
                 <p className="text-xs text-gray-500 mt-1">Utilisé dans l'URL (ex: /shop/dattes)</p>
               </div>
 
+              {/* Parent */}
+              <div>
+                <label className="block text-sm font-medium text-gray-700 mb-2">
+                  Catégorie parente
+                </label>
+                <select
+                  value={formData.parent_id}
+                  onChange={(e) => setFormData(prev => ({ ...prev, parent_id: e.target.value }))}
+                  className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-[#6B8E23] focus:border-transparent"
+                >
+                  <option value="">Aucune (catégorie principale)</option>
+                  {categories
+                    .filter(c => c.id !== editingCategory?.id)
+                    .map(c => (
+                      <option key={c.id} value={c.id}>{c.icon} {c.name.fr}</option>
+                    ))}
+                </select>
+              </div>
+
               {/* Icon & Order */}
               <div className="grid grid-cols-2 gap-4">
                 <div>
@@ -1,11 +1,42 @@
-import React, { useState, useEffect } from 'react';
-import { Package, Eye, Trash2, Filter, Search, CheckCircle, Clock, Truck, XCircle } from 'lucide-react';
+import React, { useState, useEffect, useCallback } from 'react';
+import { Package, Eye, Trash2, Filter, Search, CheckCircle, Clock, Truck, XCircle, RotateCcw } from 'lucide-react';
 import { useLanguage } from '../App';
 import axios from 'axios';
 import { useToast } from '../hooks/use-toast';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const PAGE_SIZE = 50;
+
+// Same transitions as backend/order_lifecycle.py
+const ORDER_TRANSITIONS = {
+  pending: ['confirmed', 'cancelled'],
+  confirmed: ['processing', 'cancelled'],
+  processing: ['shipped', 'cancelled'],
+  shipped: ['delivered'],
+  delivered: ['refunded'],
+  cancelled: [],
+  refunded: []
+};
+
+// Map the search box to the matching server-side filter
+const searchParams = (term) => {
+  const value = term.trim();
+  if (!value) return {};
+  if (value.includes('@')) return { customer_email: value };
+  if (/^(ord-|\d)/i.test(value)) return { order_number: /^ord-/i.test(value) ? value : `ORD-${value}` };
+  return { q: value };
+};
+
+const STATUS_LABELS = {
+  pending: 'En attente',
+  confirmed: 'Confirmée',
+  processing: 'En traitement',
+  shipped: 'Expédiée',
+  delivered: 'Livrée',
+  cancelled: 'Annulée',
+  refunded: 'Remboursée'
+};
 
 export default function AdminOrders() {
   const { language } = useLanguage();
@@ -16,18 +47,35 @@ export default function AdminOrders() {
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedOrder, setSelectedOrder] = useState(null);
   const [showDetails, setShowDetails] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [matchCount, setMatchCount] = useState({ total: 0, exact: true });
+  const [stats, setStats] = useState({ total: 0, pending: 0, confirmed: 0, processing: 0, delivered: 0 });
 
-  useEffect(() => {
-    fetchOrders();
+  const fetchStats = useCallback(async () => {
+    try {
+      const token = localStorage.getItem('token');
+      const response = await axios.get(`${API}/admin/orders/status-counts`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      setStats({ total: response.data.total, ...response.data.by_status });
+    } catch (error) {
+      console.error('Error fetching order counts:', error);
+    }
   }, []);
 
-  const fetchOrders = async () => {
+  const fetchOrders = useCallback(async (cursor = null) => {
     try {
       const token = localStorage.getItem('token');
-      const response = await axios.get(`${API}/admin/orders`, {
+      const params = { limit: PAGE_SIZE, ...searchParams(searchTerm) };
+      if (filterStatus !== 'all') params.status = filterStatus;
+      if (cursor) params.cursor = cursor;
+      const response = await axios.get(`${API}/admin/orders/search`, {
+        params,
         headers: { Authorization: `Bearer ${token}` }
       });
-      setOrders(response.data);
+      setOrders(previous => cursor ? [...previous, ...response.data.items] : response.data.items);
+      setNextCursor(response.data.next_cursor);
+      setMatchCount({ total: response.data.total, exact: response.data.total_exact });
     } catch (error) {
       console.error('Error fetching orders:', error);
       toast({
@@ -38,6 +86,21 @@ export default function AdminOrders() {
     } finally {
       setLoading(false);
     }
+  }, [filterStatus, searchTerm, toast]);
+
+  useEffect(() => {
+    fetchStats();
+  }, [fetchStats]);
+
+  useEffect(() => {
+    // Debounced so typing does not fire one search per keystroke
+    const timer = setTimeout(() => fetchOrders(), 300);
+    return () => clearTimeout(timer);
+  }, [fetchOrders]);
+
+  const refresh = () => {
+    fetchOrders();
+    fetchStats();
   };
 
   const handleStatusChange = async (orderId, newStatus) => {
@@ -52,11 +115,11 @@ export default function AdminOrders() {
         title: 'Succès',
         description: 'Statut de la commande mis à jour',
       });
-      fetchOrders();
+      refresh();
     } catch (error) {
       toast({
         title: 'Erreur',
-        description: 'Impossible de mettre à jour le statut',
+        description: error.response?.data?.detail || 'Impossible de mettre à jour le statut',
         variant: 'destructive'
       });
     }
@@ -76,7 +139,7 @@ export default function AdminOrders() {
         title: 'Succès',
         description: 'Commande supprimée',
       });
-      fetchOrders();
+      refresh();
     } catch (error) {
       toast({
         title: 'Erreur',
@@ -93,7 +156,8 @@ export default function AdminOrders() {
       processing: { label: 'En traitement', color: 'bg-purple-100 text-purple-700', icon: Package },
       shipped: { label: 'Expédiée', color: 'bg-indigo-100 text-indigo-700', icon: Truck },
       delivered: { label: 'Livrée', color: 'bg-green-100 text-green-700', icon: CheckCircle },
-      cancelled: { label: 'Annulée', color: 'bg-red-100 text-red-700', icon: XCircle }
+      cancelled: { label: 'Annulée', color: 'bg-red-100 text-red-700', icon: XCircle },
+      refunded: { label: 'Remboursée', color: 'bg-gray-100 text-gray-700', icon: RotateCcw }
     };
 
     const config = statusConfig[status] || statusConfig.pending;
@@ -118,22 +182,6 @@ export default function AdminOrders() {
     });
   };
 
-  const filteredOrders = orders.filter(order => {
-    const matchesStatus = filterStatus === 'all' || order.status === filterStatus;
-    const matchesSearch = order.order_number.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         order.customer_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         order.customer_email.toLowerCase().includes(searchTerm.toLowerCase());
-    return matchesStatus && matchesSearch;
-  });
-
-  const stats = {
-    total: orders.length,
-    pending: orders.filter(o => o.status === 'pending').length,
-    confirmed: orders.filter(o => o.status === 'confirmed').length,
-    processing: orders.filter(o => o.status === 'processing').length,
-    delivered: orders.filter(o => o.status === 'delivered').length
-  };
-
   if (loading) {
     return (
       <div className="flex items-center justify-center min-h-screen">
@@ -207,7 +255,7 @@ export default function AdminOrders() {
               type="text"
               value={searchTerm}
               onChange={(e) => setSearchTerm(e.target.value)}
-              placeholder="Rechercher par numéro, nom ou email..."
+              placeholder="Rechercher par numéro, email, nom ou ville..."
               className="w-full pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-[#6B8E23]"
             />
           </div>
@@ -225,6 +273,7 @@ export default function AdminOrders() {
               <option value="shipped">Expédiées</option>
               <option value="delivered">Livrées</option>
               <option value="cancelled">Annulées</option>
+              <option value="refunded">Remboursées</option>
             </select>
           </div>
         </div>
@@ -232,7 +281,7 @@ export default function AdminOrders() {
 
       {/* Orders Table */}
       <div className="bg-white rounded-lg shadow overflow-hidden">
-        {filteredOrders.length === 0 ? (
+        {orders.length === 0 ? (
           <div className="p-12 text-center">
             <Package className="mx-auto text-gray-400 mb-4" size={64} />
             <p className="text-gray-600">Aucune commande trouvée</p>
@@ -251,7 +300,7 @@ export default function AdminOrders() {
                 </tr>
               </thead>
               <tbody className="divide-y">
-                {filteredOrders.map((order) => (
+                {orders.map((order) => (
                   <tr key={order.id} className="hover:bg-gray-50">
                     <td className="px-6 py-4">
                       <span className="font-mono text-sm font-semibold text-gray-900">
@@ -290,12 +339,9 @@ export default function AdminOrders() {
                           onChange={(e) => handleStatusChange(order.id, e.target.value)}
                           className="px-3 py-1 text-sm border border-gray-300 rounded-lg focus:ring-2 focus:ring-[#6B8E23]"
                         >
-                          <option value="pending">En attente</option>
-                          <option value="confirmed">Confirmée</option>
-                          <option value="processing">En traitement</option>
-                          <option value="shipped">Expédiée</option>
-                          <option value="delivered">Livrée</option>
-                          <option value="cancelled">Annulée</option>
+                          {[order.status, ...(ORDER_TRANSITIONS[order.status] || [])].map(status => (
+                            <option key={status} value={status}>{STATUS_LABELS[status] || status}</option>
+                          ))}
                         </select>
                         <button
                           onClick={() => handleDelete(order.id)}
@@ -312,6 +358,19 @@ export default function AdminOrders() {
             </table>
           </div>
         )}
+        <div className="px-6 py-4 border-t flex items-center justify-between text-sm text-gray-600">
+          <span>
+            {orders.length} / {matchCount.exact ? matchCount.total : `≈ ${matchCount.total}`} commande(s)
+          </span>
+          {nextCursor && (
+            <button
+              onClick={() => fetchOrders(nextCursor)}
+              className="px-4 py-2 bg-[#6B8E23] text-white rounded-lg hover:bg-[#5a7a1d] transition"
+            >
+              Charger plus
+            </button>
+          )}
+        </div>
       </div>
 
       {/* Order Details Modal */}
@@ -41,12 +41,14 @@ const AdminProductForm = () => {
     allow_backorder: false
   });
 
-  const categories = [
-    { value: 'epices', labelFr: 'Épices', labelAr: 'بهارات', labelEn: 'Spices', icon: '🌶️' },
-    { value: 'thes', labelFr: 'Thés', labelAr: 'شاي', labelEn: 'Teas', icon: '🍃' },
-    { value: 'robes-kabyles', labelFr: 'Robes Kabyles', labelAr: 'فساتين قبائلية', labelEn: 'Kabyle Dresses', icon: '👗' },
-    { value: 'bijoux-kabyles', labelFr: 'Bijoux Kabyles', labelAr: 'مجوهرات قبائلية', labelEn: 'Kabyle Jewelry', icon: '💎' }
-  ];
+  // Products must be filed under an existing category
+  const [categories, setCategories] = useState([]);
+
+  useEffect(() => {
+    axios.get(`${API}/categories`)
+      .then(response => setCategories(response.data))
+      .catch(error => console.error('Error fetching categories:', error));
+  }, []);
 
   useEffect(() => {
     if (isEdit) {
@@ -138,10 +140,6 @@ const AdminProductForm = () => {
     }
   };
 
-  const getLocalizedLabel = (item) => {
-    return item[`label${language.charAt(0).toUpperCase() + language.slice(1)}`] || item.labelFr;
-  };
-
   if (loading) {
     return (
       <div className="flex items-center justify-center min-h-64">
@@ -264,8 +262,8 @@ const AdminProductForm = () => {
                 required
               >
                 {categories.map(cat => (
-                  <option key={cat.value} value={cat.value}>
-                    {cat.icon} {getLocalizedLabel(cat)}
+                  <option key={cat.id} value={cat.slug}>
+                    {cat.icon} {cat.name[language] || cat.name.fr}
                   </option>
                 ))}
               </select>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useCart } from '../contexts/CartContext';
 import { useNavigate } from 'react-router-dom';
 import { useLanguage } from '../App';
@@ -22,6 +22,8 @@ export default function CheckoutPage() {
   const [activePromoCodes, setActivePromoCodes] = useState([]);
   const [paymentMethod, setPaymentMethod] = useState('cash'); // 'cash', 'bank_transfer', 'paypal'
   const [cartLoaded, setCartLoaded] = useState(false);
+  // Kept across retries of the same checkout so a repeated submit cannot create a second order
+  const idempotencyKey = useRef(null);
   const [formData, setFormData] = useState({
     customer_name: '',
     customer_email: '',
@@ -104,16 +106,35 @@ export default function CheckoutPage() {
           image_url: item.image_urls?.[0]
         })),
         promo_code: promoApplied?.promo_code || null,
-        payment_method: paymentMethod
+        payment_method: paymentMethod,
+        language
       };
 
-      const response = await axios.post(`${API}/orders`, orderData);
+      if (!idempotencyKey.current) {
+        idempotencyKey.current = window.crypto?.randomUUID
+          ? window.crypto.randomUUID()
+          : `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+      }
+      // Signed-in customers get the order linked to their account
+      const token = localStorage.getItem('token');
+      const response = await axios.post(`${API}/orders`, orderData, {
+        headers: {
+          'Idempotency-Key': idempotencyKey.current,
+          ...(token ? { Authorization: `Bearer ${token}` } : {})
+        }
+      });
+      idempotencyKey.current = null;
       setOrderId(response.data.order_number);
       setOrderComplete(true);
       clearCart();
       setPromoApplied(null);
     } catch (error) {
       console.error('Error creating order:', error);
+      const status = error.response?.status;
+      if (status && status < 500 && status !== 409 && status !== 429) {
+        // Rejected for good: the corrected order is a new request
+        idempotencyKey.current = null;
+      }
       alert(error.response?.data?.detail || 'Erreur lors de la commande. Veuillez réessayer.');
     } finally {
       setLoading(false);
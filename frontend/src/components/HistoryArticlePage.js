@@ -0,0 +1,93 @@
+import React, { useState, useEffect } from 'react';
+import { useParams, Link } from 'react-router-dom';
+import { useLanguage } from '../App';
+import { ArrowLeft, Calendar } from 'lucide-react';
+import axios from 'axios';
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+const HistoryArticlePage = () => {
+  const { id } = useParams();
+  const { language } = useLanguage();
+  const [article, setArticle] = useState(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    fetchArticle();
+  }, [id]);
+
+  const fetchArticle = async () => {
+    setLoading(true);
+    try {
+      const response = await axios.get(`${API}/historical-content/${id}`);
+      setArticle(response.data);
+    } catch (error) {
+      console.error('Error fetching historical content:', error);
+      setArticle(null);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const getLocalizedText = (textObj) => {
+    if (!textObj) return '';
+    return textObj[language] || textObj.fr || '';
+  };
+
+  if (loading) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-amber-50 to-orange-100 flex items-center justify-center">
+        <div className="animate-spin rounded-full h-32 w-32 border-b-2 border-amber-600"></div>
+      </div>
+    );
+  }
+
+  if (!article) {
+    return (
+      <div className="min-h-screen flex items-center justify-center">
+        <div className="text-center">
+          <h1 className="text-4xl font-bold text-gray-900 mb-4">404</h1>
+          <p className="text-xl text-gray-600">Page non trouvée</p>
+        </div>
+      </div>
+    );
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-amber-50 to-orange-100">
+      <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
+        <Link to="/history" className="inline-flex items-center text-amber-700 hover:underline mb-6">
+          <ArrowLeft size={18} className="mr-1" />
+          {language === 'ar' ? 'التاريخ' : language === 'en' ? 'History' : 'Histoire'}
+        </Link>
+
+        <article className="bg-white rounded-2xl shadow-xl overflow-hidden">
+          {article.image_urls && article.image_urls[0] && (
+            <img
+              src={article.image_urls[0]}
+              alt={getLocalizedText(article.title)}
+              className="w-full h-72 object-cover"
+            />
+          )}
+          <div className="p-8 lg:p-12">
+            <h1 className="text-3xl font-bold text-gray-900 mb-6">{getLocalizedText(article.title)}</h1>
+            <div className="prose prose-lg text-gray-600 leading-relaxed whitespace-pre-line">
+              {getLocalizedText(article.content)}
+            </div>
+            <div className="flex items-center mt-8 pt-6 border-t border-gray-200">
+              <Calendar size={20} className="text-gray-400 mr-2" />
+              <span className="text-gray-500 text-sm">
+                {language === 'ar' ? 'تاريخ عريق' :
+                 language === 'en' ? 'Ancient history' :
+                 'Histoire millénaire'}
+              </span>
+            </div>
+          </div>
+        </article>
+      </div>
+    </div>
+  );
+};
+
+export default HistoryArticlePage;
@@ -1,4 +1,5 @@
 import React, { useState, useEffect } from 'react';
+import { Link } from 'react-router-dom';
 import { useLanguage } from '../App';
 import { BookOpen, MapPin, Calendar, Users, Mountain } from 'lucide-react';
 import axios from 'axios';
@@ -215,7 +216,12 @@ const HistoryPage = () => {
                   </div>
                   
                   <h2 className="text-3xl font-bold text-gray-900 mb-6">
-                    {getLocalizedText(content.title)}
+                    {/* The built-in sample content has no page of its own */}
+                    {content.created_at ? (
+                      <Link to={`/history/${content.id}`} className="hover:text-amber-700">
+                        {getLocalizedText(content.title)}
+                      </Link>
+                    ) : getLocalizedText(content.title)}
                   </h2>
                   
                   <div className="prose prose-lg text-gray-600 leading-relaxed">
@@ -32,7 +32,9 @@ const ImageUpload = ({
         },
       });
 
-      return `${BACKEND_URL}${response.data.url}`;
+      // Absolute when uploads are served from a CDN / public bucket
+      const { url } = response.data;
+      return url.startsWith('http') ? url : `${BACKEND_URL}${url}`;
     } catch (error) {
       console.error('Error uploading image:', error);
       throw error;
@@ -14,6 +14,7 @@ export default function MyOrders() {
   const [orders, setOrders] = useState([]);
   const [loading, setLoading] = useState(true);
   const [selectedOrder, setSelectedOrder] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
 
   useEffect(() => {
     if (!user) {
@@ -23,13 +24,15 @@ export default function MyOrders() {
     fetchOrders();
   }, [user]);
 
-  const fetchOrders = async () => {
+  const fetchOrders = async (cursor = null) => {
     try {
       const token = localStorage.getItem('token');
       const response = await axios.get(`${API}/my-orders`, {
-        headers: { Authorization: `Bearer ${token}` }
+        headers: { Authorization: `Bearer ${token}` },
+        params: cursor ? { cursor } : {}
       });
-      setOrders(response.data);
+      setOrders(previous => cursor ? [...previous, ...response.data.items] : response.data.items);
+      setNextCursor(response.data.next_cursor);
       setLoading(false);
     } catch (error) {
       console.error('Error fetching orders:', error);
@@ -157,6 +160,14 @@ export default function MyOrders() {
                   </button>
                 </div>
               ))}
+              {nextCursor && (
+                <button
+                  onClick={() => fetchOrders(nextCursor)}
+                  className="w-full py-2 text-[#6B8E23] border border-[#6B8E23] rounded-lg hover:bg-[#6B8E23] hover:text-white transition"
+                >
+                  {language === 'ar' ? 'عرض المزيد' : language === 'en' ? 'Load more' : 'Charger plus'}
+                </button>
+              )}
             </div>
 
             {/* Order Details */}
@@ -0,0 +1,192 @@
+import React, { useState, useEffect } from 'react';
+import { useParams, Link } from 'react-router-dom';
+import { useLanguage } from '../App';
+import { Star, ShoppingCart, Truck, ArrowLeft } from 'lucide-react';
+import axios from 'axios';
+import { useCart } from '../contexts/CartContext';
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+const ProductPage = () => {
+  const { id } = useParams();
+  const { language } = useLanguage();
+  const { addToCart } = useCart();
+  const [detail, setDetail] = useState(null);
+  const [loading, setLoading] = useState(true);
+  const [notFound, setNotFound] = useState(false);
+
+  useEffect(() => {
+    fetchDetail();
+  }, [id]);
+
+  const fetchDetail = async () => {
+    setLoading(true);
+    try {
+      // Product, category, reviews and related products in one request
+      const response = await axios.get(`${API}/products/${id}/detail`, { params: { related: 4 } });
+      setDetail(response.data);
+      setNotFound(false);
+    } catch (error) {
+      console.error('Error fetching product:', error);
+      setNotFound(true);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const getLocalizedText = (textObj) => {
+    if (!textObj) return '';
+    return textObj[language] || textObj.fr || textObj.en || '';
+  };
+
+  const isUnavailable = (product) =>
+    product.track_inventory && product.stock_quantity === 0 && !product.allow_backorder;
+
+  if (loading) {
+    return (
+      <div className="min-h-screen flex items-center justify-center">
+        <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-[#6B8E23]"></div>
+      </div>
+    );
+  }
+
+  if (notFound || !detail) {
+    return (
+      <div className="min-h-screen flex items-center justify-center">
+        <div className="text-center">
+          <h1 className="text-4xl font-bold text-gray-900 mb-4">404</h1>
+          <p className="text-xl text-gray-600 mb-6">
+            {language === 'ar' ? 'المنتج غير موجود' : language === 'en' ? 'Product not found' : 'Produit introuvable'}
+          </p>
+          <Link to="/shop" className="text-[#6B8E23] font-semibold hover:underline">
+            {language === 'ar' ? 'العودة إلى المتجر' : language === 'en' ? 'Back to the shop' : 'Retour à la boutique'}
+          </Link>
+        </div>
+      </div>
+    );
+  }
+
+  const { product, category, reviews, related } = detail;
+
+  return (
+    <div className="min-h-screen bg-gray-50">
+      <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
+        <Link to="/shop" className="inline-flex items-center text-[#6B8E23] hover:underline mb-6">
+          <ArrowLeft size={18} className="mr-1" />
+          {language === 'ar' ? 'المتجر' : language === 'en' ? 'Shop' : 'Boutique'}
+          {category && <span className="text-gray-500 ml-2">/ {getLocalizedText(category.name)}</span>}
+        </Link>
+
+        <div className="grid lg:grid-cols-2 gap-8 bg-white rounded-2xl shadow-lg overflow-hidden">
+          <div className="h-96 lg:h-full">
+            <img
+              src={product.image_urls?.[0] || 'https://via.placeholder.com/600'}
+              alt={getLocalizedText(product.name)}
+              className="w-full h-full object-cover"
+            />
+          </div>
+
+          <div className="p-8">
+            <h1 className="text-3xl font-bold text-gray-900 mb-3">{getLocalizedText(product.name)}</h1>
+            {reviews.rating_count > 0 && (
+              <div className="flex items-center mb-4 text-amber-500">
+                <Star size={18} className="fill-current mr-1" />
+                <span className="font-semibold">{reviews.rating_avg.toFixed(1)}</span>
+                <span className="text-gray-500 ml-2">({reviews.rating_count})</span>
+              </div>
+            )}
+            <p className="text-sm text-gray-500 mb-4">📍 {getLocalizedText(product.origin)}</p>
+            <p className="text-gray-700 leading-relaxed mb-6 whitespace-pre-line">{getLocalizedText(product.description)}</p>
+
+            <div className="mb-4">
+              <span className="text-3xl font-bold text-[#6B8E23]">{product.price.toFixed(2)}</span>
+              <span className="text-lg text-gray-600 ml-1">{product.currency}</span>
+            </div>
+
+            <div className="flex items-center text-green-600 text-sm mb-6">
+              <Truck size={16} className="mr-1" />
+              <span className="font-medium">
+                {language === 'ar' ? 'شحن مجاني' : language === 'en' ? 'Free shipping' : 'Livraison gratuite'}
+              </span>
+            </div>
+
+            <button
+              onClick={() => addToCart(product)}
+              disabled={isUnavailable(product)}
+              className={`w-full py-3 rounded-lg transition flex items-center justify-center font-semibold ${
+                isUnavailable(product)
+                  ? 'bg-gray-300 text-gray-500 cursor-not-allowed'
+                  : 'bg-[#6B8E23] text-white hover:bg-[#5a7a1d]'
+              }`}
+            >
+              <ShoppingCart size={18} className="mr-2" />
+              {isUnavailable(product)
+                ? (language === 'ar' ? 'غير متوفر' : language === 'en' ? 'Unavailable' : 'Indisponible')
+                : (language === 'ar' ? 'أضف للسلة' : language === 'en' ? 'Add to cart' : 'Ajouter au panier')
+              }
+            </button>
+          </div>
+        </div>
+
+        {/* Reviews */}
+        {reviews.recent.length > 0 && (
+          <div className="mt-10">
+            <h2 className="text-2xl font-bold text-gray-900 mb-4">
+              {language === 'ar' ? 'آراء العملاء' : language === 'en' ? 'Customer reviews' : 'Avis clients'}
+            </h2>
+            <div className="grid md:grid-cols-2 gap-4">
+              {reviews.recent.map((review) => (
+                <div key={review.id} className="bg-white rounded-xl shadow p-5">
+                  <div className="flex items-center mb-2">
+                    {[...Array(5)].map((_, i) => (
+                      <Star
+                        key={i}
+                        size={16}
+                        className={i < review.rating ? 'text-amber-500 fill-current' : 'text-gray-300'}
+                      />
+                    ))}
+                    <span className="ml-3 font-semibold text-gray-800">{review.customer_name}</span>
+                  </div>
+                  <p className="text-gray-600">{review.comment}</p>
+                </div>
+              ))}
+            </div>
+          </div>
+        )}
+
+        {/* Related products */}
+        {related.length > 0 && (
+          <div className="mt-10">
+            <h2 className="text-2xl font-bold text-gray-900 mb-4">
+              {language === 'ar' ? 'قد يعجبك أيضاً' : language === 'en' ? 'You may also like' : 'Vous aimerez aussi'}
+            </h2>
+            <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4">
+              {related.map((item) => (
+                <Link
+                  key={item.id}
+                  to={`/shop/${item.id}`}
+                  className="bg-white rounded-xl shadow hover:shadow-lg transition overflow-hidden"
+                >
+                  <img
+                    src={item.image_urls?.[0] || 'https://via.placeholder.com/300'}
+                    alt={getLocalizedText(item.name)}
+                    className="w-full h-40 object-cover"
+                  />
+                  <div className="p-4">
+                    <h3 className="font-semibold text-gray-900 line-clamp-2">{getLocalizedText(item.name)}</h3>
+                    <p className="text-[#6B8E23] font-bold mt-1">
+                      {item.price.toFixed(2)} {item.currency}
+                    </p>
+                  </div>
+                </Link>
+              ))}
+            </div>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+};
+
+export default ProductPage;
@@ -1,4 +1,5 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
+import { Link } from 'react-router-dom';
 import { useLanguage } from '../App';
 import { ShoppingBag, Star, Search, Filter, Heart, Eye, ShoppingCart, Truck } from 'lucide-react';
 import axios from 'axios';
@@ -34,7 +35,8 @@ const ShopPage = () => {
 
   const fetchCategories = async () => {
     try {
-      const response = await axios.get(`${API}/categories`);
+      // Top-level categories with their subcategories and product counts
+      const response = await axios.get(`${API}/categories/tree`);
       setCategories(response.data);
     } catch (error) {
       console.error('Error fetching categories:', error);
@@ -46,11 +48,25 @@ const ShopPage = () => {
     return textObj[language] || textObj.fr || textObj.en || '';
   };
 
+  // slug -> the category and its subcategories, so a parent shows its children's products
+  const subtrees = useMemo(() => {
+    const result = {};
+    const collect = (node) => {
+      const slugs = [node.slug, ...node.children.flatMap(collect)];
+      result[node.slug] = new Set(slugs);
+      return slugs;
+    };
+    categories.forEach(collect);
+    return result;
+  }, [categories]);
+
+  const selectedRoot = categories.find(category => subtrees[category.slug]?.has(selectedCategory));
+
   const filteredProducts = products.filter(product => {
     const matchesSearch = getLocalizedText(product.name)
       .toLowerCase()
       .includes(searchTerm.toLowerCase());
-    const matchesCategory = selectedCategory === 'all' || product.category === selectedCategory;
+    const matchesCategory = selectedCategory === 'all' || subtrees[selectedCategory]?.has(product.category);
     return matchesSearch && matchesCategory;
   });
 
@@ -135,7 +151,7 @@ const ShopPage = () => {
                   key={category.id}
                   onClick={() => setSelectedCategory(category.slug)}
                   className={`flex flex-col items-center p-6 rounded-2xl border-2 transition-all ${
-                    selectedCategory === category.slug
+                    selectedRoot?.id === category.id
                       ? 'border-[#6B8E23] bg-[#6B8E23] bg-opacity-10 shadow-lg'
                       : 'border-gray-200 hover:border-[#6B8E23] hover:shadow-md'
                   }`}
@@ -152,9 +168,27 @@ const ShopPage = () => {
                   <span className="text-sm font-medium text-gray-700">
                     {getLocalizedText(category.name)}
                   </span>
+                  <span className="text-xs text-gray-500">{category.total_product_count}</span>
                 </button>
               ))}
             </div>
+            {selectedRoot?.children.length > 0 && (
+              <div className="flex flex-wrap justify-center gap-2 mt-4">
+                {selectedRoot.children.map((child) => (
+                  <button
+                    key={child.id}
+                    onClick={() => setSelectedCategory(child.slug)}
+                    className={`px-4 py-2 rounded-full border text-sm transition ${
+                      selectedCategory === child.slug
+                        ? 'border-[#6B8E23] bg-[#6B8E23] text-white'
+                        : 'border-gray-200 text-gray-700 hover:border-[#6B8E23]'
+                    }`}
+                  >
+                    {child.icon} {getLocalizedText(child.name)} ({child.total_product_count})
+                  </button>
+                ))}
+              </div>
+            )}
           </div>
         )}
 
@@ -220,7 +254,9 @@ const ShopPage = () => {
               {/* Product Info */}
               <div className="p-5">
                 <h3 className="text-lg font-bold text-gray-900 mb-2 line-clamp-2">
-                  {getLocalizedText(product.name)}
+                  <Link to={`/shop/${product.id}`} className="hover:text-[#6B8E23]">
+                    {getLocalizedText(product.name)}
+                  </Link>
                 </h3>
                 <p className="text-sm text-gray-600 mb-3 line-clamp-2">
                   {getLocalizedText(product.description)}
@@ -282,9 +318,9 @@ const ShopPage = () => {
                       : (language === 'ar' ? 'أضف للسلة' : language === 'en' ? 'Add to cart' : 'Ajouter au panier')
                     }
                   </button>
-                  <button className="p-3 border border-gray-300 rounded-lg hover:bg-gray-50 transition">
+                  <Link to={`/shop/${product.id}`} className="p-3 border border-gray-300 rounded-lg hover:bg-gray-50 transition">
                     <Eye size={18} className="text-gray-600" />
-                  </button>
+                  </Link>
                 </div>
 
                 {/* Payment Info */}
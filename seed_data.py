@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+🌱 SEEDING - Délices et Trésors d'Algérie
+=========================================
+
+Charge les fixtures (JSON ou YAML) du dossier fixtures/ et les insère de
+façon idempotente : chaque document est identifié par son "slug", relancer
+le script met à jour les documents existants au lieu de les dupliquer.
+
+Deux modes :
+    db   - écrit directement dans MongoDB par bulk_write (upserts par lots) ;
+           pour les produits, tient à jour is_low_stock, le nombre de
+           produits des catégories et l'entrée d'ouverture du journal de
+           stock comme le font les routes de l'API
+    api  - passe par l'API (client HTTP asynchrone, connexions réutilisées,
+           concurrence bornée) ; nécessite un compte administrateur
+
+Usage:
+    python seed_data.py                                  # toutes les fixtures, mode db
+    python seed_data.py products historical_content
+    python seed_data.py --mode api --api-base http://localhost:8001/api
+    python seed_data.py --dry-run
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import unicodedata
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).parent / 'backend'
+load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+BATCH_SIZE = 500
+
+# Collection -> API endpoint, field used to derive a slug, defaults applied on insert
+# and fields only written on insert (re-seeding must not reset live stock levels)
+COLLECTIONS = {
+    "products": {
+        "endpoint": "/products",
+        "title_field": "name",
+        "insert_only": ["stock_quantity"],
+        "defaults": {
+            "currency": "EUR",
+            "in_stock": True,
+            "track_inventory": True,
+            "stock_quantity": 0,
+            "low_stock_threshold": 5,
+            "allow_backorder": False,
+        },
+    },
+    "historical_content": {
+        "endpoint": "/historical-content",
+        "title_field": "title",
+        "insert_only": [],
+        "defaults": {},
+    },
+    # No API route serves recipes any more: db mode only
+    "recipes": {
+        "endpoint": None,
+        "title_field": "title",
+        "insert_only": [],
+        "defaults": {},
+    },
+}
+
+
+def slugify(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def document_slug(collection: str, doc: Dict[str, Any]) -> str:
+    if doc.get("slug"):
+        return doc["slug"]
+    title = doc[COLLECTIONS[collection]["title_field"]]
+    return slugify(title.get("fr") or next(iter(title.values())))
+
+
+def load_fixtures(collection: str, fixtures_dir: Path = FIXTURES_DIR) -> List[Dict[str, Any]]:
+    """Lit fixtures/<collection>.json|.yaml|.yml"""
+    for suffix in (".json", ".yaml", ".yml"):
+        path = fixtures_dir / f"{collection}{suffix}"
+        if not path.exists():
+            continue
+        if suffix == ".json":
+            docs = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit(f"❌ PyYAML est requis pour lire {path} (pip install pyyaml)")
+            docs = yaml.safe_load(path.read_text(encoding="utf-8")) or []
+        for doc in docs:
+            doc["slug"] = document_slug(collection, doc)
+        return docs
+    return []
+
+
+# --- Mode db ---
+async def seed_collection_db(db, collection: str, docs: List[Dict[str, Any]]) -> Dict[str, int]:
+    from pymongo import UpdateOne
+    from ids import new_id
+
+    # Unique on slug so concurrent runs cannot create duplicates
+    await db[collection].create_index(
+        "slug", unique=True, partialFilterExpression={"slug": {"$type": "string"}}
+    )
+    now = datetime.now(timezone.utc)
+    defaults = COLLECTIONS[collection]["defaults"]
+    insert_only = COLLECTIONS[collection]["insert_only"]
+    stats = {"inserted": 0, "updated": 0}
+    for start in range(0, len(docs), BATCH_SIZE):
+        batch = docs[start:start + BATCH_SIZE]
+        existing = await _existing_products(db, batch) if collection == "products" else {}
+        operations = []
+        for doc in batch:
+            on_insert = {"id": new_id(), "created_at": now}
+            on_insert.update({k: v for k, v in defaults.items() if k not in doc})
+            on_insert.update({k: doc[k] for k in insert_only if k in doc})
+            fields = {k: v for k, v in doc.items() if k not in insert_only}
+            if collection == "products":
+                fields.update(_product_stock_fields(existing.get(doc["slug"]), {**on_insert, **doc}, fields))
+            operations.append(UpdateOne(
+                {"slug": doc["slug"]},
+                {"$set": {**fields, "updated_at": now}, "$setOnInsert": on_insert},
+                upsert=True
+            ))
+        result = await db[collection].bulk_write(operations, ordered=False)
+        stats["inserted"] += result.upserted_count
+        stats["updated"] += result.matched_count
+        if collection == "products":
+            inserted = [batch[index]["slug"] for index in result.upserted_ids]
+            await _after_products_seeded(db, batch, existing, inserted)
+    return stats
+
+
+async def _existing_products(db, batch: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {
+        product["slug"]: product
+        async for product in db.products.find(
+            {"slug": {"$in": [doc["slug"] for doc in batch]}},
+            {"_id": 0, "slug": 1, "category": 1, "stock_quantity": 1, "low_stock_threshold": 1, "track_inventory": 1}
+        )
+    }
+
+
+def _product_stock_fields(current: Optional[Dict[str, Any]], inserted: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """is_low_stock (and the alert re-arm) as the API's stock writes set them"""
+    from stock_flags import low_stock_fields
+
+    # A new product starts from the fixture; an existing one keeps its live stock level
+    return low_stock_fields({**current, **fields} if current is not None else inserted)
+
+
+async def _after_products_seeded(db, batch: List[Dict[str, Any]], existing: Dict[str, Dict[str, Any]], inserted: List[str]):
+    """Category product counts and opening stock-ledger entries, as the product routes write them"""
+    from collections import Counter
+    from models import StockAdjustment
+
+    counts = Counter()
+    for doc in batch:
+        current = existing.get(doc["slug"])
+        if current is not None and "category" in doc and doc["category"] != current.get("category"):
+            counts[current.get("category")] -= 1
+            counts[doc["category"]] += 1
+    products = await db.products.find(
+        {"slug": {"$in": inserted}},
+        {"_id": 0, "id": 1, "category": 1, "stock_quantity": 1, "track_inventory": 1}
+    ).to_list(None) if inserted else []
+    for product in products:
+        counts[product.get("category")] += 1
+    for slug, delta in counts.items():
+        if slug and delta:
+            await db.categories.update_one({"slug": slug}, {"$inc": {"product_count": delta}})
+
+    openings = [
+        StockAdjustment(
+            product_id=product["id"],
+            adjustment_type="set",
+            quantity=product.get("stock_quantity", 0),
+            stock_after=product.get("stock_quantity", 0),
+            reason="Création du produit",
+            notes="Importé depuis les fixtures",
+        ).model_dump()
+        for product in products
+        if product.get("track_inventory", True)
+    ]
+    if openings:
+        await db.stock_adjustments.insert_many(openings)
+
+
+# --- Mode api ---
+async def seed_collection_api(client, collection: str, docs: List[Dict[str, Any]], concurrency: int) -> Dict[str, int]:
+    endpoint = COLLECTIONS[collection]["endpoint"]
+    if endpoint is None:
+        print(f"⚠️  {collection}: aucune route API, utilisez --mode db")
+        return {"inserted": 0, "updated": 0, "failed": 0, "skipped": len(docs)}
+
+    # The API does not return slugs: derive them from the existing titles
+    response = await client.get(endpoint)
+    response.raise_for_status()
+    existing = {document_slug(collection, item): item["id"] for item in response.json()}
+
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {"inserted": 0, "updated": 0, "failed": 0}
+
+    async def push(doc: Dict[str, Any]):
+        payload = {k: v for k, v in doc.items() if k != "slug"}
+        async with semaphore:
+            if doc["slug"] in existing:
+                for field in COLLECTIONS[collection]["insert_only"]:
+                    payload.pop(field, None)
+                result = await client.put(f"{endpoint}/{existing[doc['slug']]}", json=payload)
+                key = "updated"
+            else:
+                result = await client.post(endpoint, json=payload)
+                key = "inserted"
+        if result.status_code == 200:
+            stats[key] += 1
+        else:
+            stats["failed"] += 1
+            print(f"❌ {collection}/{doc['slug']}: {result.status_code} {result.text[:200]}")
+
+    await asyncio.gather(*(push(doc) for doc in docs))
+    return stats
+
+
+async def api_login(client, email: str, password: str) -> str:
+    response = await client.post("/auth/login", json={"email": email, "password": password})
+    if response.status_code != 200:
+        raise SystemExit(f"❌ Échec de l'authentification: {response.text}")
+    return response.json()["access_token"]
+
+
+async def run(args) -> int:
+    fixtures = {name: load_fixtures(name, args.fixtures_dir) for name in args.collections}
+    for name, docs in fixtures.items():
+        print(f"📦 {name}: {len(docs)} document(s)")
+    if args.dry_run:
+        return 0
+
+    results: Dict[str, Dict[str, int]] = {}
+    if args.mode == "db":
+        from database import get_database
+
+        db = get_database("default", mongo_url=args.mongo_url)
+        results = dict(zip(
+            fixtures,
+            await asyncio.gather(*(seed_collection_db(db, name, docs) for name, docs in fixtures.items()))
+        ))
+    else:
+        import httpx
+
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.api_base, limits=limits, timeout=30) as client:
+            token = await api_login(client, args.admin_email, args.admin_password)
+            client.headers["Authorization"] = f"Bearer {token}"
+            for name, docs in fixtures.items():
+                results[name] = await seed_collection_api(client, name, docs, args.concurrency)
+
+    print("\n" + "=" * 60)
+    print("📊 RÉSUMÉ:")
+    failed = 0
+    for name, stats in results.items():
+        failed += stats.get("failed", 0)
+        print(f"   {name}: " + ", ".join(f"{k}={v}" for k, v in stats.items()))
+    return 1 if failed else 0
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Seed fixtures into MongoDB or through the API (idempotent, keyed on slug)")
+    parser.add_argument("collections", nargs="*", help=f"Parmi: {', '.join(COLLECTIONS)} (défaut: toutes)")
+    parser.add_argument("--mode", choices=["db", "api"], default="db")
+    parser.add_argument("--fixtures-dir", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--mongo-url", default=os.environ.get('MONGO_URL'))
+    parser.add_argument("--api-base", default=os.environ.get('SEED_API_BASE', 'http://localhost:8001/api'))
+    parser.add_argument("--admin-email", default=os.environ.get('SEED_ADMIN_EMAIL'))
+    parser.add_argument("--admin-password", default=os.environ.get('SEED_ADMIN_PASSWORD'))
+    parser.add_argument("--concurrency", type=int, default=8, help="Requêtes API simultanées (mode api)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+    args.collections = args.collections or list(COLLECTIONS)
+    unknown = [name for name in args.collections if name not in COLLECTIONS]
+    if unknown:
+        parser.error(f"collection(s) inconnue(s): {', '.join(unknown)}")
+    if args.mode == "api" and not args.dry_run and not (args.admin_email and args.admin_password):
+        parser.error("--mode api requiert --admin-email/--admin-password (ou SEED_ADMIN_EMAIL/SEED_ADMIN_PASSWORD)")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Shared setup for the unit tests
+
+The backend modules read their settings at import time, so the
+environment is set and an in-memory MongoDB (mongomock-motor) is
+registered for MONGO_URL before any of them is imported.
+"""
+import os
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.update(
+    MONGO_URL="mongodb://unit-tests",
+    DB_NAME="unit_tests",
+    JWT_SECRET_KEY="unit-tests-" + "x" * 32,
+    RATE_LIMIT_ENABLED="false",
+    SCHEDULER_ENABLED="false",
+    LOW_STOCK_WATCHER_ENABLED="false",
+)
+
+import database  # noqa: E402
+from mongomock.collection import Collection  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+database._clients[os.environ["MONGO_URL"]] = AsyncMongoMockClient()
+
+_find_and_modify = Collection._find_and_modify
+
+
+def _find_and_modify_without_id(self, query, projection=None, *args, **kwargs):
+    # mongomock finds the updated document again by _id, or by the original filter (which
+    # the update may no longer match) when the projection drops _id: keep it, strip it after
+    if not isinstance(projection, dict) or projection.get("_id", 1):
+        return _find_and_modify(self, query, projection, *args, **kwargs)
+    kept = {field: value for field, value in projection.items() if field != "_id"} or None
+    document = _find_and_modify(self, query, kept, *args, **kwargs)
+    if document is not None:
+        document.pop("_id", None)
+    return document
+
+
+Collection._find_and_modify = _find_and_modify_without_id
+
+
+@pytest.fixture
+def mongo():
+    """The database core.db points at, emptied after the test"""
+    from core import db
+    yield db
+    asyncio.run(database._clients[os.environ["MONGO_URL"]].drop_database(os.environ["DB_NAME"]))
@@ -0,0 +1,31 @@
+import asyncio
+from datetime import datetime, timezone, timedelta
+
+from auth_tokens import RevocationList, revoke_user_tokens, token_iat
+
+LIFETIME = timedelta(minutes=15)
+
+
+def test_token_from_the_cutoff_second_is_refused(mongo):
+    async def scenario():
+        revocations = RevocationList(mongo)
+        before = token_iat(datetime.now(timezone.utc))
+        await revoke_user_tokens(mongo, "u1", LIFETIME)
+        after = token_iat(datetime.now(timezone.utc))
+        await revocations.sync(force=True)
+        return (
+            await revocations.is_revoked({"uid": "u1", "iat": before, "jti": "a"}),
+            await revocations.is_revoked({"uid": "u1", "iat": after, "jti": "b"}),
+        )
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_whole_second_iat_of_the_cutoff_second_is_refused(mongo):
+    async def scenario():
+        revocations = RevocationList(mongo)
+        cutoff = await revoke_user_tokens(mongo, "u1", LIFETIME)
+        await revocations.sync(force=True)
+        return await revocations.is_revoked({"uid": "u1", "iat": int(cutoff.timestamp()), "jti": "a"})
+
+    assert asyncio.run(scenario())
@@ -0,0 +1,183 @@
+import asyncio
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from order_lifecycle import (
+    ORDER_TRANSITIONS, ORDER_STATUSES, RESTOCK_LEASE,
+    allowed_sources, transition_order, restore_order_stock, restock_cancelled_orders
+)
+
+
+def test_every_target_is_a_known_status():
+    for source, targets in ORDER_TRANSITIONS.items():
+        assert targets <= set(ORDER_STATUSES), source
+
+
+def test_final_statuses_have_no_way_out():
+    assert ORDER_TRANSITIONS["cancelled"] == set()
+    assert ORDER_TRANSITIONS["refunded"] == set()
+
+
+def test_cancellable_until_shipped():
+    assert allowed_sources("cancelled") == ["confirmed", "pending", "processing"]
+
+
+def test_refund_only_after_delivery():
+    assert allowed_sources("refunded") == ["delivered"]
+    assert allowed_sources("pending") == []
+
+
+async def _insert_order(db, status="pending", items=None):
+    order = {
+        "id": "order-1",
+        "order_number": "DTA-20260101-0001",
+        "status": status,
+        "payment_status": "pending",
+        "items": items or [],
+        "status_history": [{"status": status, "at": None, "by": None}],
+    }
+    await db.orders.insert_one(dict(order))
+    return order
+
+
+def test_transition_moves_the_order_and_records_history(mongo):
+    async def scenario():
+        await _insert_order(mongo)
+        order = await transition_order("order-1", "confirmed", performed_by="admin@example.com")
+        stored = await mongo.orders.find_one({"id": "order-1"})
+        return order, stored
+
+    order, stored = asyncio.run(scenario())
+    assert order["changed"] is True
+    assert order["status"] == "confirmed"
+    assert "_id" not in order
+    assert stored["status"] == "confirmed"
+    assert [entry["status"] for entry in stored["status_history"]] == ["pending", "confirmed"]
+    assert stored["status_history"][-1]["by"] == "admin@example.com"
+
+
+def test_repeating_a_transition_is_a_no_op(mongo):
+    async def scenario():
+        await _insert_order(mongo, status="confirmed")
+        order = await transition_order("order-1", "confirmed", extra_fields={"notes": "Appelé le client"})
+        stored = await mongo.orders.find_one({"id": "order-1"})
+        return order, stored
+
+    order, stored = asyncio.run(scenario())
+    assert order["changed"] is False
+    assert order["notes"] == "Appelé le client"
+    assert stored["notes"] == "Appelé le client"
+    assert len(stored["status_history"]) == 1
+
+
+def test_transition_not_allowed_is_a_conflict(mongo):
+    async def scenario():
+        await _insert_order(mongo, status="shipped")
+        await transition_order("order-1", "cancelled")
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 409
+    assert "shipped -> cancelled" in error.value.detail
+
+
+def test_leaving_a_final_status_is_a_conflict(mongo):
+    async def scenario():
+        await _insert_order(mongo, status="cancelled")
+        await transition_order("order-1", "pending")
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 409
+
+
+def test_unknown_status_and_unknown_order(mongo):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(transition_order("order-1", "lost"))
+    assert error.value.status_code == 400
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(transition_order("missing", "confirmed"))
+    assert error.value.status_code == 404
+
+
+def test_cancelling_restocks_what_checkout_took(mongo):
+    async def scenario():
+        await mongo.products.insert_one({"id": "p1", "stock_quantity": 0, "track_inventory": True, "low_stock_threshold": 5})
+        # Backorder: 5 ordered, only 2 were in stock
+        await _insert_order(mongo, items=[{"product_id": "p1", "quantity": 5, "stock_taken": 2}])
+        order = await transition_order("order-1", "cancelled")
+        again = await transition_order("order-1", "cancelled")
+        product = await mongo.products.find_one({"id": "p1"})
+        stored = await mongo.orders.find_one({"id": "order-1"})
+        return order, again, product, stored
+
+    order, again, product, stored = asyncio.run(scenario())
+    assert order["changed"] is True
+    assert again["changed"] is False
+    assert product["stock_quantity"] == 2
+    assert stored["stock_restore_pending"] is False
+    assert stored["stock_restored_at"] is not None
+
+
+def test_retried_restock_does_not_add_stock_twice(mongo):
+    async def scenario():
+        long_ago = datetime.now(timezone.utc) - 2 * RESTOCK_LEASE
+        # Crashed after p1's increment, before it was recorded on the order; p2 not reached
+        await mongo.products.insert_many([
+            {"id": "p1", "stock_quantity": 3, "track_inventory": True, "restocked_orders": ["order-1"]},
+            {"id": "p2", "stock_quantity": 0, "track_inventory": True},
+        ])
+        await _insert_order(mongo, status="cancelled", items=[
+            {"product_id": "p1", "quantity": 3, "stock_taken": 3},
+            {"product_id": "p2", "quantity": 1, "stock_taken": 1},
+        ])
+        await mongo.orders.update_one({"id": "order-1"}, {"$set": {
+            "stock_restore_pending": True, "restock_claimed_at": long_ago - timedelta(seconds=1), "updated_at": long_ago,
+        }})
+        restocked = await restock_cancelled_orders()
+        again = await restock_cancelled_orders()
+        products = {product["id"]: product async for product in mongo.products.find()}
+        ledger = await mongo.stock_adjustments.find({}, {"_id": 0, "product_id": 1, "quantity": 1}).to_list(None)
+        stored = await mongo.orders.find_one({"id": "order-1"})
+        return restocked, again, products, ledger, stored
+
+    restocked, again, products, ledger, stored = asyncio.run(scenario())
+    assert (restocked, again) == (1, 0)
+    assert products["p1"]["stock_quantity"] == 3
+    assert products["p2"]["stock_quantity"] == 1
+    assert sorted((entry["product_id"], entry["quantity"]) for entry in ledger) == [("p1", 3), ("p2", 1)]
+    assert stored["stock_restore_pending"] is False
+    assert sorted(stored["stock_restored_products"]) == ["p1", "p2"]
+
+
+def test_restock_that_lost_its_claim_leaves_the_order_pending(mongo):
+    async def scenario():
+        await mongo.products.insert_one({"id": "p9", "stock_quantity": 0, "track_inventory": True})
+        await mongo.orders.insert_one({
+            "id": "order-9", "order_number": "DTA-9", "status": "cancelled", "stock_restore_pending": True,
+            "items": [{"product_id": "p9", "quantity": 1, "stock_taken": 1}],
+        })
+        collection = type(mongo.orders)
+        real_update_one = collection.update_one
+
+        async def taken_over_before_final_write(self, query, update, *args, **kwargs):
+            if "restock_claimed_at" in query:
+                # The lease ran out and another worker claimed the order meanwhile
+                await real_update_one(self, {"id": "order-9"}, {"$set": {"restock_claimed_at": "other worker"}})
+            return await real_update_one(self, query, update, *args, **kwargs)
+
+        collection.update_one = taken_over_before_final_write
+        order = {"id": "order-9"}
+        try:
+            await restore_order_stock(order)
+        finally:
+            collection.update_one = real_update_one
+        return order, await mongo.orders.find_one({"id": "order-9"}), await mongo.products.find_one({"id": "p9"})
+
+    order, stored, product = asyncio.run(scenario())
+    assert product["stock_quantity"] == 1
+    assert stored["stock_restore_pending"] is True
+    assert "stock_restored_at" not in order
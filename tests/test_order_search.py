@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from order_search import encode_cursor, decode_cursor, build_order_filter, search_orders
+
+START = datetime(2026, 1, 1, 12, 0)
+
+
+def test_cursor_round_trip_with_a_date():
+    value = datetime(2026, 10, 19, 12, 30, 15, 250000)
+    assert decode_cursor(encode_cursor(value, "order-7")) == (value, "order-7")
+
+
+def test_cursor_round_trip_with_a_number():
+    assert decode_cursor(encode_cursor(149.9, "order-7")) == (149.9, "order-7")
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2026, 10, 19), "?&/+=")
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30", "eyJ2IjoxfQ"])
+def test_invalid_cursor_is_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+async def _insert_orders(db):
+    # Two orders share each created_at, so paging has to fall back on id
+    await db.orders.insert_many([
+        {
+            "id": f"order-{index:02d}",
+            "status": "pending" if index % 3 else "shipped",
+            "created_at": START + timedelta(hours=index // 2),
+            "total": float(index % 4),
+        }
+        for index in range(10)
+    ])
+
+
+async def _all_pages(query, sort, limit):
+    pages, cursor = [], None
+    while True:
+        page = await search_orders(query, sort=sort, limit=limit, cursor=cursor, count=False)
+        pages.append([order["id"] for order in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort", ["-created_at", "created_at", "-total", "total"])
+def test_keyset_pages_cover_every_order_once_in_order(mongo, sort):
+    async def scenario():
+        await _insert_orders(mongo)
+        expected = await mongo.orders.find({}).sort(
+            [(sort.lstrip("-"), -1 if sort.startswith("-") else 1), ("id", -1 if sort.startswith("-") else 1)]
+        ).to_list(None)
+        return [order["id"] for order in expected], await _all_pages({}, sort, 3)
+
+    expected, pages = asyncio.run(scenario())
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    assert [order_id for page in pages for order_id in page] == expected
+
+
+def test_keyset_paging_keeps_the_filter(mongo):
+    async def scenario():
+        await _insert_orders(mongo)
+        return await _all_pages(build_order_filter(status="shipped"), "-created_at", 2)
+
+    pages = asyncio.run(scenario())
+    assert pages == [["order-09", "order-06"], ["order-03", "order-00"]]
+
+
+def test_last_page_has_no_cursor_and_counts(mongo):
+    async def scenario():
+        await _insert_orders(mongo)
+        return await search_orders(build_order_filter(status="pending"), limit=50)
+
+    page = asyncio.run(scenario())
+    assert page["next_cursor"] is None
+    assert len(page["items"]) == 6
+    assert page["total"] == 6 and page["total_exact"] is True
+
+
+def test_unknown_sort_field(mongo):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(search_orders({}, sort="customer_email"))
+    assert error.value.status_code == 400
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from scheduler import CronSchedule
+
+# A Monday
+MONDAY_NOON = datetime(2026, 10, 19, 12, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("* * * * *", datetime(2026, 10, 19, 12, 31, tzinfo=timezone.utc)),
+    ("5 0 * * *", datetime(2026, 10, 20, 0, 5, tzinfo=timezone.utc)),
+    ("*/15 * * * *", datetime(2026, 10, 19, 12, 45, tzinfo=timezone.utc)),
+    ("0 9 * * 1-5", datetime(2026, 10, 20, 9, 0, tzinfo=timezone.utc)),
+    ("0 0 1 * *", datetime(2026, 11, 1, 0, 0, tzinfo=timezone.utc)),
+    ("30 3 * * 0", datetime(2026, 10, 25, 3, 30, tzinfo=timezone.utc)),
+    ("30 3 * * 7", datetime(2026, 10, 25, 3, 30, tzinfo=timezone.utc)),
+    ("0 0,12 * * *", datetime(2026, 10, 20, 0, 0, tzinfo=timezone.utc)),
+    ("0 0 29 2 *", datetime(2028, 2, 29, 0, 0, tzinfo=timezone.utc)),
+])
+def test_next_after(expression, expected):
+    assert CronSchedule(expression).next_after(MONDAY_NOON) == expected
+
+
+def test_next_after_is_strictly_later():
+    schedule = CronSchedule("30 12 * * *")
+    assert schedule.next_after(MONDAY_NOON) == MONDAY_NOON + timedelta(days=1)
+    # Seconds are dropped: 12:30:59 still counts as 12:30
+    assert schedule.next_after(MONDAY_NOON.replace(second=59)) == MONDAY_NOON + timedelta(days=1)
+
+
+def test_either_day_field_matches_when_both_are_restricted():
+    # The 13th or any Friday, whichever comes first
+    assert CronSchedule("0 12 13 * 5").next_after(MONDAY_NOON) == datetime(2026, 10, 23, 12, 0, tzinfo=timezone.utc)
+
+
+def test_naive_datetimes_are_utc():
+    naive = MONDAY_NOON.replace(tzinfo=None)
+    assert CronSchedule("*/15 * * * *").next_after(naive) == datetime(2026, 10, 19, 12, 45, tzinfo=timezone.utc)
+
+
+def test_year_rollover():
+    new_year_eve = datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc)
+    assert CronSchedule("0 0 * * *").next_after(new_year_eve) == datetime(2027, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* 24 * * *", "5-1 * * * *", "*/0 * * * *", "a * * * *"])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_expression_that_never_matches():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 31 2 *").next_after(MONDAY_NOON)
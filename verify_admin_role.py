@@ -2,21 +2,24 @@
 """
 Vérifier le rôle admin et le corriger si nécessaire
 """
-from motor.motor_asyncio import AsyncIOMotorClient
 import asyncio
 import os
+import sys
 from dotenv import load_dotenv
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+
+from database import get_client  # noqa: E402
 
 async def verify_and_fix_admin():
     try:
         mongo_url = os.environ['MONGO_URL']
         db_name = os.environ['DB_NAME']
         
-        client = AsyncIOMotorClient(mongo_url)
+        client = get_client(mongo_url)
         db = client[db_name]
         
         print('🔍 Vérification des comptes admin...\n')